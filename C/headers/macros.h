@@ -11,5 +11,11 @@
 #define FILEFORMAT "DIMENSION\n%d\nWORDS\n" //Format used at the start of the output file
 #define INITSIZE 10 //Initial size of the dynamic array
 #define RESIZEFACTOR 2 //Resize factor for each realloc
+#define WIREEXT ".wsw" //Files with this extension are saved in the binary wire format
+#define WIREMAGIC "WSWF" //First bytes of a wire file
+#define WIREENDMAGIC "WSWE" //Last bytes of a wire file
+#define WIREVERSION 1 //Version of the wire format
+#define WIREFLAGGRID 1 //Record flag: the record ends with the grid
+#define WIRENOPOS 0xFFFF //x and y of a word without position
 
 #endif
\ No newline at end of file
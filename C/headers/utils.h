@@ -20,4 +20,7 @@ int IsAlphabetic(char* str);
 /* Returns 1 if str contains only digits (0-9). Returns 0 otherwise */
 int IsNumeric(char* str);
 
+/* Returns 1 if str ends with suffix. Returns 0 otherwise */
+int EndsWith(char* str, char* suffix);
+
 #endif
\ No newline at end of file
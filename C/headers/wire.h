@@ -0,0 +1,70 @@
+#ifndef WIRE_H
+#define WIRE_H
+
+#include "includes.h"
+#include "macros.h"
+#include "data.h"
+#include "utils.h"
+
+/*
+  Binary wire format, the same one the Python generator reads and writes (Python/src/wire.py).
+  All integers are little endian:
+
+  file: WIREMAGIC, u16 version, u16 reserved | records | u64 offset of each record | u64 offset of that table, u32 records, WIREENDMAGIC
+  record: u32 size (bytes after this field), u16 dimension, u8 flags, u8 reserved, u32 words, and then for each word:
+  u8 direction, u8 placed, u16 length, u16 x, u16 y, length chars.
+  If flags has WIREFLAGGRID, the record ends with the dimension*dimension chars of the grid (0 for an empty cell).
+
+  The table at the end allows random access to any record without reading the ones before it.
+*/
+
+/*
+  Writes records to a wire file, keeping the offset of each one for the table written when it's closed.
+  The offsets are stored in a dynamic array with geometric expansion, like the words in Data.
+*/
+typedef struct WireWriter
+{
+  FILE* fd; //File opened for binary writing
+  unsigned long long* offsets; //Offset of each record written
+  unsigned int count; //Records written
+  unsigned int allocated; //Offsets allocated
+  unsigned long long offset; //Offset of the next record
+} WireWriter;
+
+//Struct creation, writes the file header. Returns NULL if writing fails.
+WireWriter* wireWriterCreate(FILE* fd);
+
+/*
+  Appends a record with the dimension and the words of a Data struct (without positions nor grid).
+  Returns 0 if writing is successful, 1 otherwise.
+*/
+int wireWriteData(WireWriter* w, Data* d);
+
+/*
+  Writes the records table and the footer and destroys the struct (doesn't close the file).
+  Returns 0 if writing is successful, 1 otherwise.
+*/
+int wireWriterClose(WireWriter* w);
+
+/*
+  Read-only view of a wire file already in memory (e.g. read or memory mapped by the caller), nothing is copied.
+*/
+typedef struct WireFile
+{
+  const unsigned char* buf; //Content of the whole file
+  size_t size; //Size of buf
+  unsigned int count; //Number of records
+  unsigned long long tableOffset; //Offset of the records table
+} WireFile;
+
+//Checks the header and footer of buf. Returns 0 if it's a valid wire file, 1 otherwise.
+int wireOpen(WireFile* wf, const unsigned char* buf, size_t size);
+
+/*
+  Sets the dimension and appends the words of the i-th record to a Data struct (positions and grid are ignored).
+  Returns 0 if successful, 1 if the record doesn't exist or can't be stored in Data
+  (direction out of DIRMIN..DIRMAX, word longer than WORDLEN or not alphabetic).
+*/
+int wireRecordToData(WireFile* wf, unsigned int i, Data* d);
+
+#endif
@@ -3,6 +3,7 @@
 #include "../headers/data.h"
 #include "../headers/macros.h"
 #include "../headers/input_parsing.h"
+#include "../headers/wire.h"
 
 /*
   Asks the user to enter all the necessary information for the word search.
@@ -50,6 +51,21 @@ void InputData(Data* dat)
 }
 
 /*
+  Writes the data to fd in the binary wire format (see wire.h), as a file with a single record.
+  Returns 0 if writing is successful, 1 otherwise.
+*/
+int DataToWire(Data* dat, FILE* fd)
+{
+  WireWriter* w = wireWriterCreate(fd);
+  if (w == NULL) return 1;
+
+  int writeVal = wireWriteData(w, dat);
+  int closeVal = wireWriterClose(w);
+  return (writeVal || closeVal);
+}
+
+/*
+  If the file name ends with WIREEXT, the data is saved in the binary wire format, otherwise as text.
   Returns 0 if writing is successful
   Returns 1 if there's a problem closing the file
   Returns 2 if the data entered by the user doesn't contain any words
@@ -62,26 +78,32 @@ int DataToFile(Data* dat)
   printf("Enter file directory to save: ");
   scanf("%49s", strFile); //we should use a safer input
 
-  FILE* fd = fopen(strFile, "w");
+  FILE* fd = fopen(strFile, "wb");
   while (fd == NULL)
   {
     printf("Couldn't open file. Retry: ");
     scanf("%49s", strFile);
-    fd = fopen(strFile, "w");
+    fd = fopen(strFile, "wb");
   }
 
   int ret;
-  
-  char strFormat[50];
-  snprintf(strFormat, 50, FILEFORMAT, dataGetDim(dat));
+  int writeVal = 0;
 
-  //we should check if writing is successful also
-  fputs(strFormat, fd);
-  fputs(dataGetWords(dat), fd);
+  if (EndsWith(strFile, WIREEXT))
+    writeVal = DataToWire(dat, fd);
+  else
+  {
+    char strFormat[50];
+    snprintf(strFormat, 50, FILEFORMAT, dataGetDim(dat));
+
+    //we should check if writing is successful also
+    fputs(strFormat, fd);
+    fputs(dataGetWords(dat), fd);
+  }
 
   int closeVal = fclose(fd);
 
-  if (closeVal == EOF) ret = 1;
+  if (closeVal == EOF || writeVal) ret = 1;
   else ret = 0;
   
   return ret;
@@ -49,4 +49,10 @@ int IsNumeric(char* str)
   }
 
   return flag;
+}
+
+int EndsWith(char* str, char* suffix)
+{
+  size_t len = strlen(str), suffixLen = strlen(suffix);
+  return (len >= suffixLen && strcmp(str + len - suffixLen, suffix) == 0);
 }
\ No newline at end of file
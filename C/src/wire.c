@@ -0,0 +1,164 @@
+#include "../headers/wire.h"
+
+#define FILEHEADERSIZE 8 //magic, version, reserved
+#define RECORDHEADERSIZE 12 //size, dimension, flags, reserved, words
+#define WORDHEADERSIZE 8 //direction, placed, length, x, y
+#define FOOTERSIZE 16 //table offset, records, end magic
+
+//Little endian encoding and decoding, so the file is the same on any machine
+static void PutU16(unsigned char* p, unsigned int v) { p[0] = v & 0xFF; p[1] = (v >> 8) & 0xFF; }
+
+static void PutU32(unsigned char* p, unsigned long v) { PutU16(p, v & 0xFFFF); PutU16(p+2, (v >> 16) & 0xFFFF); }
+
+static void PutU64(unsigned char* p, unsigned long long v) { PutU32(p, v & 0xFFFFFFFF); PutU32(p+4, (v >> 32) & 0xFFFFFFFF); }
+
+static unsigned int GetU16(const unsigned char* p) { return p[0] | (p[1] << 8); }
+
+static unsigned long GetU32(const unsigned char* p) { return GetU16(p) | ((unsigned long)GetU16(p+2) << 16); }
+
+static unsigned long long GetU64(const unsigned char* p) { return GetU32(p) | ((unsigned long long)GetU32(p+4) << 32); }
+
+WireWriter* wireWriterCreate(FILE* fd)
+{
+  unsigned char header[FILEHEADERSIZE];
+  memcpy(header, WIREMAGIC, 4);
+  PutU16(header+4, WIREVERSION);
+  PutU16(header+6, 0);
+  if (fwrite(header, 1, FILEHEADERSIZE, fd) != FILEHEADERSIZE) return NULL;
+
+  WireWriter* w = malloc(sizeof(WireWriter));
+  w->fd = fd;
+  w->allocated = INITSIZE;
+  w->offsets = malloc(sizeof(unsigned long long) * w->allocated);
+  w->count = 0;
+  w->offset = FILEHEADERSIZE;
+
+  return w;
+}
+
+int wireWriteData(WireWriter* w, Data* d)
+{
+  /*
+    Data stores the words as "word1 n1\nword2 n2\n...", so each line is a word record: the word is before the ' '
+    and the direction (a single digit) after it. The record size is known before writing: header + each word header and chars.
+  */
+  char* words = dataGetWords(d);
+  unsigned int wordCount = 0;
+  unsigned long size = RECORDHEADERSIZE - 4;
+  for (char* line = words; *line; line = strchr(line, '\n') + 1)
+  {
+    size += WORDHEADERSIZE + (strchr(line, ' ') - line);
+    wordCount++;
+  }
+
+  unsigned char header[RECORDHEADERSIZE];
+  PutU32(header, size);
+  PutU16(header+4, dataGetDim(d));
+  header[6] = 0; //no grid
+  header[7] = 0;
+  PutU32(header+8, wordCount);
+  if (fwrite(header, 1, RECORDHEADERSIZE, w->fd) != RECORDHEADERSIZE) return 1;
+
+  for (char* line = words; *line; line = strchr(line, '\n') + 1)
+  {
+    char* space = strchr(line, ' ');
+    unsigned int length = space - line;
+
+    unsigned char wordHeader[WORDHEADERSIZE];
+    wordHeader[0] = atoi(space+1);
+    wordHeader[1] = 0; //not placed
+    PutU16(wordHeader+2, length);
+    PutU16(wordHeader+4, WIRENOPOS);
+    PutU16(wordHeader+6, WIRENOPOS);
+    if (fwrite(wordHeader, 1, WORDHEADERSIZE, w->fd) != WORDHEADERSIZE) return 1;
+    if (fwrite(line, 1, length, w->fd) != length) return 1;
+  }
+
+  //we expand the offsets array the same way as the words in Data
+  if (w->count == w->allocated)
+  {
+    w->allocated *= RESIZEFACTOR;
+    w->offsets = realloc(w->offsets, sizeof(unsigned long long) * w->allocated);
+  }
+  w->offsets[w->count++] = w->offset;
+  w->offset += 4 + size;
+
+  return 0;
+}
+
+int wireWriterClose(WireWriter* w)
+{
+  int ret = 0;
+
+  unsigned char entry[8];
+  for (unsigned int i = 0; i < w->count && !ret; i++)
+  {
+    PutU64(entry, w->offsets[i]);
+    ret = (fwrite(entry, 1, 8, w->fd) != 8);
+  }
+
+  unsigned char footer[FOOTERSIZE];
+  PutU64(footer, w->offset);
+  PutU32(footer+8, w->count);
+  memcpy(footer+12, WIREENDMAGIC, 4);
+  if (!ret) ret = (fwrite(footer, 1, FOOTERSIZE, w->fd) != FOOTERSIZE);
+
+  free(w->offsets);
+  free(w);
+  return ret;
+}
+
+int wireOpen(WireFile* wf, const unsigned char* buf, size_t size)
+{
+  if (size < FILEHEADERSIZE + FOOTERSIZE) return 1;
+
+  const unsigned char* footer = buf + size - FOOTERSIZE;
+  if (memcmp(buf, WIREMAGIC, 4) != 0 || GetU16(buf+4) != WIREVERSION || memcmp(footer+12, WIREENDMAGIC, 4) != 0) return 1;
+
+  wf->buf = buf;
+  wf->size = size;
+  wf->tableOffset = GetU64(footer);
+  wf->count = GetU32(footer+8);
+
+  //the table must end right where the footer starts
+  if (wf->tableOffset + (unsigned long long)wf->count * 8 != size - FOOTERSIZE) return 1;
+  return 0;
+}
+
+int wireRecordToData(WireFile* wf, unsigned int i, Data* d)
+{
+  if (i >= wf->count) return 1;
+
+  unsigned long long offset = GetU64(wf->buf + wf->tableOffset + (unsigned long long)i * 8);
+  if (offset + RECORDHEADERSIZE > wf->tableOffset) return 1;
+
+  const unsigned char* record = wf->buf + offset;
+  const unsigned char* end = record + 4 + GetU32(record);
+  if (end > wf->buf + wf->tableOffset) return 1;
+
+  unsigned long wordCount = GetU32(record+8);
+  const unsigned char* p = record + RECORDHEADERSIZE;
+  dataSetDim(d, GetU16(record+4));
+
+  for (unsigned long k = 0; k < wordCount; k++)
+  {
+    if (p + WORDHEADERSIZE > end) return 1;
+    unsigned int dir = p[0];
+    unsigned int length = GetU16(p+2);
+    p += WORDHEADERSIZE;
+    if (p + length > end || dir > DIRMAX || length == 0 || length > WORDLEN) return 1;
+
+    //same strings that InputData would give to dataAppendWord
+    char word[WORDLEN+1];
+    memcpy(word, p, length);
+    word[length] = '\0';
+    if (!IsAlphabetic(word)) return 1;
+
+    char dirStr[DIRLEN+1];
+    snprintf(dirStr, DIRLEN+1, "%u", dir);
+    dataAppendWord(d, word, dirStr);
+    p += length;
+  }
+
+  return 0;
+}
@@ -0,0 +1,5 @@
+from sys import exit
+from Python.src.bench import Main
+
+if __name__ == "__main__":
+    exit(Main())
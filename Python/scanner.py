@@ -0,0 +1,5 @@
+from sys import exit
+from Python.src.scanner import Main
+
+if __name__ == "__main__":
+    exit(Main())
@@ -1,8 +1,23 @@
 from random import shuffle, choice #random functionality to insert words or pick letters
 from copy import deepcopy #deepcopy list to allow backtracking without overwriting
-from typing import IO #type hinting
+from collections.abc import Sequence
+from typing import IO, Callable #type hinting
+from time import perf_counter #only read when SolverStats.timing is True
 from Python.src.constants import ALPHABET #letters to fill the whitespaces of the word search
-from Python.src.data import WsData, Word, Direction, DIR, ws
+from Python.src.data import WsData, Word, Direction, SolveStatus, ws
+from Python.src.grid import Grid #compact grid, to fill and render big word searches
+from Python.src.budget import SearchBudget #limits (time and nodes) for the algorithm
+from Python.src.stats import SolverStats #optional counters and trace hook of the search
+from Python.src.nogood import NogoodCache, WsInsertWordsNogood #failed states already seen by the undo search
+from Python.src.placements import GetPlacementTable, MaxWordLength #cached start positions per (dimension, length, direction)
+from Python.src.lexicon import LexiconIndex, LettersMask32 #compiled lexicon, picks replacements that fit
+from Python.src.trie import Trie #lexicon that doesn't need to be sorted
+from Python.src.parser import ParseWordLine
+from Python.src.solvers import WsInsertWordsMCV, WsInsertWordsBitset #alternative engines to insert the words
+from Python.src.dlx import WsInsertWordsDLX
+from Python.src.restarts import WsInsertWordsRestarts
+from Python.src.portfolio import WsInsertWordsPortfolio
+from Python.src.analysis import AnalyzeWsData #pre-solve checks to reject impossible inputs before the algorithm
 from Python.src.utils import (WrongWSDataFormat, FileException, OpenFile, CloseFile,
                    FileJumpToLine, BinarySearch, SaveFile)
 
@@ -31,24 +46,14 @@ def WordsPositions(wsData: WsData) -> None:
     
     dim = wsData.dimension
     for word in wsData.words:
-        posibilitiesCounter = 0
-        
-        wDir: DIR = word.dir.value
-        wLen = len(word.string)-1
-
-        #we loop through each index in dim*dim and see if it's possible to start writing the word in there
-        for x in range(dim):
-            for y in range(dim):
-                #we verify that the last char's position is inside the boundaries (>= 0 and < dim) in x and y coordinates
-                if (x + (wDir.x * wLen) < dim and x + (wDir.x * wLen) >= 0 and
-                y + (wDir.y * wLen) < dim and y + (wDir.y * wLen) >= 0):
-                    word.positions.append((x, y))
-                    posibilitiesCounter += 1
+        #the legal start positions only depend on (dimension, length, direction), so words sharing them share a cached table
+        table = GetPlacementTable(dim, len(word.string), word.dir)
+        word.positions.extend(table.starts) #each word gets its own copy, which is then shuffled
 
         #we shuffle all the positions of the current word, so the indexes are easier to calculate after
         shuffle(word.positions)
         #positionsIndex = (0, j) because 0 is the first index to try in the algorithm
-        word.positionsIndex = (0, posibilitiesCounter-1)
+        word.positionsIndex = (0, len(word.positions)-1)
 
 def InsertWord(wordStr: str, wordDir: Direction, position: tuple[int, int], ws: ws) -> tuple[bool, ws]:
     """Tries to insert a word in the desired direction and position in the word search.
@@ -57,6 +62,13 @@ def InsertWord(wordStr: str, wordDir: Direction, position: tuple[int, int], ws:
     the resultant word search."""
     
     newWs = deepcopy(ws) #deepcopy so each insertion doesn't modify the previous ws, in case of backtrack
+    return (WriteWord(wordStr, wordDir, position, newWs), newWs)
+
+def WriteWord(wordStr: str, wordDir: Direction, position: tuple[int, int], ws: ws) -> bool:
+    """Writes a word in the desired direction and position in the word search, as long as it fits.
+
+    Modifies the ws (it may be left with part of the word written if it doesn't fit, see InsertWord).
+    Returns True if the word was correctly written."""
 
     i = 0
     flag = False #becomes True if word couldn't be inserted
@@ -69,20 +81,22 @@ def InsertWord(wordStr: str, wordDir: Direction, position: tuple[int, int], ws:
         y = startY + i * incrementY
 
         #we write the char (if necessary) and go on to the next one
-        if (newWs[x][y] == "" or newWs[x][y] == wordStr[i]):
-            if (newWs[x][y] == ""):
-                newWs[x][y] = wordStr[i]
+        if (ws[x][y] == "" or ws[x][y] == wordStr[i]):
+            if (ws[x][y] == ""):
+                ws[x][y] = wordStr[i]
             i += 1
         else:
             flag = True
 
-    return (not flag, newWs) #return (True, newWs) if word was correctly inserted
+    return not flag #return True if word was correctly written
 
-def WsInsertWords(wsData: WsData) -> None:
+def WsInsertWords(wsData: WsData, stats: SolverStats=None) -> None:
     """Tries to insert all words into an empty word search. Uses the vars 'words' and 'wsDP' from a WsData object.
     
     Modifies the wsDP var in WsData struct. The last element of wsDP will be the ws with all words inserted (if possible),
     otherwise it will be None. Doesn't return anything.
+
+    If stats is given (see SolverStats) it counts every attempt and backtrack, and the time copying and checking if stats.timing.
     """
     #this is a backtracking with dynamic programming (dp) algorithm
     #it tries to insert each of the words (WsData.words) in order (this is pre-shuffled) and uses
@@ -90,6 +104,9 @@ def WsInsertWords(wsData: WsData) -> None:
     #when a new word can't be inserted, it goes back to a previous word and changes it's position (using Word.positions) to try again 
     #the algorithm ends if all words are inserted, or all possibilities are exhausted
 
+    if stats is not None:
+        stats.Start(len(wsData.words))
+
     i = 0
     solution = False
     final = False
@@ -101,6 +118,8 @@ def WsInsertWords(wsData: WsData) -> None:
         #in this case, we have no more possibilities in the current word, so we go back (if possible) to try other combinations
         if (currentPosIdx > posAvailable):
             if (i > 0):
+                if stats is not None:
+                    stats.Backtrack(i, wordI)
                 wordI.positionsIndex = (0, posAvailable) #we will try again with the first position of the current word in the future
                 i -= 1 #go back to previous word
             else:
@@ -110,7 +129,11 @@ def WsInsertWords(wsData: WsData) -> None:
 
         #otherwise, we try to insert our i-th word in the position Word.positions[currentPosIdx], in the i-th ws in WsData.wsDP
         #this doesn't modify the i-th wsDP ws, it returns a new one with a bool flag
-        insertedFlag, newWS = InsertWord(wordI.string, wordI.dir, wordI.positions[currentPosIdx], wsData.wsDP[i])
+        if stats is None:
+            insertedFlag, newWS = InsertWord(wordI.string, wordI.dir, wordI.positions[currentPosIdx], wsData.wsDP[i])
+        else:
+            insertedFlag, newWS = InsertWordStats(wordI.string, wordI.dir, wordI.positions[currentPosIdx], wsData.wsDP[i], stats)
+            stats.Tried(i, wordI, insertedFlag)
 
         if insertedFlag:
             wsData.wsDP[i+1] = newWS #we save the ws with the i-th word inserted in the (i+1)-th ws
@@ -124,6 +147,244 @@ def WsInsertWords(wsData: WsData) -> None:
             #if word couldn't be inserted, we try with the next position in the current word
             wordI.positionsIndex = (currentPosIdx+1, posAvailable)
 
+    wsData.solution = wsData.wsDP[-1]
+    wsData.status = SolveStatus.SOLVED if solution else SolveStatus.NO_SOLUTION
+    if solution:
+        SetWordsPositions(wsData)
+    if stats is not None:
+        stats.Finish(wsData)
+
+def InsertWordStats(wordStr: str, wordDir: Direction, position: tuple[int, int], ws: ws, stats: SolverStats) -> tuple[bool, ws]:
+    """Same as InsertWord, adding the time of the copy and of the check to stats if stats.timing."""
+
+    if not stats.timing:
+        return InsertWord(wordStr, wordDir, position, ws)
+
+    start = perf_counter()
+    newWs = deepcopy(ws)
+    copied = perf_counter()
+    insertedFlag = WriteWord(wordStr, wordDir, position, newWs)
+    stats.copySeconds += copied - start
+    stats.checkSeconds += perf_counter() - copied
+    return (insertedFlag, newWs)
+
+def PlaceWord(wordStr: str, wordDir: Direction, position: tuple[int, int], ws: ws) -> list[tuple[int, int]]:
+    """Tries to insert a word in the desired direction and position in the word search, writing directly into it.
+
+    Returns the list of (row, column) cells written by this insertion (the undo log), so they can be cleared again
+    with RemoveWord. If the word can't be inserted, the ws is left unchanged and returns None."""
+
+    written = []
+    #because of the way we store our ws, x and y coordinates are inverted (same as in InsertWord)
+    startY, startX = position
+    incrementY, incrementX = wordDir.value
+    for i, c in enumerate(wordStr):
+        x = startX + i * incrementX
+        y = startY + i * incrementY
+
+        cell = ws[x][y]
+        if not cell:
+            ws[x][y] = c
+            written.append((x, y)) #only the cells we write are logged, shared cells belong to a previous word
+        elif cell != c:
+            RemoveWord(written, ws) #conflict, so we undo the chars already written by this word
+            return None
+
+    return written
+
+def RemoveWord(written: list[tuple[int, int]], ws: ws) -> None:
+    """Clears the cells of an undo log (returned by PlaceWord) in the word search.
+
+    Modifies the original ws and doesn't return anything."""
+
+    for x, y in written:
+        ws[x][y] = ""
+
+def SetWordsPositions(wsData: WsData) -> None:
+    """Sets Word.position of each word to the position chosen by the backtracking algorithm.
+
+    The chosen one is the last position tried (positionsIndex is always advanced after a successful insertion)."""
+
+    for word in wsData.words:
+        word.position = word.positions[word.positionsIndex[0]-1]
+
+def WsInsertWordsUndo(wsData: WsData, budget: SearchBudget=None, stats: SolverStats=None, nogoods: NogoodCache=None,
+                      initial: ws=None) -> None:
+    """Tries to insert all words into an empty word search, same as WsInsertWords but without the wsDP struct.
+
+    Uses a single ws which is modified in place, and an undo log per word to erase it when backtracking.
+    Follows the exact same order of positions as WsInsertWords, so both return the same result for a given seed.
+
+    If a budget is given (see SearchBudget) the algorithm stops when it runs out, each insertion attempt being a node. In that case
+    WsData.partial is the ws with the deepest partial insertion found, and only the words inserted in it have Word.position set.
+    If stats is given (see SolverStats) it counts every attempt and backtrack, same as WsInsertWords.
+    If nogoods is given (see NogoodCache) every state from which the remaining words couldn't be inserted is saved in it, and a word
+    isn't left in a position that leads to a saved state, skipping that subtree.
+    If initial is given the words are inserted into a copy of it instead of an empty ws, e.g. with the chars of other words that
+    can't move (see EditAddWord). Its chars are kept in the solution and never erased when backtracking.
+
+    Modifies WsData.solution (None if there's no solution), WsData.status, WsData.partial and Word.position of each word.
+    Doesn't return anything."""
+    #instead of saving a full copy of the ws for each word, we only save the cells each word wrote (undoLog[i])
+    #so backtracking to the previous word costs as much as the length of that word, and there's no allocation per attempt
+
+    dim = wsData.dimension
+    wordsNum = len(wsData.words)
+    ws = [[""] * dim for i in range(dim)] if initial is None else [line[:] for line in initial]
+    undoLog: list[list[tuple[int, int]]] = [None] * wordsNum
+
+    #deepest partial insertion, only saved when there's a budget (a copy each time we go deeper than ever before)
+    bestDepth = 0
+    bestWS = None
+    bestPositions: list[tuple[int, int]] = []
+    timing = stats is not None and stats.timing
+    if stats is not None:
+        stats.Start(wordsNum)
+    if nogoods is not None:
+        nogoods.Start(wsData)
+
+    i = 0
+    solution = False
+    final = False
+    while (not final and not solution):
+        wordI = wsData.words[i]
+        currentPosIdx, posAvailable = wordI.positionsIndex
+        if (currentPosIdx > posAvailable):
+            if (i > 0):
+                if stats is not None:
+                    stats.Backtrack(i, wordI)
+                if nogoods is not None:
+                    nogoods.Add(i) #no word from i on could be inserted with the current ws
+                wordI.positionsIndex = (0, posAvailable)
+                i -= 1
+                #the previous word will try its next position, so we erase it from the ws first
+                if nogoods is not None:
+                    nogoods.Erase(undoLog[i], ws)
+                if timing:
+                    start = perf_counter()
+                    RemoveWord(undoLog[i], ws)
+                    stats.checkSeconds += perf_counter() - start
+                else:
+                    RemoveWord(undoLog[i], ws)
+                undoLog[i] = None
+            else:
+                final = True
+
+            continue
+
+        if budget is not None and budget.Spend():
+            break
+
+        if stats is None:
+            written = PlaceWord(wordI.string, wordI.dir, wordI.positions[currentPosIdx], ws)
+        else:
+            if timing:
+                start = perf_counter()
+                written = PlaceWord(wordI.string, wordI.dir, wordI.positions[currentPosIdx], ws)
+                stats.checkSeconds += perf_counter() - start
+            else:
+                written = PlaceWord(wordI.string, wordI.dir, wordI.positions[currentPosIdx], ws)
+            stats.Tried(i, wordI, written is not None)
+        wordI.positionsIndex = (currentPosIdx+1, posAvailable)
+
+        if written is not None:
+            if nogoods is not None:
+                nogoods.Write(written, ws)
+                if i < wordsNum-1 and nogoods.Failed(i+1):
+                    #the next words already failed from this same state, so this position is discarded
+                    nogoods.Erase(written, ws)
+                    RemoveWord(written, ws)
+                    continue
+            undoLog[i] = written
+            if (i >= wordsNum-1):
+                solution = True
+            else:
+                i += 1
+                if budget is not None and i > bestDepth:
+                    start = perf_counter() if timing else None
+                    bestDepth = i
+                    bestWS = [line[:] for line in ws]
+                    bestPositions = [word.positions[word.positionsIndex[0]-1] for word in wsData.words[:i]]
+                    if timing:
+                        stats.copySeconds += perf_counter() - start
+
+    wsData.partial = None
+    if solution:
+        wsData.solution = ws
+        wsData.status = SolveStatus.SOLVED
+        SetWordsPositions(wsData)
+    elif final:
+        wsData.solution = None
+        wsData.status = SolveStatus.NO_SOLUTION
+        for word in wsData.words:
+            word.position = None
+    else:
+        wsData.solution = None
+        wsData.status = SolveStatus.BUDGET_EXCEEDED
+        if bestWS is None:
+            bestWS = [[""] * dim for i in range(dim)] if initial is None else [line[:] for line in initial]
+        wsData.partial = bestWS
+        for k, word in enumerate(wsData.words):
+            word.position = bestPositions[k] if k < bestDepth else None
+    if stats is not None:
+        stats.Finish(wsData)
+
+def WsInsertWordsDP(wsData: WsData, stats: SolverStats=None) -> None:
+    """Runs the original backtracking algorithm (WsInsertWords), creating the wsDP struct first.
+
+    Modifies WsData.wsDP, WsData.solution and Word.position of each word. Doesn't return anything."""
+
+    InitializeWSList(wsData)
+    WsInsertWords(wsData, stats)
+
+ENGINES: dict[str, Callable[..., None]] = {
+    "dp": WsInsertWordsDP,
+    "undo": WsInsertWordsUndo,
+    "nogood": WsInsertWordsNogood,
+    "mcv": WsInsertWordsMCV,
+    "bitset": WsInsertWordsBitset,
+    "dlx": WsInsertWordsDLX,
+    "restarts": WsInsertWordsRestarts,
+    "portfolio": WsInsertWordsPortfolio,
+}
+"""Available algorithms to insert the words, by name. All of them take a WsData with the positions already generated (WordsPositions)
+and set WsData.solution, WsData.status and Word.position.
+
+- dp: original backtracking, saving a copy of the ws per word (wsDP).
+- undo: same search order as dp, using a single ws and an undo log per word.
+- nogood: undo skipping the states from which the remaining words already failed (same solution, fewer nodes).
+- mcv: most constrained words first, with forward checking of the remaining words.
+- bitset: same search order as undo, checking each position with bitsets of cells.
+- dlx: exact cover with colors (words placed exactly once, cells shared only by equal chars) solved with dancing links.
+- restarts: runs of undo with growing node budgets (Luby sequence), shuffling the positions and words order again in each run.
+- portfolio: many engines and seeds in parallel processes (one per CPU), the first one to finish wins."""
+
+BUDGET_ENGINES: tuple[str, ...] = ("undo", "nogood", "restarts")
+"""Engines that accept a SearchBudget."""
+
+STATS_ENGINES: tuple[str, ...] = ("dp", "undo", "nogood", "mcv", "bitset", "dlx")
+"""Engines that accept a SolverStats."""
+
+def SolveWS(wsData: WsData, engine: str="undo", budget: SearchBudget=None, stats: SolverStats=None) -> None:
+    """Tries to insert all the words with the given engine (see ENGINES), limited by budget if given (see BUDGET_ENGINES),
+    and filling stats if given (see STATS_ENGINES).
+
+    Raises ValueError if the engine doesn't exist or doesn't support a budget or stats."""
+
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine '{engine}' (available: {', '.join(ENGINES)})")
+
+    kwargs = {}
+    if budget is not None:
+        if engine not in BUDGET_ENGINES:
+            raise ValueError(f"Engine '{engine}' doesn't support a search budget")
+        kwargs["budget"] = budget
+    if stats is not None:
+        if engine not in STATS_ENGINES:
+            raise ValueError(f"Engine '{engine}' doesn't support solver stats")
+        kwargs["stats"] = stats
+    ENGINES[engine](wsData, **kwargs)
+
 def FillChars(ws: ws, alphabet: str) -> None:
     """Fills all whitespaces in a word search with random chars from alphabet argument.
     
@@ -135,8 +396,21 @@ def FillChars(ws: ws, alphabet: str) -> None:
             if not c:
                 ws[i][j] = choice(alphabet) #so here we can access each index properly
 
-def RetWSData(wsDataFile: IO) -> WsData:
-    """Returns a WsData struct containing dimension and words info from a wsData file.
+def FillCharsText(ws: ws, alphabet: str) -> str:
+    """Same as FillChars followed by WsToText, for big word searches: the ws is copied into a Grid, all the filler chars are
+    generated at once (see Grid.Fill) and the text is written straight from its buffer.
+
+    The chars are as random as FillChars', but not the same ones for a given seed. Modifies the original ws and returns its text."""
+
+    grid = Grid.FromWs(ws)
+    grid.Fill(alphabet)
+    for line, gridLine in zip(ws, grid.ToWs()):
+        line[:] = gridLine
+
+    return grid.ToText()
+
+def RetWSData(wsDataFile: IO, verbose: bool=True) -> WsData:
+    """Returns a WsData struct containing dimension and words info from a wsData file (printing each word added if verbose).
     
     If an error occurs or the file is wrongly formatted, raises an exception."""
     
@@ -168,24 +442,11 @@ def RetWSData(wsDataFile: IO) -> WsData:
             if not str:
                 continue #skip empty lines
 
-            lineSplit = str.split(" ")
-            if len(lineSplit) != 2:
-                raise WrongWSDataFormat("Words contain a wrong formatted (word, dir) pair")
-            
-            wordStr = lineSplit[0]
-            directionStr = lineSplit[1]
-            
-            if (not wordStr.isalpha() or not directionStr.isnumeric()):
-                raise WrongWSDataFormat("Words contain a wrong formatted word or dir (non alpha word or non numeric dir)")
-
-            dirInt = int(directionStr)
-            if dirInt < 0 or dirInt > 5:
-                raise WrongWSDataFormat("Words contain a wrong direction (must be dir [0..5])")
-
-            word = Word(wordStr, Direction[dirInt]) #create a Word struct with str and Direction (Enum)
+            word = ParseWordLine(str) #raises WrongWSDataFormat if the line is wrong
             wsData.words.append(word) #append word to the WsData struct
 
-            print(f"Added: {word.string}, {word.dir} ({word.dir.value})")
+            if verbose:
+                print(f"Added: {word.string}, {word.dir} ({word.dir.value})")
     else:
         raise WrongWSDataFormat("WORDS line wasn't found")
 
@@ -194,20 +455,52 @@ def RetWSData(wsDataFile: IO) -> WsData:
 
     return wsData
 
-def WordsValidation(lexiconFile: IO, wsData: WsData) -> None:
-    """Validates each word in a WsData struct with a lexicon file, replacing missing words with random ones. ASSUMES LEXICON IS SORTED.
-    
-    Modifies the original struct and doesn't return anything."""
+def ReadLexicon(lexiconFile: IO) -> list[str]:
+    """Returns the list of words of a lexicon file (one per line)."""
 
     #we read all at once each word in the lexicon and put them into a list (which is in fact a dynamic array)
-    #we do so to be able to use binary search for optimization, to search for each of our words in the lexicon (which must be alphabetically sorted)
-    lexiconWords = [line.rstrip('\n') for line in lexiconFile]
-    for word in wsData.words:
-        if not BinarySearch(lexiconWords, word.string):
-            replace = choice(lexiconWords)
-            print(f"Replacing {word.string} with {replace}.")
+    return [line.rstrip('\n') for line in lexiconFile]
+
+def ValidateWords(lexiconWords: Sequence[str], wsData: WsData, verbose: bool=True) -> None:
+    """Validates each word in a WsData struct with a list of words (or a LexiconIndex or Trie), replacing missing words with random ones
+    (printing each replacement if verbose). ASSUMES THE LIST IS SORTED (a Trie doesn't need it).
+
+    With a LexiconIndex the replacement fits the dimension in the word's direction, preferring one that shares letters with the
+    words before it. With a list any word can be chosen.
+
+    Modifies the original struct and doesn't return anything."""
+
+    if isinstance(lexiconWords, Trie):
+        #all the words in one pass over the trie
+        found = lexiconWords.BulkContains([word.string for word in wsData.words])
+    elif isinstance(lexiconWords, LexiconIndex):
+        #binary search comparing the encoded bytes in the mapped index, without decoding a str per probe
+        found = [word.string in lexiconWords for word in wsData.words]
+    else:
+        #we use binary search for optimization, to search for each of our words in the lexicon (which must be alphabetically sorted)
+        found = [BinarySearch(lexiconWords, word.string) for word in wsData.words]
+
+    chosenLetters = 0 #letters of the words already chosen
+    for word, wordFound in zip(wsData.words, found):
+        if not wordFound:
+            replace = None
+            if isinstance(lexiconWords, LexiconIndex):
+                replace = lexiconWords.RandomWord(MaxWordLength(wsData.dimension, word.dir), chosenLetters)
+            if replace is None:
+                replace = choice(lexiconWords)
+            if verbose:
+                print(f"Replacing {word.string} with {replace}.")
 
             word.string = replace
+        chosenLetters |= LettersMask32(word.string)
+
+def WordsValidation(lexiconFile: IO, wsData: WsData, verbose: bool=True, trie: bool=False) -> None:
+    """Validates each word in a WsData struct with a lexicon file, replacing missing words with random ones. ASSUMES LEXICON IS SORTED,
+    unless trie is True (the lexicon is loaded into a Trie, so its order doesn't matter).
+    
+    Modifies the original struct and doesn't return anything."""
+
+    ValidateWords(Trie.FromFile(lexiconFile) if trie else ReadLexicon(lexiconFile), wsData, verbose)
 
 def LoadFilesData() -> WsData:
     """Asks the user for the paths of the lexicon and word search data files. Retrieves the dimension, words of the ws, uses the
@@ -259,11 +552,8 @@ def LoadFilesData() -> WsData:
 def WsToText(ws: ws) -> str:
     """Formats a ws (2d char list) to plain text and returns it. Doesn't modify the original ws."""
 
-    wsTemp = [line + ["\n"] for line in ws] #appends a newline to each line (element) of the ws (in a copy)
-    wsFlattened = [c for line in wsTemp for c in line] #flattens 
-    wsFlattened.pop() #removes last newline
-    
-    return "".join(wsFlattened) #joins all the chars into a string
+    #joins the chars of each line, and then the lines with a newline between them (no intermediate lists of chars)
+    return "\n".join(["".join(line) for line in ws])
 
 def ShowWSText(ws: str) -> None:
     """Prints word search to console."""
@@ -284,11 +574,11 @@ def SaveWS(ws: ws) -> None:
     else:
         SaveFile(wsText, answer)
 
-def WsMaker() -> bool:
+def WsMaker(engine: str="undo") -> bool:
     """Runs the word search maker program.
     
     It first loads all the necessary data from the lexicon and input file (user input required).
-    Then it tries to generate the word search, outputs to the console and asks to save to a text file.
+    Then it tries to generate the word search (using the given engine, see ENGINES), outputs to the console and asks to save to a text file.
 
     Returns True if the word search was properly generated, False otherwise."""
 
@@ -299,19 +589,23 @@ def WsMaker() -> bool:
         print("Couldn't retrieve correct information from files. End.")
         return False
 
+    #rejects the inputs that are proven to have no solution, without running the algorithm
+    analysis = AnalyzeWsData(wsData)
+    if not analysis.feasible:
+        print(f"There's no solution: {analysis.reason.value}.\n{analysis.detail}.")
+        return False
+
     #generates the positions and positionsIndex for each Word in wsData
     WordsPositions(wsData)
 
-    #creates the wsDP structure for the backtracking algorithm
-    InitializeWSList(wsData)
-
     #tries to insert each word in the word search, verifies if it was possible and fills whitespaces before saving the file
-    WsInsertWords(wsData)
-    wsFinal = wsData.wsDP[-1] #gets the last element of the wsDP struct, if it's None then there's no solution
+    #by default we use the undo log version of the algorithm, so there's no need to create the wsDP structure
+    SolveWS(wsData, engine)
+    wsFinal = wsData.solution #if it's None then there's no solution
     if wsFinal:
         FillChars(wsFinal, ALPHABET)
         SaveWS(wsFinal)
         return True
     else:
         print("There's no solution.")
-        return False
\ No newline at end of file
+        return False
\ No newline at end of file
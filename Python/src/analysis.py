@@ -0,0 +1,123 @@
+from enum import Enum
+from collections import Counter #times each char appears in a word
+from dataclasses import dataclass, field
+from Python.src.data import WsData, Direction
+
+PAIRWISE_MAX_WORDS: int = 64
+"""Maximum number of words for which MinCells also checks every pair of words."""
+
+class Infeasibility(Enum):
+    """Enum with the reasons that make a WsData impossible to solve before running any algorithm."""
+    INVALID_DIMENSION = "dimension must be a positive number"
+    NO_WORDS = "there aren't any words to insert"
+    EMPTY_WORD = "a word is empty"
+    WORD_TOO_LONG = "a word is longer than the dimension"
+    NOT_ENOUGH_CELLS = "the words need more cells than the word search has, even with all the possible overlaps"
+
+@dataclass
+class Analysis:
+    """Dataclass with the result of the pre-solve analysis of a WsData (see AnalyzeWsData)."""
+
+    feasible: bool = field(default=True)
+    """False if the WsData is proven to have no solution (it doesn't mean True has a solution)."""
+    reason: Infeasibility = field(default=None)
+    """Why the WsData has no solution, or None if feasible."""
+    detail: str = field(default=None)
+    """Human readable explanation of the reason (e.g. which word is too long)."""
+    cells: int = field(default=0)
+    """Number of cells of the word search (dimension x dimension)."""
+    totalLetters: int = field(default=0)
+    """Sum of the lengths of all the words (cells needed without any overlap)."""
+    minCells: int = field(default=0)
+    """Lower bound of the cells needed to insert all the words, taking the maximum possible overlaps into account."""
+
+def Axis(direction: Direction) -> tuple[int, int]:
+    """Returns the line axis of a direction, the same for a direction and its opposite (e.g. RIGHT and LEFT)."""
+
+    x, y = direction.value
+    return (x, y) if (x, y) > (-x, -y) else (-x, -y)
+
+def LettersMask(wordStr: str) -> int:
+    """Returns a bitset with one bit per distinct char of the word."""
+
+    mask = 0
+    for c in wordStr:
+        mask |= 1 << ord(c)
+    return mask
+
+def MinCells(wsData: WsData) -> int:
+    """Returns a lower bound of the cells needed to insert all the words in WsData, the highest of:
+
+    - The longest word.
+    - Letters bound, in one pass over the words: the cells of a word are all different, so the word search needs at least as many
+    cells with each char as the word that has it most times.
+    - Only with up to PAIRWISE_MAX_WORDS words: |A1 U ... U An| >= sum |Ai| - sum |Ai n Aj| over all pairs of words. Two words can
+    only share cells if they have a char in common, and in that case two words on different axes share 1 cell at most, and two words
+    on the same axis share at most as many cells as the shortest of them. Each pair costs one AND of their chars bitsets, so with
+    more words it would cost more than some solves."""
+
+    words = [(len(word.string), Axis(word.dir), LettersMask(word.string)) for word in wsData.words]
+    longest = max((length for length, axis, mask in words), default=0)
+
+    mostTimes: dict[str, int] = {}
+    for word in wsData.words:
+        for c, times in Counter(word.string).items():
+            if times > mostTimes.get(c, 0):
+                mostTimes[c] = times
+    bound = max(longest, sum(mostTimes.values()))
+
+    if len(words) <= PAIRWISE_MAX_WORDS:
+        overlaps = 0
+        for i, (lengthI, axisI, maskI) in enumerate(words):
+            for lengthJ, axisJ, maskJ in words[i+1:]:
+                if maskI & maskJ:
+                    overlaps += min(lengthI, lengthJ) if axisI == axisJ else 1
+        bound = max(bound, sum(length for length, axis, mask in words) - overlaps)
+
+    return bound
+
+def AnalyzeWsData(wsData: WsData) -> Analysis:
+    """Checks if a WsData is trivially impossible to solve, before generating the positions and running the algorithm.
+
+    The checks of each word are O(words), the minimum cells bound is only computed if all of them pass (see MinCells, also linear
+    except for short lists).
+    Returns an Analysis with the reason if it's infeasible, and simple bounds (letters, minimum cells) in any case."""
+
+    dim = wsData.dimension
+    analysis = Analysis()
+
+    if not isinstance(dim, int) or dim < 1:
+        analysis.feasible = False
+        analysis.reason = Infeasibility.INVALID_DIMENSION
+        analysis.detail = f"Dimension is {dim}"
+        return analysis
+
+    analysis.cells = dim * dim
+    if not wsData.words:
+        analysis.feasible = False
+        analysis.reason = Infeasibility.NO_WORDS
+        analysis.detail = "There wasn't any words"
+        return analysis
+
+    for word in wsData.words:
+        length = len(word.string) if word.string else 0
+        analysis.totalLetters += length
+        if not length:
+            analysis.feasible = False
+            analysis.reason = Infeasibility.EMPTY_WORD
+            analysis.detail = f"Empty word with direction {word.dir.name}"
+            return analysis
+        #in a square word search, every direction (including the diagonals) has at most dimension cells
+        if length > dim:
+            analysis.feasible = False
+            analysis.reason = Infeasibility.WORD_TOO_LONG
+            analysis.detail = f"{word.string} ({length} letters, {word.dir.name}) doesn't fit in a {dim}x{dim} word search"
+            return analysis
+
+    analysis.minCells = MinCells(wsData)
+    if analysis.minCells > analysis.cells:
+        analysis.feasible = False
+        analysis.reason = Infeasibility.NOT_ENOUGH_CELLS
+        analysis.detail = f"At least {analysis.minCells} cells are needed, but there's only {analysis.cells}"
+
+    return analysis
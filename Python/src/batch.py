@@ -0,0 +1,309 @@
+import argparse #command line arguments of the batch mode
+from contextlib import ExitStack #the wire file is only opened if it's used
+from copy import deepcopy
+from dataclasses import dataclass, field
+from multiprocessing import Pool #pool of worker processes, each one loads the lexicon only once
+from os import makedirs
+from pathlib import Path
+from random import seed as randomSeed
+from collections.abc import Sequence
+from typing import Iterator
+from Python.src.constants import ALPHABET
+from Python.src.data import WsData, Word, SolveStatus
+from Python.src.budget import SearchBudget
+from Python.src.analysis import AnalyzeWsData
+from Python.src.lexicon import LexiconIndex, OpenLexicon, INDEX_SUFFIX
+from Python.src.parser import ParseWSData
+from Python.src.wire import WireReader, WireWriter, WIRE_EXTENSION
+from Python.src.cache import ResultCache, CachedResult, RequestKey
+from Python.src.WsMaker import (ValidateWords, WordsPositions, SolveWS,
+                                ENGINES, BUDGET_ENGINES, FillCharsText, WsToText)
+
+@dataclass
+class BatchJob:
+    """Dataclass with everything a worker needs to generate one puzzle."""
+
+    source: str = field(default=None)
+    """Path of the wsData file."""
+    index: int = field(default=0)
+    """Number of the puzzle generated from the same file (from 0)."""
+    seed: int = field(default=0)
+    """Random seed of this puzzle, so any puzzle of a batch can be generated again."""
+    wsData: WsData = field(default=None)
+    """Data read from the wsData file (each worker gets its own copy)."""
+
+@dataclass
+class BatchResult:
+    """Dataclass with the outcome of one puzzle of a batch."""
+
+    source: str = field(default=None)
+    """Path of the wsData file."""
+    index: int = field(default=0)
+    """Number of the puzzle generated from the same file."""
+    seed: int = field(default=0)
+    """Random seed used."""
+    status: SolveStatus = field(default=None)
+    """Outcome of the algorithm (None if the input was rejected before running it)."""
+    text: str = field(default=None)
+    """Word search as text (see FillCharsText), or None if it couldn't be generated."""
+    detail: str = field(default=None)
+    """Why the puzzle couldn't be generated."""
+    output: str = field(default=None)
+    """Path of the file where the puzzle was saved (path#record for a wire file)."""
+    wsData: WsData = field(default=None)
+    """Finished puzzle: dimension, words with their Word.position and the filled solution (without the positions lists)."""
+    cached: bool = field(default=None)
+    """True if the result came from the ResultCache, False if it was generated and None if there's no cache."""
+
+@dataclass
+class BatchSummary:
+    """Dataclass with the totals of a batch run."""
+
+    generated: int = field(default=0)
+    """Puzzles generated and saved."""
+    failed: list[str] = field(default_factory=list)
+    """Puzzles that couldn't be generated (no solution, budget exceeded or rejected input), with the reason."""
+    errors: list[str] = field(default_factory=list)
+    """Input files (or blocks of them) that couldn't be read, with the reason."""
+    cacheHits: int = field(default=0)
+    """Puzzles answered by the result cache."""
+    cacheMisses: int = field(default=0)
+    """Puzzles generated because they weren't in the result cache."""
+
+def ReadManifest(path: str) -> list[tuple[str, int]]:
+    """Returns the (wsData path, puzzles) pairs of a manifest file.
+
+    Each non-empty line is "path" or "path count" (relative paths are relative to the manifest), lines starting with # are ignored.
+    The count is None if not given. Raises ValueError if a line is wrongly formatted."""
+
+    manifestDir = Path(path).resolve().parent
+    entries = []
+    with open(path, "r") as f:
+        for lineNum, line in enumerate(f, 1):
+            cleanLine = line.strip()
+            if not cleanLine or cleanLine.startswith("#"):
+                continue
+
+            lineSplit = cleanLine.split()
+            if len(lineSplit) > 2 or (len(lineSplit) == 2 and not lineSplit[1].isnumeric()):
+                raise ValueError(f"Manifest line {lineNum} must be: path [count]")
+
+            count = int(lineSplit[1]) if len(lineSplit) == 2 else None
+            entries.append(((manifestDir / lineSplit[0]).as_posix(), count))
+
+    return entries
+
+def CollectInputs(paths: list[str], count: int=1, manifest: str=None) -> list[tuple[str, int]]:
+    """Returns the (wsData path, puzzles) pairs to generate: every file given, every file in the given directories (sorted)
+    and every entry of the manifest. Files without a count in the manifest generate count puzzles.
+
+    Compiled lexicon indexes (INDEX_SUFFIX) in the directories are skipped, e.g. the one of a lexicon in the same directory."""
+
+    inputs = []
+    for path in paths:
+        if Path(path).is_dir():
+            inputs.extend((file.as_posix(), count) for file in sorted(Path(path).iterdir())
+                          if file.is_file() and file.suffix != INDEX_SUFFIX)
+        else:
+            inputs.append((path, count))
+
+    if manifest:
+        inputs.extend((path, entryCount if entryCount is not None else count) for path, entryCount in ReadManifest(manifest))
+
+    return inputs
+
+def ReadBlocks(path: str, errors: list) -> Iterator[WsData]:
+    """Yields each WsData of a wsData file: its records if it's a wire file (WIRE_EXTENSION), otherwise its text blocks
+    as they're read (see ParseWSData, its format errors are appended to errors)."""
+
+    if path.endswith(WIRE_EXTENSION):
+        with WireReader(path) as reader:
+            yield from reader
+    else:
+        with open(path, "r") as wsDataFile:
+            yield from ParseWSData(wsDataFile, errors)
+
+def BatchJobs(inputs: list[tuple[str, int]], seed: int=0, summary: BatchSummary=None) -> Iterator[BatchJob]:
+    """Yields count BatchJobs per DIMENSION/WORDS block (or wire record) of each wsData file, as soon as it's read (see ReadBlocks).
+    Seeds are seed, seed+1, ... in order, and the index of the puzzles goes on across the blocks of a file.
+
+    Files that can't be read and wrongly formatted blocks are skipped, adding the reason to summary.errors (if given)."""
+
+    jobSeed = seed
+    for path, count in inputs:
+        errors = []
+        index = 0
+        #we don't use OpenFile, as it would ask the user for another path
+        try:
+            for wsData in ReadBlocks(path, errors):
+                for _ in range(count):
+                    yield BatchJob(path, index, jobSeed, deepcopy(wsData)) #each puzzle modifies its own words
+                    index += 1
+                    jobSeed += 1
+        except Exception as e:
+            errors.append(f"{type(e).__name__}: {e}")
+
+        if summary is not None:
+            summary.errors.extend(f"{path}: {error}" for error in errors)
+
+#lexicon and options of each worker process, set once by InitWorker
+BATCH_ENGINES: tuple[str, ...] = tuple(engine for engine in ENGINES if engine != "portfolio")
+"""Engines of the batch mode (the pool workers are daemonic, so they can't start the processes of portfolio)."""
+
+_workerLexicon: LexiconIndex = None
+_workerEngine: str = "undo"
+_workerTimeout: float = None
+_workerCache: ResultCache = None
+
+def InitWorker(indexPath: str, engine: str, timeout: float, cacheDir: str=None) -> None:
+    """Initializer of each worker process of the pool: maps the compiled lexicon and keeps the options for all the puzzles it generates.
+
+    Every worker maps the same index file, so the lexicon is neither parsed nor copied per process. With a cacheDir each worker has
+    its own ResultCache in memory, and all of them share the disk tier in cacheDir."""
+
+    global _workerLexicon, _workerEngine, _workerTimeout, _workerCache
+    _workerLexicon = LexiconIndex(indexPath)
+    _workerEngine = engine
+    _workerTimeout = timeout
+    _workerCache = ResultCache(directory=cacheDir) if cacheDir is not None else None
+
+def GeneratePuzzle(job: BatchJob, lexiconWords: Sequence[str]=None, engine: str=None, timeout: float=None,
+                   cache: ResultCache=None) -> BatchResult:
+    """Generates one puzzle, the same steps as WsMaker without any user input or console output.
+
+    If lexiconWords, engine, timeout or cache are None, the ones set by InitWorker are used. Returns a BatchResult, also if the
+    puzzle raises an exception (without text, and the exception in BatchResult.detail), so one puzzle can't stop the whole batch.
+
+    With a cache, the same request (words, seed, engine and lexicon, see RequestKey) gets the result saved the first time, with
+    or without solution. Only a compiled lexicon (LexiconIndex) identifies its content, so the cache is skipped with any other."""
+
+    lexiconWords = lexiconWords if lexiconWords is not None else _workerLexicon
+    engine = engine or _workerEngine
+    timeout = timeout if timeout is not None else _workerTimeout
+    cache = cache if cache is not None else _workerCache
+
+    try:
+        lexiconHash = getattr(lexiconWords, "sourceHash", None)
+        if cache is None or lexiconHash is None:
+            return BuildPuzzle(job, lexiconWords, engine, timeout)
+
+        key = RequestKey(job.wsData, job.seed, engine, lexiconHash.hex())
+        cached = cache.Get(key)
+        if cached is not None:
+            return BatchResult(job.source, job.index, job.seed, cached.status,
+                               WsToText(cached.wsData.solution) if cached.wsData is not None else None, cached.detail,
+                               wsData=cached.wsData, cached=True)
+
+        result = BuildPuzzle(job, lexiconWords, engine, timeout)
+        cache.Put(key, CachedResult(result.status, result.wsData, result.detail)) #not saved if the budget was exceeded
+        result.cached = False
+        return result
+    except Exception as e:
+        #raised in a worker, it would end imap_unordered (and the batch) in the main process
+        return BatchResult(job.source, job.index, job.seed, detail=f"{type(e).__name__}: {e}")
+
+def BuildPuzzle(job: BatchJob, lexiconWords: Sequence[str], engine: str, timeout: float) -> BatchResult:
+    """Generates one puzzle (see GeneratePuzzle), without looking it up in any cache. Returns a BatchResult."""
+
+    result = BatchResult(job.source, job.index, job.seed)
+    randomSeed(job.seed)
+    wsData = job.wsData
+
+    ValidateWords(lexiconWords, wsData, verbose=False)
+    analysis = AnalyzeWsData(wsData)
+    if not analysis.feasible:
+        result.detail = f"{analysis.reason.value}: {analysis.detail}"
+        return result
+
+    WordsPositions(wsData)
+    budget = SearchBudget.FromTimeout(timeout) if timeout is not None and engine in BUDGET_ENGINES else None
+    SolveWS(wsData, engine, budget)
+
+    result.status = wsData.status
+    if wsData.solution:
+        result.text = FillCharsText(wsData.solution, ALPHABET)
+        #the positions lists aren't needed anymore, so they aren't sent back to the main process
+        result.wsData = WsData(wsData.dimension, [Word(word.string, word.dir, position=word.position) for word in wsData.words],
+                               solution=wsData.solution, status=wsData.status)
+    else:
+        result.detail = wsData.status.value
+
+    return result
+
+def RunBatch(inputs: list[tuple[str, int]], lexiconPath: str, outputDir: str, engine: str="undo", workers: int=None,
+             timeout: float=None, seed: int=0, indexPath: str=None, wire: bool=False, cacheDir: str=None) -> BatchSummary:
+    """Generates every puzzle of inputs ((wsData path, puzzles) pairs) in a pool of worker processes.
+
+    The lexicon is compiled to indexPath (by default next to it, see OpenLexicon) only if it changed since the last run, and each
+    puzzle is saved to outputDir/<file name>_<index>.txt as soon as it's finished. If wire, all the puzzles (with the position of
+    each word) are saved instead to a single wire file, outputDir/puzzles.wsw, in the order they finish. With a cacheDir, the results
+    are cached there (see GeneratePuzzle), so running the same batch again doesn't search anything. Returns a BatchSummary.
+
+    Raises ValueError if the engine isn't one of BATCH_ENGINES."""
+
+    if engine not in BATCH_ENGINES:
+        raise ValueError(f"Engine '{engine}' can't be used in the batch mode, use one of: {', '.join(BATCH_ENGINES)}")
+    lexicon = OpenLexicon(lexiconPath, indexPath)
+    lexicon.Close() #the workers map it on their own
+    makedirs(outputDir, exist_ok=True)
+
+    summary = BatchSummary()
+    wirePath = (Path(outputDir) / f"puzzles{WIRE_EXTENSION}").as_posix()
+    with ExitStack() as stack:
+        writer = stack.enter_context(WireWriter(stack.enter_context(open(wirePath, "wb")))) if wire else None
+        pool = stack.enter_context(Pool(workers, initializer=InitWorker, initargs=(lexicon.path, engine, timeout, cacheDir)))
+
+        #imap_unordered gives us each result as soon as any worker finishes it, and consumes the jobs lazily
+        for result in pool.imap_unordered(GeneratePuzzle, BatchJobs(inputs, seed, summary)):
+            if result.cached is not None:
+                summary.cacheHits += result.cached
+                summary.cacheMisses += not result.cached
+            if result.text is None:
+                summary.failed.append(f"{result.source} ({result.index}): {result.detail}")
+                continue
+
+            if writer is not None:
+                result.output = f"{wirePath}#{len(writer.offsets)}"
+                writer.Write(result.wsData)
+            else:
+                result.output = (Path(outputDir) / f"{Path(result.source).stem}_{result.index}.txt").as_posix()
+                with open(result.output, "w") as f:
+                    f.write(result.text)
+            summary.generated += 1
+
+    return summary
+
+def Main(argv: list[str]=None) -> int:
+    """Runs the batch mode from the command line. Returns the exit code (0 if every puzzle was generated)."""
+
+    parser = argparse.ArgumentParser(prog="python3 -m Python.batch",
+                                     description="Generates many word searches from wsData files, without user input.")
+    parser.add_argument("inputs", nargs="*", help=f"wsData files (text or {WIRE_EXTENSION}) or directories containing them")
+    parser.add_argument("-m", "--manifest", help="file with one 'path [count]' per line")
+    parser.add_argument("-l", "--lexicon", required=True, help="lexicon file used to validate the words")
+    parser.add_argument("-i", "--index", default=None, help="compiled lexicon index (default: lexicon path + .idx)")
+    parser.add_argument("-o", "--output", required=True, help="directory where the word searches are saved")
+    parser.add_argument("-n", "--count", type=int, default=1, help="puzzles per file (default 1)")
+    parser.add_argument("-e", "--engine", default="undo", choices=list(BATCH_ENGINES), help="engine to insert the words (default undo)")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="worker processes (default one per CPU)")
+    parser.add_argument("-t", "--timeout", type=float, default=None, help="seconds per puzzle (only engines that support a budget)")
+    parser.add_argument("-b", "--wire", action="store_true", help=f"save all the puzzles to a single binary file (puzzles{WIRE_EXTENSION})")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="seed of the first puzzle (default 0)")
+    parser.add_argument("-c", "--cache", default=None, help="directory to cache the results, so repeated puzzles aren't generated again")
+    args = parser.parse_args(argv)
+
+    if not args.inputs and not args.manifest:
+        parser.error("at least one input or a manifest is required")
+
+    summary = RunBatch(CollectInputs(args.inputs, args.count, args.manifest), args.lexicon, args.output,
+                       args.engine, args.workers, args.timeout, args.seed, args.index, args.wire, args.cache)
+
+    for error in summary.errors:
+        print(f"Error reading {error}")
+    for failure in summary.failed:
+        print(f"Couldn't generate {failure}")
+    print(f"Generated: {summary.generated}. Failed: {len(summary.failed)}. Unreadable files: {len(summary.errors)}.")
+    if args.cache:
+        print(f"Cache hits: {summary.cacheHits}. Cache misses: {summary.cacheMisses}.")
+
+    return 0 if not summary.failed and not summary.errors else 1
@@ -0,0 +1,309 @@
+import argparse #command line arguments of the benchmarks
+import json
+import platform
+import tracemalloc #peak memory of each benchmark
+from copy import deepcopy
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from random import Random, seed as randomSeed
+from statistics import median
+from time import perf_counter
+from typing import Any, Callable
+from Python.src.constants import ALPHABET
+from Python.src.data import WsData, Word, Direction
+from Python.src.budget import SearchBudget
+from Python.src.stats import SolverStats
+from Python.src.placements import GetPlacementTable
+from Python.src.grid import numpy
+from Python.src.lexicon import OpenLexicon
+from Python.src.trie import Trie
+from Python.src.WsMaker import (WordsPositions, SolveWS, BUDGET_ENGINES, STATS_ENGINES, FillChars, FillCharsText, WsToText,
+                                ReadLexicon, ValidateWords)
+
+BENCH_VERSION: int = 2
+"""Version of the results format (a baseline with another version isn't compared)."""
+
+DIRECTION_MIXES: dict[str, tuple[Direction, ...]] = {
+    "horizontal": (Direction.RIGHT, Direction.LEFT),
+    "straight": (Direction.RIGHT, Direction.LEFT, Direction.DOWN, Direction.UP),
+    "all": tuple(Direction[i] for i in range(6)), #the directions allowed in a wsData file
+}
+"""Directions the words of a workload can have."""
+
+ENGINE_MAX_DIMENSION: dict[str, int] = {"dp": 50, "undo": 500, "nogood": 500, "mcv": 50, "bitset": 50, "dlx": 20}
+"""Biggest dimension each engine is benchmarked with (dp copies the grid per word, the others build tables of every placement)."""
+
+MAX_NODES: int = 200000
+"""Node budget of the engines that support it, so an infeasible workload can't run forever."""
+
+MIN_SLOWDOWN: float = 0.002
+"""Seconds a median time must grow to be a regression, whatever the fraction (small times are mostly noise)."""
+
+SUITES: dict[str, tuple[int, ...]] = {"quick": (5, 10, 20), "standard": (5, 10, 20, 50, 100), "full": (5, 10, 20, 50, 100, 200, 500)}
+"""Dimensions of the feasible workloads of each suite."""
+
+@dataclass
+class Workload:
+    """Dataclass describing a reproducible benchmark input (see BuildWsData)."""
+
+    name: str = field(default=None)
+    """Unique name, used to compare with the baseline."""
+    dimension: int = field(default=5)
+    """Dimension of the word search."""
+    words: int = field(default=3)
+    """Number of words."""
+    directions: str = field(default="all")
+    """Key of DIRECTION_MIXES."""
+    feasible: bool = field(default=True)
+    """True for words planted in a word search (always solvable), False for a set of words that can't be inserted."""
+    seed: int = field(default=0)
+    """Seed of the words and of the algorithm."""
+
+@dataclass
+class BenchResult:
+    """Dataclass with the measures of one benchmark."""
+
+    benchmark: str = field(default=None)
+    """Function measured (e.g. solve:undo)."""
+    workload: str = field(default=None)
+    """Name of the workload."""
+    seconds: float = field(default=None)
+    """Best time of all the repetitions."""
+    nodes: int = field(default=None)
+    """Nodes (insertion attempts) of the search, for the engines that count them (see STATS_ENGINES and BUDGET_ENGINES)."""
+    peakBytes: int = field(default=None)
+    """Peak memory allocated during one extra run (traced apart, so tracing doesn't affect the time)."""
+    status: str = field(default=None)
+    """Outcome of the search, for the solve benchmarks."""
+    medianSeconds: float = field(default=None)
+    """Median time of all the repetitions, the one compared with the baseline (see CompareBaseline)."""
+
+def PlantedWsData(dimension: int, wordCount: int, directions: tuple[Direction, ...], rng: Random) -> WsData:
+    """Returns a WsData whose words were written in a word search one by one, so it always has a solution.
+
+    Each word gets a random direction, length and position: the cells already written keep their char (so words overlap
+    like in a real puzzle) and the empty ones get a random letter."""
+
+    grid = [[""] * dimension for _ in range(dimension)]
+    wsData = WsData(dimension)
+    for _ in range(wordCount):
+        direction = rng.choice(directions)
+        length = rng.randint(min(3, dimension), min(dimension, 12))
+        x, y = rng.choice(GetPlacementTable(dimension, length, direction).starts)
+        chars = []
+        for i in range(length):
+            cx, cy = x + i*direction.value.x, y + i*direction.value.y
+            if not grid[cy][cx]:
+                grid[cy][cx] = rng.choice(ALPHABET)
+            chars.append(grid[cy][cx])
+        wsData.words.append(Word("".join(chars), direction))
+
+    return wsData
+
+def InfeasibleWsData(dimension: int) -> WsData:
+    """Returns a WsData without solution that the pre-solve analysis can't reject: every rotation of a word as long as the
+    dimension plus another word, all written to the RIGHT. Each one needs a whole row, and there's one word more than rows."""
+
+    base = ALPHABET[:dimension]
+    words = [Word(base[i:] + base[:i], Direction.RIGHT) for i in range(dimension)]
+    words.append(Word(ALPHABET[dimension] * dimension, Direction.RIGHT))
+    return WsData(dimension, words)
+
+def BuildWsData(workload: Workload) -> WsData:
+    """Returns the WsData of a workload (the same for the same workload)."""
+
+    if not workload.feasible:
+        return InfeasibleWsData(workload.dimension)
+    return PlantedWsData(workload.dimension, workload.words, DIRECTION_MIXES[workload.directions], Random(workload.seed))
+
+def Workloads(suite: str="quick") -> list[Workload]:
+    """Returns the workloads of a suite: feasible ones for each dimension with few and many words (up to 10 and 50) and every
+    direction mix, and small infeasible ones (the search is exponential, so they're only run with small dimensions)."""
+
+    workloads = []
+    for dimension in SUITES[suite]:
+        #WordsPositions keeps every start position of every word (dimension^2 each), so big word searches get at most 50 words
+        for density, wordCount in (("few", min(max(2, dimension // 4), 10)), ("many", min(max(3, dimension), 50))):
+            for directions in DIRECTION_MIXES:
+                name = f"planted-{dimension}-{density}-{directions}"
+                workloads.append(Workload(name, dimension, wordCount, directions, True, dimension))
+    for dimension in (4, 5, 6):
+        workloads.append(Workload(f"infeasible-{dimension}", dimension, dimension + 1, "horizontal", False, dimension))
+
+    return workloads
+
+def Measure(setup: Callable[[], Any], run: Callable[[Any], Any], repeat: int=5) -> tuple[float, float, int, Any]:
+    """Runs setup and then run(setup's result) repeat times, timing only run. Then once more tracing the memory allocated by run.
+
+    Returns the best and the median times (seconds), the peak memory (bytes) and the result of the last run."""
+
+    times = []
+    for _ in range(repeat):
+        arg = setup()
+        start = perf_counter()
+        output = run(arg)
+        times.append(perf_counter() - start)
+
+    arg = setup()
+    tracemalloc.start()
+    try:
+        run(arg)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return min(times), median(times), peak, output
+
+def BenchWorkload(workload: Workload, engines: tuple[str, ...], repeat: int=5) -> list[BenchResult]:
+    """Returns the results of WordsPositions, each engine (up to its ENGINE_MAX_DIMENSION) and, with the solution of the first
+    engine that finds it, FillChars, WsToText and FillCharsText."""
+
+    results = []
+    base = BuildWsData(workload)
+
+    randomSeed(workload.seed)
+    positioned = deepcopy(base)
+    WordsPositions(positioned)
+
+    def Positioned() -> WsData:
+        #the engines only read the positions lists, so they're copied shallowly (deepcopy would dominate the big workloads)
+        return WsData(positioned.dimension, [Word(word.string, word.dir, list(word.positions), word.positionsIndex)
+                                             for word in positioned.words])
+
+    seconds, medianSeconds, peak, _ = Measure(lambda: deepcopy(base), WordsPositions, repeat)
+    results.append(BenchResult("WordsPositions", workload.name, seconds, None, peak, medianSeconds=medianSeconds))
+
+    solution = None
+    for engine in engines:
+        if workload.dimension > ENGINE_MAX_DIMENSION.get(engine, 0):
+            continue
+
+        def Solve(wsData: WsData) -> tuple[WsData, int]:
+            budget = SearchBudget(maxNodes=MAX_NODES) if engine in BUDGET_ENGINES else None
+            stats = SolverStats() if engine in STATS_ENGINES else None
+            SolveWS(wsData, engine, budget, stats)
+            return wsData, stats.placementsTried if stats is not None else budget.nodes if budget is not None else None
+
+        seconds, medianSeconds, peak, (wsData, nodes) = Measure(Positioned, Solve, repeat)
+        results.append(BenchResult(f"solve:{engine}", workload.name, seconds, nodes, peak, wsData.status.value, medianSeconds))
+        if solution is None and wsData.solution:
+            solution = wsData.solution
+
+    if solution is not None:
+        randomSeed(workload.seed)
+        for name, run in (("FillChars", lambda ws: FillChars(ws, ALPHABET)), ("WsToText", WsToText),
+                          ("FillCharsText", lambda ws: FillCharsText(ws, ALPHABET))):
+            seconds, medianSeconds, peak, _ = Measure(lambda: deepcopy(solution), run, repeat)
+            results.append(BenchResult(name, workload.name, seconds, None, peak, medianSeconds=medianSeconds))
+
+    return results
+
+def BenchLexicon(lexiconPath: str, indexPath: str, repeat: int=5, words: int=1000) -> list[BenchResult]:
+    """Returns the results of loading the lexicon (as a list, a Trie and a mapped LexiconIndex) and of validating words of a
+    WsData with each one (half of the words are in the lexicon, the other half are replaced)."""
+
+    with open(lexiconPath, "r") as f:
+        lexiconWords = ReadLexicon(f)
+    rng = Random(0)
+    wordStrs = [rng.choice(lexiconWords) if i % 2 else "".join(rng.choices("xyz", k=6)) for i in range(words)]
+    wsData = WsData(12, [Word(wordStr, Direction.RIGHT) for wordStr in wordStrs])
+    OpenLexicon(lexiconPath, indexPath).Close() #so the index load is measured without compiling it
+
+    def Load(kind: str) -> Any:
+        if kind == "index":
+            return OpenLexicon(lexiconPath, indexPath)
+        with open(lexiconPath, "r") as f:
+            return ReadLexicon(f) if kind == "list" else Trie.FromFile(f)
+
+    results = []
+    for kind in ("list", "trie", "index"):
+        seconds, medianSeconds, peak, lexicon = Measure(lambda: kind, Load, repeat)
+        results.append(BenchResult(f"LoadLexicon:{kind}", "lexicon", seconds, None, peak, medianSeconds=medianSeconds))
+
+        randomSeed(0)
+        seconds, medianSeconds, peak, _ = Measure(lambda: deepcopy(wsData), lambda data: ValidateWords(lexicon, data, verbose=False),
+                                                  repeat)
+        results.append(BenchResult(f"ValidateWords:{kind}", f"lexicon-{words}-words", seconds, None, peak, medianSeconds=medianSeconds))
+
+    return results
+
+def RunBenchmarks(suite: str="quick", engines: tuple[str, ...]=("dp", "undo", "nogood", "mcv", "bitset", "dlx"), repeat: int=5,
+                  lexiconPath: str=None, indexPath: str=None, workloads: list[Workload]=None) -> dict:
+    """Runs every benchmark of a suite (or of the given workloads) and, if lexiconPath is given, the lexicon ones.
+
+    Returns the report: a dict with the version, the environment and the list of results (as dicts), ready to save as json."""
+
+    results = []
+    for workload in workloads if workloads is not None else Workloads(suite):
+        results.extend(BenchWorkload(workload, engines, repeat))
+    if lexiconPath:
+        results.extend(BenchLexicon(lexiconPath, indexPath or str(Path(lexiconPath)) + ".idx", repeat))
+
+    return {"version": BENCH_VERSION, "suite": suite, "python": platform.python_version(), "machine": platform.machine(),
+            "numpy": numpy is not None, "results": [asdict(result) for result in results]}
+
+def CompareBaseline(report: dict, baseline: dict, threshold: float=0.25, minSlowdown: float=MIN_SLOWDOWN) -> list[str]:
+    """Returns a description of each regression of report against baseline (another report): a benchmark whose median time is
+    more than threshold (fraction) and at least minSlowdown seconds slower, or that uses more than threshold more peak memory,
+    or that spends more nodes (deterministic, so any increase counts). A single time of a short benchmark is mostly noise, so
+    the times compared are the medians of the repetitions and a small slowdown is never a regression."""
+
+    if baseline.get("version") != report.get("version"):
+        return [f"Baseline version {baseline.get('version')} can't be compared with version {report.get('version')}"]
+
+    previous = {(result["benchmark"], result["workload"]): result for result in baseline["results"]}
+    regressions = []
+    for result in report["results"]:
+        old = previous.get((result["benchmark"], result["workload"]))
+        if old is None:
+            continue
+        key = f"{result['benchmark']} [{result['workload']}]"
+
+        newSeconds, oldSeconds = result["medianSeconds"], old["medianSeconds"]
+        if newSeconds > oldSeconds * (1 + threshold) and newSeconds - oldSeconds >= minSlowdown:
+            regressions.append(f"{key}: median {oldSeconds:.6f}s -> {newSeconds:.6f}s")
+        if result["peakBytes"] > old["peakBytes"] * (1 + threshold) and result["peakBytes"] - old["peakBytes"] > 1024:
+            regressions.append(f"{key}: peak memory {old['peakBytes']} -> {result['peakBytes']} bytes")
+        if result["nodes"] is not None and old["nodes"] is not None and result["nodes"] > old["nodes"]:
+            regressions.append(f"{key}: nodes {old['nodes']} -> {result['nodes']}")
+        if result["status"] != old["status"]:
+            regressions.append(f"{key}: status {old['status']} -> {result['status']}")
+
+    return regressions
+
+def Main(argv: list[str]=None) -> int:
+    """Runs the benchmarks from the command line. Returns the exit code (1 if there's any regression against the baseline)."""
+
+    parser = argparse.ArgumentParser(prog="python3 -m Python.bench", description="Benchmarks the word search generator.")
+    parser.add_argument("-s", "--suite", default="quick", choices=list(SUITES), help="dimensions to run (default quick)")
+    parser.add_argument("-e", "--engines", default="dp,undo,nogood,mcv,bitset,dlx", help="comma separated engines (default all but restarts/portfolio)")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="repetitions of each benchmark, the best and median times are kept (default 5)")
+    parser.add_argument("-l", "--lexicon", default=None, help="lexicon file to also benchmark loading and validation")
+    parser.add_argument("-o", "--output", default=None, help="json file to save the results")
+    parser.add_argument("-b", "--baseline", default=None, help="json results to compare with")
+    parser.add_argument("-t", "--threshold", type=float, default=0.25, help="allowed slowdown fraction (default 0.25)")
+    parser.add_argument("-m", "--min-slowdown", type=float, default=MIN_SLOWDOWN,
+                        help=f"slowdown in seconds below which a benchmark is never a regression (default {MIN_SLOWDOWN})")
+    args = parser.parse_args(argv)
+
+    report = RunBenchmarks(args.suite, tuple(args.engines.split(",")), args.repeat, args.lexicon)
+    for result in report["results"]:
+        nodes = f" nodes={result['nodes']}" if result["nodes"] is not None else ""
+        status = f" ({result['status']})" if result["status"] else ""
+        print(f"{result['benchmark']:<22} {result['workload']:<32} {result['seconds']*1000:10.3f} ms "
+              f"(median {result['medianSeconds']*1000:10.3f} ms) "
+              f"{result['peakBytes']/1024:10.1f} KiB{nodes}{status}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=1)
+
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            regressions = CompareBaseline(report, json.load(f), args.threshold, args.min_slowdown)
+        for regression in regressions:
+            print(f"Regression: {regression}")
+        print(f"Regressions: {len(regressions)}.")
+        return 1 if regressions else 0
+
+    return 0
@@ -0,0 +1,37 @@
+from time import monotonic #monotonic clock, so deadlines aren't affected by system clock changes
+
+class SearchBudget:
+    """
+    Limits how long a search can run, by wall-clock deadline and/or by number of nodes (insertion attempts).
+
+    The algorithm calls Spend once per node, and stops when it returns True. The clock is only read every checkEvery nodes,
+    so the cost per node is a counter increment and a comparison.
+    """
+
+    def __init__(self, deadline: float=None, maxNodes: int=None, checkEvery: int=256):
+        self.deadline = deadline
+        """Value of time.monotonic() after which the search must stop, or None for no time limit."""
+        self.maxNodes = maxNodes
+        """Maximum number of nodes, or None for no limit."""
+        self.checkEvery = checkEvery
+        """Number of nodes between each read of the clock."""
+        self.nodes = 0
+        """Nodes spent so far."""
+        self.exhausted = False
+        """True once the budget ran out."""
+
+    @classmethod
+    def FromTimeout(cls, timeout: float=None, maxNodes: int=None) -> "SearchBudget":
+        """Returns a budget with a deadline timeout seconds from now (or no time limit if timeout is None)."""
+
+        return cls(monotonic() + timeout if timeout is not None else None, maxNodes)
+
+    def Spend(self) -> bool:
+        """Counts one node. Returns True if the budget is exhausted (and the search must stop)."""
+
+        self.nodes += 1
+        if self.maxNodes is not None and self.nodes > self.maxNodes:
+            self.exhausted = True
+        elif self.deadline is not None and self.nodes % self.checkEvery == 0 and monotonic() >= self.deadline:
+            self.exhausted = True
+        return self.exhausted
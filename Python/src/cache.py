@@ -0,0 +1,154 @@
+import os
+from collections import OrderedDict #entries in least recently used order
+from dataclasses import dataclass, field
+from hashlib import sha256
+from pathlib import Path
+from struct import Struct, error as StructError
+from tempfile import NamedTemporaryFile
+from Python.src.data import WsData, SolveStatus
+from Python.src.stats import SolverStats
+from Python.src.wire import EncodeWsData, DecodeWsData, DIRECTION_INDEX
+
+CACHE_VERSION: int = 1
+"""Version of the generator results: bump it whenever a change (in an engine, the validation, the filling...) gives other results
+for the same request, so the cached ones aren't used anymore."""
+
+CACHE_MAGIC: bytes = b"WSRC"
+"""First bytes of every file of the disk tier."""
+
+CACHE_EXTENSION: str = ".wsc"
+"""Extension of the files of the disk tier."""
+
+ENTRY_HEADER: Struct = Struct("<4sHBBI")
+"""Header of a disk entry: magic, CACHE_VERSION, status code (see STATUS_CODES), reserved and length of the detail. Then the
+detail (utf-8) and the wire record of the puzzle (see EncodeWsData)."""
+
+STATUS_CODES: tuple[SolveStatus, ...] = (None, SolveStatus.SOLVED, SolveStatus.NO_SOLUTION)
+"""Statuses that can be cached, by code (None for an input rejected before running the engine). A budget exceeded isn't a result."""
+
+@dataclass
+class CachedResult:
+    """Dataclass with the result of a generation request, all that's needed to answer the same request again."""
+
+    status: SolveStatus = field(default=None)
+    """Outcome of the engine (None if the input was rejected before running it)."""
+    wsData: WsData = field(default=None)
+    """Validated words with their Word.position and the filled solution (None if there's no solution)."""
+    detail: str = field(default=None)
+    """Why there's no puzzle (e.g. the reason of the rejection)."""
+
+def RequestKey(wsData: WsData, seed: int, engine: str, lexiconId: str="") -> str:
+    """Returns the content address of a generation request: sha256 (hex) of the CACHE_VERSION, engine, seed, lexicon and the
+    dimension and words (string and direction, in order) of the WsData as received, before the validation changes it.
+
+    Everything else (positions, solution) is ignored, so any copy of the same request gets the same key."""
+
+    #lengths before each variable part, so different requests can't encode to the same bytes
+    parts = [f"{CACHE_VERSION}:{engine}:{seed}:{len(lexiconId)}:{lexiconId}:{wsData.dimension}:{len(wsData.words)}"]
+    parts.extend(f"{DIRECTION_INDEX[word.dir]}:{len(word.string)}:{word.string}" for word in wsData.words)
+    return sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+def EncodeResult(result: CachedResult) -> bytes:
+    """Returns the bytes of a disk entry (see ENTRY_HEADER)."""
+
+    detail = (result.detail or "").encode("utf-8")
+    record = EncodeWsData(result.wsData if result.wsData is not None else WsData(0))
+    return ENTRY_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, STATUS_CODES.index(result.status), 0, len(detail)) + detail + record
+
+def DecodeResult(buffer: bytes) -> CachedResult:
+    """Returns the CachedResult of a disk entry. Raises ValueError if it isn't one of this CACHE_VERSION."""
+
+    if len(buffer) < ENTRY_HEADER.size:
+        raise ValueError("Cache entry too short")
+    magic, version, statusCode, reserved, detailLength = ENTRY_HEADER.unpack_from(buffer, 0)
+    if magic != CACHE_MAGIC or version != CACHE_VERSION or statusCode >= len(STATUS_CODES):
+        raise ValueError(f"Not a cache entry of version {CACHE_VERSION}")
+
+    start = ENTRY_HEADER.size
+    detail = buffer[start:start + detailLength].decode("utf-8") or None
+    wsData, end = DecodeWsData(buffer, start + detailLength)
+    if end != len(buffer):
+        raise ValueError("Wrong cache entry size")
+    wsData.status = STATUS_CODES[statusCode]
+    return CachedResult(STATUS_CODES[statusCode], wsData if wsData.dimension else None, detail)
+
+class ResultCache:
+    """
+    Content-addressed cache of generation results (see RequestKey), including the requests without solution, so they fail instantly.
+
+    Results are kept in memory, up to maxEntries in LRU order, and if a directory is given also in disk, one file per key, so they
+    are shared by processes and survive restarts. A disk hit is copied to memory. Entries of another CACHE_VERSION are ignored.
+    """
+
+    def __init__(self, maxEntries: int=1024, directory: str=None):
+        self.maxEntries = maxEntries
+        """Maximum number of results kept in memory."""
+        self.directory = directory
+        """Directory of the disk tier, or None for memory only."""
+        self.entries: OrderedDict[str, CachedResult] = OrderedDict()
+        """Results in memory, from the least to the most recently used."""
+        self.hits = 0
+        """Requests found (in memory or disk)."""
+        self.diskHits = 0
+        """Requests found only in disk."""
+        self.misses = 0
+        """Requests not found."""
+        self.stores = 0
+        """Results saved."""
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def _Path(self, key: str) -> Path:
+        return Path(self.directory) / f"{key}{CACHE_EXTENSION}"
+
+    def _Remember(self, key: str, result: CachedResult) -> None:
+        self.entries[key] = result
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxEntries:
+            self.entries.popitem(last=False)
+
+    def Get(self, key: str, stats: SolverStats=None) -> CachedResult | None:
+        """Returns the result of a request, or None if it isn't cached. Counts the hit or miss, also in stats if given."""
+
+        result = self.entries.get(key)
+        if result is not None:
+            self.entries.move_to_end(key)
+        elif self.directory is not None:
+            try:
+                result = DecodeResult(self._Path(key).read_bytes())
+            except (OSError, ValueError, StructError):
+                result = None #not saved, or from another version (or damaged), so it's generated again
+            if result is not None:
+                self.diskHits += 1
+                self._Remember(key, result)
+
+        if result is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        if stats is not None:
+            stats.cacheHits += result is not None
+            stats.cacheMisses += result is None
+        return result
+
+    def Put(self, key: str, result: CachedResult) -> bool:
+        """Saves the result of a request. Returns False (and doesn't save it) if its status can't be cached (see STATUS_CODES).
+
+        Disk entries are written to a temporary file and then renamed, so other processes never read a half written entry."""
+
+        if result.status not in STATUS_CODES:
+            return False
+
+        self._Remember(key, result)
+        if self.directory is not None:
+            with NamedTemporaryFile("wb", dir=self.directory, delete=False) as f:
+                f.write(EncodeResult(result))
+            os.replace(f.name, self._Path(key))
+        self.stores += 1
+        return True
+
+    def ToDict(self) -> dict:
+        """Returns the counters as a dict of plain values, ready to export."""
+
+        return {"hits": self.hits, "diskHits": self.diskHits, "misses": self.misses, "stores": self.stores,
+                "entries": len(self.entries)}
@@ -52,6 +52,12 @@ class Direction(Enum, metaclass=EnumByIndexMeta):
     LEFTDOWN: DIR = DIR(-1, 1)
     LEFTUP: DIR = DIR(-1, -1)
 
+class SolveStatus(Enum):
+    """Enum with the possible outcomes of the algorithm that inserts the words."""
+    SOLVED = "solved"
+    NO_SOLUTION = "no solution"
+    BUDGET_EXCEEDED = "budget exceeded"
+
 #we use dataclasses bacause they provide certain utilities (e.g. init method and fields)
 #and also to make the intention of our code more clear
 @dataclass
@@ -74,6 +80,8 @@ class Word:
     """Auxiliary data for the backtracking algorithm.
     
     It's a tuple (i, j) where i is the current position index (used in the algorithm) and j is the maximum index available in the positions list."""
+    position: tuple[int, int] = field(default=None)
+    """(x,y) starting position chosen by the solver, or None if the word isn't placed in the word search."""
 
 ws: TypeAlias = list[list[str]]
 """We represent a word search like a list of list of str, this is, a 2d array of chars."""
@@ -87,4 +95,11 @@ class WsData:
     words: list[Word] = field(default_factory=list)
     """List of all the words and their data to put in the word search."""
     wsDP: list[ws] = field(default_factory=list)
-    """Auxiliary struct for the algorithm (we use a list of ws structs, using a new one as we fill in a new word)."""
\ No newline at end of file
+    """Auxiliary struct for the algorithm (we use a list of ws structs, using a new one as we fill in a new word)."""
+    solution: ws = field(default=None)
+    """Word search with all the words inserted (without filling the whitespaces), or None if there's no solution."""
+    status: SolveStatus = field(default=None)
+    """Outcome of the last run of the algorithm (None if it wasn't run yet)."""
+    partial: ws = field(default=None)
+    """If the algorithm ran out of budget, word search with the deepest partial insertion found (the words placed are the ones with
+    Word.position set). None otherwise."""
\ No newline at end of file
@@ -0,0 +1,314 @@
+from typing import Callable, Iterator #type hinting
+from Python.src.data import WsData, SolveStatus
+from Python.src.stats import SolverStats
+from Python.src.grid import Grid, ENCODING
+from Python.src.placements import PlacementCells
+
+class DancingLinks:
+    """
+    Exact cover with colors, solved with dancing links (Knuth's Algorithm C, TAOCP 7.2.2.1).
+
+    Primary items must be covered exactly once. Secondary items may be covered by any number of the chosen options,
+    as long as all of them give the item the same color. Options are added with AddOption and solutions are
+    produced by Solutions.
+    """
+    #all the links are stored in flat lists indexed by node, as in Knuth's description:
+    #nodes 0..N are the item headers (0 is the root of the active primary items list), then each option is a run of nodes
+    #delimited by spacer nodes (top <= 0). Undoing a cover is restoring the links in reverse order, without any copy
+
+    def __init__(self, primaryNum: int, secondaryNum: int):
+        self.primaryNum = primaryNum
+        """Number of primary items (1..primaryNum)."""
+        itemsNum = primaryNum + secondaryNum
+        self.itemsNum = itemsNum
+        """Number of items, secondary ones are primaryNum+1..itemsNum."""
+
+        #horizontal list of the active primary items, secondary items are linked to themselves
+        self.llink = [0] * (itemsNum + 1)
+        self.rlink = [0] * (itemsNum + 1)
+        for i in range(primaryNum + 1):
+            self.llink[i] = i - 1 if i > 0 else primaryNum
+            self.rlink[i] = i + 1 if i < primaryNum else 0
+        for i in range(primaryNum + 1, itemsNum + 1):
+            self.llink[i] = self.rlink[i] = i
+
+        #vertical lists, the header of item i is the node i (top holds the length of the list in headers)
+        self.top = [0] * (itemsNum + 1)
+        self.ulink = list(range(itemsNum + 1))
+        self.dlink = list(range(itemsNum + 1))
+        self.color = [0] * (itemsNum + 1)
+        self.option = [-1] * (itemsNum + 1)
+        """Option index of each node (-1 for headers and spacers)."""
+
+        #first spacer
+        self.top.append(0)
+        self.ulink.append(0)
+        self.dlink.append(0)
+        self.color.append(0)
+        self.option.append(-1)
+        self.optionsNum = 0
+
+    def AddOption(self, items: list[tuple[int, int]]) -> int:
+        """Adds an option made of (item, color) pairs (color 0 for primary items, > 0 for secondary ones).
+
+        Returns the index of the option."""
+
+        top, ulink, dlink = self.top, self.ulink, self.dlink
+        spacer = len(top) - 1
+        first = spacer + 1
+        for item, color in items:
+            node = len(top)
+            top.append(item)
+            top[item] += 1
+            #insert at the bottom of the vertical list of the item
+            ulink.append(ulink[item])
+            dlink.append(item)
+            dlink[ulink[item]] = node
+            ulink[item] = node
+            self.color.append(color)
+            self.option.append(self.optionsNum)
+
+        last = len(top) - 1
+        dlink[spacer] = last
+        #spacer after the option
+        top.append(-self.optionsNum - 1)
+        ulink.append(first)
+        dlink.append(0)
+        self.color.append(0)
+        self.option.append(-1)
+
+        self.optionsNum += 1
+        return self.optionsNum - 1
+
+    def _Hide(self, p: int) -> None:
+        top, ulink, dlink, color = self.top, self.ulink, self.dlink, self.color
+        q = p + 1
+        while q != p:
+            x = top[q]
+            if x <= 0:
+                q = ulink[q]
+            elif color[q] < 0:
+                q += 1
+            else:
+                u, d = ulink[q], dlink[q]
+                dlink[u] = d
+                ulink[d] = u
+                top[x] -= 1
+                q += 1
+
+    def _Unhide(self, p: int) -> None:
+        top, ulink, dlink, color = self.top, self.ulink, self.dlink, self.color
+        q = p - 1
+        while q != p:
+            x = top[q]
+            if x <= 0:
+                q = dlink[q]
+            elif color[q] < 0:
+                q -= 1
+            else:
+                u, d = ulink[q], dlink[q]
+                dlink[u] = q
+                ulink[d] = q
+                top[x] += 1
+                q -= 1
+
+    def _Cover(self, i: int) -> None:
+        dlink = self.dlink
+        p = dlink[i]
+        while p != i:
+            self._Hide(p)
+            p = dlink[p]
+        l, r = self.llink[i], self.rlink[i]
+        self.rlink[l] = r
+        self.llink[r] = l
+
+    def _Uncover(self, i: int) -> None:
+        l, r = self.llink[i], self.rlink[i]
+        self.rlink[l] = i
+        self.llink[r] = i
+        ulink = self.ulink
+        p = ulink[i]
+        while p != i:
+            self._Unhide(p)
+            p = ulink[p]
+
+    def _Purify(self, p: int) -> None:
+        color, dlink = self.color, self.dlink
+        c = color[p]
+        i = self.top[p]
+        color[i] = c
+        q = dlink[i]
+        while q != i:
+            if color[q] == c:
+                color[q] = -1 #same color, so this option stays compatible and we don't need to check it again
+            else:
+                self._Hide(q)
+            q = dlink[q]
+
+    def _Unpurify(self, p: int) -> None:
+        color, ulink = self.color, self.ulink
+        c = color[p]
+        i = self.top[p]
+        q = ulink[i]
+        while q != i:
+            if color[q] < 0:
+                color[q] = c
+            else:
+                self._Unhide(q)
+            q = ulink[q]
+
+    def _Commit(self, p: int, j: int) -> None:
+        if self.color[p] == 0:
+            self._Cover(j)
+        elif self.color[p] > 0:
+            self._Purify(p)
+
+    def _Uncommit(self, p: int, j: int) -> None:
+        if self.color[p] == 0:
+            self._Uncover(j)
+        elif self.color[p] > 0:
+            self._Unpurify(p)
+
+    def _ChooseItem(self) -> int:
+        """Returns the active primary item with the fewest options left (minimum remaining values)."""
+
+        rlink, top = self.rlink, self.top
+        best = -1
+        bestLen = None
+        i = rlink[0]
+        while i != 0:
+            if bestLen is None or top[i] < bestLen:
+                best, bestLen = i, top[i]
+                if bestLen == 0:
+                    break
+            i = rlink[i]
+        return best
+
+    def Solutions(self, trace: Callable[[int, bool], None]=None) -> Iterator[list[int]]:
+        """Yields each solution as a list of option indexes (one per primary item), resuming the search on each call.
+
+        If given, trace is called with (primary item, True) each time an option of the item is tried, and with (primary item, False)
+        each time all of them failed and the search goes back."""
+        #this is Algorithm C step by step, x holds the node chosen in each level
+
+        top, ulink, dlink, option = self.top, self.ulink, self.dlink, self.option
+        primaryNum = self.primaryNum
+        x: list[int] = []
+        items: list[int] = []
+        level = 0
+
+        step = 2
+        while True:
+            if step == 2: #enter level
+                if self.rlink[0] == 0:
+                    yield [option[node] for node in x[:level]]
+                    step = 8
+                    continue
+                i = self._ChooseItem()
+                self._Cover(i)
+                if level == len(x):
+                    x.append(0)
+                    items.append(0)
+                x[level] = dlink[i]
+                items[level] = i
+                step = 5
+            elif step == 5: #try x[level]
+                i = items[level]
+                xl = x[level]
+                if xl == i:
+                    self._Uncover(i) #backtrack, all the options of this item failed
+                    if trace is not None and level > 0:
+                        trace(i, False)
+                    step = 8
+                    continue
+                if trace is not None:
+                    trace(i, True)
+                p = xl + 1
+                while p != xl:
+                    j = top[p]
+                    if j <= 0:
+                        p = ulink[p]
+                    elif j <= primaryNum:
+                        self._Cover(j)
+                        p += 1
+                    else:
+                        self._Commit(p, j)
+                        p += 1
+                level += 1
+                step = 2
+            elif step == 6: #try again, undoing x[level] and moving to the next option
+                xl = x[level]
+                p = xl - 1
+                while p != xl:
+                    j = top[p]
+                    if j <= 0:
+                        p = dlink[p]
+                    elif j <= primaryNum:
+                        self._Uncover(j)
+                        p -= 1
+                    else:
+                        self._Uncommit(p, j)
+                        p -= 1
+                x[level] = dlink[xl]
+                step = 5
+            else: #step 8, leave level
+                if level == 0:
+                    return
+                level -= 1
+                step = 6
+
+def WsInsertWordsDLX(wsData: WsData, stats: SolverStats=None) -> None:
+    """Tries to insert all words into an empty word search, modeled as an exact cover problem with colors and solved with dancing links.
+
+    Each word is a primary item (it must be placed exactly once), and each cell is a secondary item colored with the char written on it
+    (many words can share a cell only if they write the same char). The options are the positions of each word, in the order of
+    Word.positions. The search always continues with the word that has the fewest positions left.
+    If stats is given, each option tried is an attempt (always accepted, the options that don't fit were already hidden).
+
+    Modifies WsData.solution (None if there's no solution), WsData.status and Word.position of each word. Doesn't return anything."""
+
+    dim = wsData.dimension
+    words = wsData.words
+    wordsNum = len(words)
+
+    placements = [[PlacementCells(dim, len(word.string), word.dir, position) for position in word.positions] for word in words]
+
+    #only the cells that can be covered by 2 or more different words can produce a conflict, the rest don't need an item
+    coveredBy: dict[int, set[int]] = {}
+    for w, wordPlacements in enumerate(placements):
+        for placement in wordPlacements:
+            for cell in placement:
+                coveredBy.setdefault(cell, set()).add(w)
+    cellItem: dict[int, int] = {}
+    for cell, coveringWords in coveredBy.items():
+        if len(coveringWords) > 1:
+            cellItem[cell] = wordsNum + len(cellItem) + 1
+
+    dlx = DancingLinks(wordsNum, len(cellItem))
+    optionPlacement: list[tuple[int, int]] = [] #(word, position index) of each option
+    for w, word in enumerate(words):
+        wordBytes = word.string.encode(ENCODING)
+        for k, placement in enumerate(placements[w]):
+            items = [(w + 1, 0)]
+            items.extend((cellItem[cell], c) for cell, c in zip(placement, wordBytes) if cell in cellItem)
+            dlx.AddOption(items)
+            optionPlacement.append((w, k))
+
+    trace = None
+    if stats is not None:
+        stats.Start(wordsNum)
+        trace = lambda item, tried: stats.Tried(item-1, words[item-1], True) if tried else stats.Backtrack(item-1, words[item-1])
+    solution = next(dlx.Solutions(trace), None)
+    if solution is not None:
+        grid = Grid(dim)
+        for optionIdx in solution:
+            w, k = optionPlacement[optionIdx]
+            words[w].position = words[w].positions[k]
+            grid.PlaceWord(words[w].string, words[w].dir, words[w].position)
+        wsData.solution = grid.ToWs()
+        wsData.status = SolveStatus.SOLVED
+    else:
+        wsData.solution = None
+        wsData.status = SolveStatus.NO_SOLUTION
+    if stats is not None:
+        stats.Finish(wsData)
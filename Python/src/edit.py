@@ -0,0 +1,189 @@
+from enum import Enum
+from dataclasses import dataclass, field
+from Python.src.data import WsData, Word, SolveStatus, ws
+from Python.src.budget import SearchBudget
+from Python.src.placements import PlacementCells
+from Python.src.WsMaker import WordsPositions, PlaceWord, WsInsertWordsUndo, SolveWS
+
+REPAIR_MAX_NODES: int = 20000
+"""Default node budget of the local repair of an edit (see EditAddWord), before falling back to a full solve."""
+
+class EditOutcome(Enum):
+    """Enum with the possible outcomes of an edit of a solved word search."""
+    LOCAL = "local"
+    """Only the edited word changed, every other word kept its position."""
+    REPAIRED = "repaired"
+    """The words in conflict with the new one were placed again, the rest kept their position."""
+    RESOLVED = "resolved"
+    """The local repair failed, so all the words were inserted again from an empty word search."""
+    FAILED = "failed"
+    """There's no word search with the edit (or the budget ran out), so nothing changed."""
+
+@dataclass
+class EditResult:
+    """Dataclass with the result of an edit of a solved word search."""
+
+    outcome: EditOutcome = field(default=None)
+    """How the edit was solved (see EditOutcome)."""
+    moved: list[int] = field(default_factory=list)
+    """Indexes (in WsData.words after the edit) of the words with a new Word.position, including the edited one."""
+    nodes: int = field(default=0)
+    """Insertion attempts of the repair and the full solve (the first fit isn't counted)."""
+
+def LayoutWs(dimension: int, words: list[Word]) -> ws:
+    """Returns a word search (without filling the whitespaces) with each word written at its Word.position.
+
+    Raises ValueError if a word isn't placed or two words write different chars in the same cell."""
+
+    layout = [[""] * dimension for i in range(dimension)]
+    for word in words:
+        if word.position is None or PlaceWord(word.string, word.dir, word.position, layout) is None:
+            raise ValueError(f"Word '{word.string}' isn't placed in the word search")
+    return layout
+
+def CellOwners(dimension: int, words: list[Word]) -> list[list[int]]:
+    """Returns the indexes of the words that cover each cell (flat, row-major), given their Word.position."""
+
+    owners = [[] for i in range(dimension * dimension)]
+    for k, word in enumerate(words):
+        for cell in PlacementCells(dimension, len(word.string), word.dir, word.position):
+            owners[cell].append(k)
+    return owners
+
+def _WordIndex(words: list[Word], index: int) -> int:
+    """Returns the index of a word of the list, negative indexes counted from the end as usual.
+
+    Raises IndexError if it's out of range."""
+
+    if not -len(words) <= index < len(words):
+        raise IndexError(f"Word index {index} out of range")
+    return index % len(words)
+
+def _Adopt(words: list[Word], solvedWords: list[Word]) -> list[int]:
+    """Copies the positions found for solvedWords (copies of words) to words. Returns the indexes of the ones that moved."""
+
+    moved = []
+    for k, (word, solved) in enumerate(zip(words, solvedWords)):
+        if word.position != solved.position:
+            moved.append(k)
+        word.positions, word.positionsIndex, word.position = solved.positions, solved.positionsIndex, solved.position
+    return moved
+
+def EditAddWord(wsData: WsData, word: Word, index: int=None, engine: str="undo", budget: SearchBudget=None,
+                repairNodes: int=REPAIR_MAX_NODES) -> EditResult:
+    """Adds a word (string and direction) to a solved word search, at index in WsData.words (the end by default), moving as few of
+    the words already placed as possible:
+
+    1. Tries every position of the word (in random order) in the current layout, and keeps the first one where it fits.
+    2. Otherwise, for each position (fewest conflicts first) it erases the words in conflict with it, writes the new word and inserts
+    those words again around the rest (see WsInsertWordsUndo), until one works or repairNodes attempts are spent.
+    3. Otherwise, inserts all the words again from an empty word search with the given engine (limited by budget if given).
+
+    The layout is built from Word.position of each word (WsData.solution may already be filled, it's replaced by the new layout
+    without filling). Modifies WsData.words, WsData.solution and WsData.status if the edit succeeds, otherwise nothing changes.
+    Raises IndexError if index isn't between 0 and the number of words."""
+
+    dim = wsData.dimension
+    words = wsData.words
+    index = len(words) if index is None else index
+    if not 0 <= index <= len(words):
+        raise IndexError(f"Word index {index} out of range")
+    layout = LayoutWs(dim, words)
+    word.positions, word.positionsIndex = [], None #WordsPositions appends to them (e.g. a word already added before)
+    WordsPositions(WsData(dim, [word])) #random order of the positions, same as a full solve
+    if not word.positions:
+        return EditResult(EditOutcome.FAILED) #longer than the dimension in its direction
+
+    #1. a position where every cell is empty or already has the same char
+    owners = CellOwners(dim, words)
+    candidates: list[tuple[set[int], tuple[int, int]]] = []
+    for position in word.positions:
+        conflicts = set()
+        for c, cell in zip(word.string, PlacementCells(dim, len(word.string), word.dir, position)):
+            char = layout[cell // dim][cell % dim]
+            if char and char != c:
+                conflicts.update(owners[cell])
+        if not conflicts:
+            PlaceWord(word.string, word.dir, position, layout)
+            word.position = position
+            words.insert(index, word)
+            wsData.solution, wsData.status, wsData.partial = layout, SolveStatus.SOLVED, None
+            return EditResult(EditOutcome.LOCAL, [index])
+        candidates.append((conflicts, position))
+
+    #2. the new word in a position, and the words in conflict with it inserted again around the others
+    repairBudget = SearchBudget(budget.deadline if budget is not None else None, repairNodes)
+    candidates.sort(key=lambda candidate: len(candidate[0])) #stable, so positions with the same conflicts keep the random order
+    for conflicts, position in candidates:
+        released = sorted(conflicts)
+        grid = [line[:] for line in layout]
+        for k in released:
+            #only the cells that no other word keeps are erased
+            for cell in PlacementCells(dim, len(words[k].string), words[k].dir, words[k].position):
+                if conflicts.issuperset(owners[cell]):
+                    grid[cell // dim][cell % dim] = ""
+        PlaceWord(word.string, word.dir, position, grid)
+
+        repairData = WsData(dim, [Word(words[k].string, words[k].dir) for k in released])
+        WordsPositions(repairData)
+        WsInsertWordsUndo(repairData, repairBudget, initial=grid)
+        if repairData.status == SolveStatus.SOLVED:
+            moved = _Adopt([words[k] for k in released], repairData.words)
+            word.position = position
+            words.insert(index, word)
+            wsData.solution, wsData.status, wsData.partial = repairData.solution, SolveStatus.SOLVED, None
+            #indexes after inserting the new word
+            moved = sorted([index] + [released[k] + (released[k] >= index) for k in moved])
+            return EditResult(EditOutcome.REPAIRED, moved, repairBudget.nodes)
+        if repairBudget.exhausted:
+            break
+
+    #3. every word inserted again (copies, so nothing changes if there's no solution)
+    nodes = min(repairBudget.nodes, repairNodes)
+    solveData = WsData(dim, [Word(other.string, other.dir) for other in words])
+    solveData.words.insert(index, Word(word.string, word.dir))
+    WordsPositions(solveData)
+    SolveWS(solveData, engine, budget)
+    if budget is not None:
+        nodes += budget.nodes
+    if solveData.status != SolveStatus.SOLVED:
+        word.positions, word.positionsIndex = [], None
+        return EditResult(EditOutcome.FAILED, nodes=nodes)
+
+    words.insert(index, word)
+    moved = _Adopt(words, solveData.words)
+    wsData.solution, wsData.status, wsData.partial = solveData.solution, SolveStatus.SOLVED, None
+    return EditResult(EditOutcome.RESOLVED, moved, nodes)
+
+def EditRemoveWord(wsData: WsData, index: int) -> EditResult:
+    """Removes the word at index in WsData.words from a solved word search. The other words keep their position, and the cells
+    only the removed word covered become whitespaces.
+
+    Modifies WsData.words and WsData.solution (not filled, see EditAddWord). Returns the EditResult (LOCAL, nothing moved).
+    Negative indexes count from the end, raises IndexError if it's out of range."""
+
+    words = wsData.words
+    index = _WordIndex(words, index)
+    layout = LayoutWs(wsData.dimension, words[:index] + words[index+1:])
+    words.pop(index)
+    wsData.solution, wsData.status, wsData.partial = layout, SolveStatus.SOLVED, None
+    return EditResult(EditOutcome.LOCAL)
+
+def EditReplaceWord(wsData: WsData, index: int, word: Word, engine: str="undo", budget: SearchBudget=None,
+                    repairNodes: int=REPAIR_MAX_NODES) -> EditResult:
+    """Replaces the word at index in WsData.words with another one (string and direction) in a solved word search: the old word
+    is erased and the new one is added at the same index, same as EditAddWord.
+
+    If the edit fails nothing changes (the old word stays). Negative indexes count from the end, raises IndexError if it's out
+    of range."""
+
+    index = _WordIndex(wsData.words, index)
+    old = wsData.words.pop(index)
+    try:
+        result = EditAddWord(wsData, word, index, engine, budget, repairNodes)
+    except BaseException:
+        wsData.words.insert(index, old)
+        raise
+    if result.outcome == EditOutcome.FAILED:
+        wsData.words.insert(index, old)
+    return result
@@ -0,0 +1,159 @@
+from functools import lru_cache #strides only depend on the dimension, so we compute them once per dimension
+from random import choices, getrandbits, randbytes #filler chars are generated in a single call
+from Python.src.data import Direction, ws
+
+try:
+    import numpy #optional, only used to fill big grids
+except ImportError:
+    numpy = None
+
+EMPTY: int = 0
+"""Byte value of an empty cell in a Grid (the equivalent of "" in a ws)."""
+
+ENCODING: str = "latin-1"
+"""Encoding used to store each char in a single byte (covers ascii and accented letters of our lexicons)."""
+
+def RandomChars(alphabet: str, n: int) -> bytes:
+    """Returns n random chars of alphabet encoded in ENCODING, each one chosen uniformly (the same as random.choice).
+
+    Random bytes are generated in bulk and mapped to alphabet with bytes.translate, discarding the highest bytes so every char
+    has the same probability. Alphabets longer than 256 chars use random.choices instead."""
+
+    alphabetBytes = alphabet.encode(ENCODING)
+    k = len(alphabetBytes)
+    if not 0 < k <= 256:
+        return bytes(choices(alphabetBytes, k=n))
+
+    table = bytes(alphabetBytes[b % k] for b in range(256))
+    discard = bytes(range(256 - 256 % k, 256)) #bytes that would make the first chars more likely
+    chars = b""
+    while len(chars) < n:
+        missing = n - len(chars)
+        chars += randbytes(missing + missing // 8 + 8).translate(table, discard)
+    return chars[:n]
+
+@lru_cache(maxsize=None)
+def DirectionStrides(dimension: int) -> dict[Direction, int]:
+    """Returns the flat index increment of each Direction in a row-major grid of the given dimension.
+
+    E.g. with dimension 5, moving RIGHT adds 1 to the index and moving RIGHTDOWN adds 6."""
+
+    return {direction: direction.value.x + direction.value.y * dimension for direction in Direction}
+
+class Grid:
+    """
+    Compact word search: a single bytearray of dimension x dimension bytes, in row-major order.
+
+    It's an alternative to the ws type (list of list of str), using one byte per cell instead of a reference to a str object.
+    The cell (x,y) (x is the column and y the row, same as Word.positions) is stored at index y * dimension + x.
+    """
+    #we use slots since there's no other attributes, so every grid only stores these three references
+    __slots__ = ("dimension", "cells", "strides")
+
+    def __init__(self, dimension: int, cells: bytearray=None):
+        self.dimension = dimension
+        """Dimension of the grid (dimension x dimension cells)."""
+        self.cells = cells if cells is not None else bytearray(dimension * dimension)
+        """Row-major buffer with one byte per cell (EMPTY if there's no char)."""
+        self.strides = DirectionStrides(dimension)
+        """Flat index increment of each Direction."""
+
+    @classmethod
+    def FromWs(cls, ws: ws) -> "Grid":
+        """Returns a new Grid with the same content as a ws."""
+
+        #a single encode of all the chars, with "\0" (EMPTY) for the empty cells
+        return cls(len(ws), bytearray("".join([c or "\0" for line in ws for c in line]).encode(ENCODING)))
+
+    def ToWs(self) -> ws:
+        """Returns the grid as a ws (empty cells as "")."""
+
+        dim = self.dimension
+        chars = self.cells.decode(ENCODING)
+        return [[c if c != "\0" else "" for c in chars[y * dim:(y + 1) * dim]] for y in range(dim)]
+
+    def ToText(self, empty: str=" ") -> str:
+        """Formats the grid to plain text (same as WsToText) in a single pass over the buffer.
+
+        Empty cells are written as the empty argument."""
+
+        dim = self.dimension
+        text = b"\n".join(self.cells[y * dim:(y + 1) * dim] for y in range(dim))
+        return text.replace(b"\0", empty.encode(ENCODING)).decode(ENCODING)
+
+    def Fill(self, alphabet: str) -> None:
+        """Fills every empty cell with a random char of alphabet (same as WsMaker.FillChars), generating all of them at once.
+
+        Uses numpy if available. Otherwise the whole buffer is handled as one big integer: a mask with 0xFF in each empty cell
+        selects the filler chars (one per cell, from RandomChars) in a few operations over all the cells."""
+
+        n = len(self.cells)
+        if numpy is not None:
+            cells = numpy.frombuffer(self.cells, dtype=numpy.uint8)
+            empty = cells == EMPTY
+            chars = numpy.frombuffer(alphabet.encode(ENCODING), dtype=numpy.uint8)
+            #seeded from random, so seeding random keeps the fill reproducible
+            rng = numpy.random.default_rng(getrandbits(64))
+            cells[empty] = chars[rng.integers(0, len(chars), size=int(empty.sum()))]
+            return
+
+        value = int.from_bytes(self.cells, "little")
+        ones = int.from_bytes(b"\1" * n, "little")
+        #or-ing each byte's bits into its lowest bit (shifts up to 7 never cross to the next byte), 1 for non-empty cells
+        smeared = value | value >> 4
+        smeared |= smeared >> 2
+        smeared |= smeared >> 1
+        emptyMask = (ones - (smeared & ones)) * 0xFF
+
+        fillers = int.from_bytes(RandomChars(alphabet, n), "little")
+        self.cells = bytearray((value | fillers & emptyMask).to_bytes(n, "little"))
+
+    def Copy(self) -> "Grid":
+        """Returns an independent copy of the grid (a single buffer copy)."""
+
+        return Grid(self.dimension, self.cells[:])
+
+    def Index(self, position: tuple[int, int]) -> int:
+        """Returns the flat index of an (x,y) position."""
+
+        x, y = position
+        return y * self.dimension + x
+
+    def __getitem__(self, position: tuple[int, int]) -> str:
+        c = self.cells[self.Index(position)]
+        return chr(c) if c != EMPTY else ""
+
+    def __setitem__(self, position: tuple[int, int], c: str) -> None:
+        self.cells[self.Index(position)] = ord(c) if c else EMPTY
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Grid) and self.dimension == other.dimension and self.cells == other.cells
+
+    def PlaceWord(self, wordStr: str, wordDir: Direction, position: tuple[int, int]) -> list[int]:
+        """Tries to insert a word in the grid, same as WsMaker.PlaceWord.
+
+        Returns the flat indexes written by this insertion (the undo log), or None if the word can't be inserted
+        (and the grid is left unchanged)."""
+
+        cells = self.cells
+        idx = self.Index(position)
+        stride = self.strides[wordDir]
+        written = []
+        for c in wordStr.encode(ENCODING):
+            cell = cells[idx]
+            if cell == EMPTY:
+                cells[idx] = c
+                written.append(idx)
+            elif cell != c:
+                self.RemoveWord(written)
+                return None
+            idx += stride
+
+        return written
+
+    def RemoveWord(self, written: list[int]) -> None:
+        """Clears the cells of an undo log returned by PlaceWord."""
+
+        cells = self.cells
+        for idx in written:
+            cells[idx] = EMPTY
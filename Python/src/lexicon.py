@@ -0,0 +1,202 @@
+import mmap #the index is mapped in memory, so opening it doesn't read or parse the whole file
+from bisect import bisect_left
+from collections.abc import Sequence
+from hashlib import sha256
+from os import replace, stat
+from random import randrange #same generator as random.choice, so seeding random keeps the picks reproducible
+from struct import Struct
+
+INDEX_MAGIC: bytes = b"WSLX"
+"""First bytes of every compiled lexicon index."""
+
+INDEX_VERSION: int = 2
+"""Version of the index format, an index with a different version is compiled again."""
+
+INDEX_HEADER: Struct = Struct("<4sHHIIQQ32s")
+"""Header of the index: magic, version, reserved, number of words, length of the longest word, source size, source mtime (ns)
+and source sha256."""
+
+REPLACEMENT_SAMPLES: int = 8
+"""Candidates compared by LexiconIndex.RandomWord to prefer the one sharing more letters."""
+
+INDEX_SUFFIX: str = ".idx"
+"""Default index path is the lexicon path plus this suffix."""
+
+def FileHash(path: str) -> bytes:
+    """Returns the sha256 digest of a file, read in blocks."""
+
+    digest = sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.digest()
+
+def LettersMask32(wordStr: str) -> int:
+    """Returns a 32 bits bitset of the chars of a word: one bit per letter a-z, and the 6 remaining bits shared by any other char."""
+
+    mask = 0
+    for c in wordStr:
+        mask |= 1 << (ord(c) - 97 if "a" <= c <= "z" else 26 + ord(c) % 6)
+    return mask
+
+def UInt32Array(values: list[int]) -> bytes:
+    """Returns values packed as little endian uint32."""
+
+    return Struct(f"<{len(values)}I").pack(*values)
+
+def CompileLexicon(sourcePath: str, indexPath: str) -> None:
+    """Compiles a lexicon text file (one word per line) into a binary index. The source doesn't need to be sorted.
+
+    After the header, the index contains these uint32 arrays: the offset of each word in the blob (words+1), the word ids sorted by
+    length (words), where each length starts in the previous array (longest+2) and the LettersMask32 of each word (words). Then the
+    blob with all the words encoded in utf-8, sorted and without duplicates. The index is written to a temporary file first,
+    so readers never see it half written."""
+
+    sourceStat = stat(sourcePath)
+    with open(sourcePath, "r", encoding="utf-8") as f:
+        #utf-8 keeps the order of the code points, so sorting the bytes is the same as sorting the strs
+        words = sorted({line.strip().encode("utf-8") for line in f} - {b""})
+
+    offsets = [0]
+    for word in words:
+        offsets.append(offsets[-1] + len(word))
+
+    #lengths are in chars (cells of the word search), not in bytes
+    strs = [word.decode("utf-8") for word in words]
+    lengths = [len(wordStr) for wordStr in strs]
+    longest = max(lengths, default=0)
+    byLength = sorted(range(len(words)), key=lambda i: lengths[i])
+    sortedLengths = [lengths[i] for i in byLength]
+    lengthStarts = [bisect_left(sortedLengths, length) for length in range(longest + 2)] #first word of length >= l in byLength
+
+    tempPath = indexPath + ".tmp"
+    with open(tempPath, "wb") as f:
+        f.write(INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, 0, len(words), longest, sourceStat.st_size, sourceStat.st_mtime_ns,
+                                  FileHash(sourcePath)))
+        f.write(UInt32Array(offsets))
+        f.write(UInt32Array(byLength))
+        f.write(UInt32Array(lengthStarts))
+        f.write(UInt32Array([LettersMask32(wordStr) for wordStr in strs]))
+        f.write(b"".join(words))
+    replace(tempPath, indexPath)
+
+class LexiconIndex(Sequence):
+    """
+    Read-only lexicon backed by a memory-mapped compiled index (see CompileLexicon).
+
+    It's a sorted sequence of str, so it supports len, indexing, random.choice and BinarySearch like a list of words, but opening it
+    doesn't create any str. Membership (in) is a binary search comparing the utf-8 bytes directly.
+    """
+
+    def __init__(self, indexPath: str):
+        self.path = indexPath
+        """Path of the index file."""
+        with open(indexPath, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._map) < INDEX_HEADER.size:
+            self._map.close()
+            raise ValueError(f"{indexPath} isn't a lexicon index (version {INDEX_VERSION})")
+
+        (magic, version, reserved, self.count, self.longest, self.sourceSize,
+         self.sourceMtime, self.sourceHash) = INDEX_HEADER.unpack_from(self._map, 0)
+        if magic != INDEX_MAGIC or version != INDEX_VERSION:
+            self._map.close()
+            raise ValueError(f"{indexPath} isn't a lexicon index (version {INDEX_VERSION})")
+
+        #uint32 arrays in the same order as CompileLexicon writes them
+        view = memoryview(self._map)
+        arrays = []
+        start = INDEX_HEADER.size
+        for size in (self.count + 1, self.count, self.longest + 2, self.count):
+            arrays.append(view[start:start + size*4].cast("I"))
+            start += size*4
+        view.release()
+        self._offsets, self._byLength, self._lengthStarts, self._masks = arrays
+        self._blobStart = start
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _Bytes(self, i: int) -> bytes:
+        start = self._blobStart
+        return self._map[start + self._offsets[i]:start + self._offsets[i + 1]]
+
+    def __getitem__(self, i: int) -> str:
+        if isinstance(i, slice):
+            return [self[k] for k in range(*i.indices(self.count))]
+        if i < 0:
+            i += self.count
+        if not 0 <= i < self.count:
+            raise IndexError("lexicon index out of range")
+        return self._Bytes(i).decode("utf-8")
+
+    def __contains__(self, word: object) -> bool:
+        """True if word is in the lexicon, by binary search over the encoded words (utf-8 bytes sort the same as the strs)."""
+
+        if not isinstance(word, str):
+            return False
+        key = word.encode("utf-8")
+        idx = bisect_left(range(self.count), key, key=self._Bytes)
+        return idx < self.count and self._Bytes(idx) == key
+
+    def Fitting(self, maxLength: int) -> int:
+        """Returns how many words have at most maxLength chars."""
+
+        return self._lengthStarts[min(maxLength, self.longest) + 1] if maxLength >= 0 else 0
+
+    def RandomWord(self, maxLength: int=None, letters: int=0, samples: int=REPLACEMENT_SAMPLES) -> str | None:
+        """Returns a random word with at most maxLength chars (any length if None), or None if there isn't any.
+
+        If letters (a LettersMask32) isn't 0, it picks among samples random candidates the one sharing more letters with it,
+        so the word is more likely to overlap with the others. Each pick is O(1) thanks to the words bucketed by length."""
+
+        fitting = self.Fitting(maxLength if maxLength is not None else self.longest)
+        if not fitting:
+            return None
+
+        best = self._byLength[randrange(fitting)]
+        if letters:
+            bestShared = (self._masks[best] & letters).bit_count()
+            for _ in range(samples - 1):
+                candidate = self._byLength[randrange(fitting)]
+                shared = (self._masks[candidate] & letters).bit_count()
+                if shared > bestShared:
+                    best, bestShared = candidate, shared
+
+        return self._Bytes(best).decode("utf-8")
+
+    def Close(self) -> None:
+        """Releases the memory map."""
+
+        for array in (self._offsets, self._byLength, self._lengthStarts, self._masks):
+            array.release()
+        self._map.close()
+
+def IndexIsCurrent(sourcePath: str, index: LexiconIndex) -> bool:
+    """Returns True if index was compiled from the current content of sourcePath.
+
+    If the size and mtime match we trust it, otherwise the sha256 of the source decides (e.g. a file touched but not changed)."""
+
+    sourceStat = stat(sourcePath)
+    if sourceStat.st_size == index.sourceSize and sourceStat.st_mtime_ns == index.sourceMtime:
+        return True
+    return sourceStat.st_size == index.sourceSize and FileHash(sourcePath) == index.sourceHash
+
+def OpenLexicon(sourcePath: str, indexPath: str=None) -> LexiconIndex:
+    """Returns the LexiconIndex of a lexicon text file, compiling it first if the index doesn't exist, is from another version
+    or is outdated (the source mtime and hash changed). By default the index is sourcePath + INDEX_SUFFIX."""
+
+    indexPath = indexPath or sourcePath + INDEX_SUFFIX
+    try:
+        index = LexiconIndex(indexPath)
+    except (OSError, ValueError):
+        index = None
+
+    if index is not None and IndexIsCurrent(sourcePath, index):
+        return index
+
+    if index is not None:
+        index.Close()
+    CompileLexicon(sourcePath, indexPath)
+    return LexiconIndex(indexPath)
@@ -0,0 +1,136 @@
+from collections import OrderedDict #entries in least recently used order
+from random import Random #own generator, so the Zobrist keys don't change the global random state
+from functools import reduce
+from operator import xor
+from Python.src.data import WsData, Word, ws
+from Python.src.budget import SearchBudget
+from Python.src.stats import SolverStats
+from Python.src.placements import GetPlacementTable, GetCoverage, PlacementCells, CoverCells
+
+NOGOOD_MAX_BYTES: int = 16 * 1024 * 1024
+"""Default memory cap of a NogoodCache."""
+
+NOGOOD_ENTRY_BYTES: int = 128
+"""Approximate memory of each entry of a NogoodCache (the int key and its node in the OrderedDict)."""
+
+class NogoodCache:
+    """
+    Failed states of the undo search (nogoods): a state is the index of the next word to insert and the chars of the cells that
+    the remaining words can cover. If every placement of the remaining words failed once from a state, they'll fail again from any
+    other path that builds the same state, so the search can skip it.
+
+    Each state is identified by a Zobrist hash: a random 64 bit key per (cell, char) XORed for every written cell, so writing or
+    erasing a cell costs a single XOR. The written cells are hashed in buckets by the last word that can cover them, and the hash
+    of the state at depth k is the XOR of the buckets from k on (the cells that only earlier words can cover don't matter anymore).
+
+    The states are kept in LRU order, up to maxBytes (NOGOOD_ENTRY_BYTES each), evicting the least recently used one.
+    """
+
+    def __init__(self, maxBytes: int=NOGOOD_MAX_BYTES, seed: int=0):
+        self.maxEntries = max(1, maxBytes // NOGOOD_ENTRY_BYTES)
+        """Maximum number of states kept."""
+        self.entries: OrderedDict[int, None] = OrderedDict()
+        """Keys (state hash XOR depth key) of the failed states, from the least to the most recently used."""
+        self.hits = 0
+        """Lookups of a failed state (subtrees skipped)."""
+        self.misses = 0
+        """Lookups of a state not in the cache."""
+        self.evictions = 0
+        """States removed to stay under the memory cap."""
+        self._rng = Random(seed)
+        self._keys: dict[tuple[int, str], int] = {}
+        self._depthKeys: list[int] = []
+        self._lastDepth: list[int] = []
+        self._buckets: list[int] = []
+        self._dimension = 0
+
+    def _Key(self, cell: int, char: str) -> int:
+        #the Zobrist keys are generated the first time each (cell, char) is written
+        key = self._keys.get((cell, char))
+        if key is None:
+            key = self._keys[(cell, char)] = self._rng.getrandbits(64)
+        return key
+
+    def Start(self, wsData: WsData) -> None:
+        """Prepares the cache for the search of a WsData (with the positions already generated), removing the previous states.
+
+        The states depend on the positions of each word, so they can't be reused in another search."""
+
+        dim = wsData.dimension
+        self.entries.clear()
+        self._dimension = dim
+        while len(self._depthKeys) < len(wsData.words):
+            self._depthKeys.append(self._rng.getrandbits(64))
+        self._buckets = [0] * len(wsData.words)
+
+        #the last word that can cover each cell (-1 if none), looking from the last word back until every cell has one
+        self._lastDepth = [-1] * (dim * dim)
+        unassigned = dim * dim
+        for k in range(len(wsData.words) - 1, -1, -1):
+            if not unassigned:
+                break
+            coverage = WordCoverage(dim, wsData.words[k])
+            for cell in range(dim * dim):
+                if coverage[cell] and self._lastDepth[cell] < 0:
+                    self._lastDepth[cell] = k
+                    unassigned -= 1
+
+    def Write(self, written: list[tuple[int, int]], ws: ws) -> None:
+        """Adds to the hash the cells of an undo log (see PlaceWord), after they're written in the ws."""
+
+        for x, y in written:
+            cell = x * self._dimension + y
+            depth = self._lastDepth[cell]
+            if depth >= 0:
+                self._buckets[depth] ^= self._Key(cell, ws[x][y])
+
+    #XOR is its own inverse, so erasing a cell is the same operation as writing it (before it's cleared in the ws)
+    Erase = Write
+
+    def StateKey(self, depth: int) -> int:
+        """Returns the key of the current state when the next word to insert is the one at depth."""
+
+        return reduce(xor, self._buckets[depth:], self._depthKeys[depth])
+
+    def Failed(self, depth: int) -> bool:
+        """Returns True if the current state at depth is a known failed state."""
+
+        key = self.StateKey(depth)
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return True
+        self.misses += 1
+        return False
+
+    def Add(self, depth: int) -> None:
+        """Saves the current state at depth as failed (every placement of the words from depth on was tried)."""
+
+        key = self.StateKey(depth)
+        self.entries[key] = None
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxEntries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+def WordCoverage(dimension: int, word: Word) -> bytes:
+    """Returns the cells (a byte per cell, 1 if covered) that any position of the word can cover."""
+
+    table = GetPlacementTable(dimension, len(word.string), word.dir)
+    if len(word.positions) == len(table.starts):
+        return GetCoverage(dimension, len(word.string), word.dir) #every legal position, so the cached coverage
+    coverage = bytearray(dimension * dimension)
+    for position in word.positions:
+        CoverCells(coverage, PlacementCells(dimension, len(word.string), word.dir, position))
+    return coverage
+
+def WsInsertWordsNogood(wsData: WsData, budget: SearchBudget=None, stats: SolverStats=None, maxBytes: int=NOGOOD_MAX_BYTES) -> None:
+    """Tries to insert all words with the undo algorithm, skipping the failed states already seen (see NogoodCache).
+
+    Finds the same solution as undo (only subtrees without solution are skipped), in fewer nodes when different insertions of the
+    first words lead to the same state for the rest, e.g. when they're written in cells the rest of the words can't reach.
+    Modifies the same as WsInsertWordsUndo. Doesn't return anything."""
+    #imported here because WsMaker imports this module to register the engine
+    from Python.src.WsMaker import WsInsertWordsUndo
+
+    WsInsertWordsUndo(wsData, budget, stats, NogoodCache(maxBytes))
@@ -0,0 +1,129 @@
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import IO, Iterator
+from Python.src.data import WsData, Word, Direction
+from Python.src.grid import ENCODING
+from Python.src.utils import WrongWSDataFormat
+
+@dataclass
+class ParseError:
+    """Dataclass with a format error found by ParseWSData."""
+
+    line: int = field(default=0)
+    """Number of the line (from 1) where the error was found."""
+    block: int = field(default=0)
+    """Number of the DIMENSION/WORDS block (from 1) the line belongs to, or 0 if it's before any block."""
+    message: str = field(default=None)
+    """What's wrong, the same messages as the WrongWSDataFormat raised by RetWSData."""
+
+    def __str__(self) -> str:
+        return f"line {self.line} (block {self.block}): {self.message}"
+
+class ParserState(Enum):
+    """Enum with what the streaming parser expects in the next non-empty line."""
+    DIMENSION_LINE = 0
+    DIMENSION_NUMBER = 1
+    WORDS_LINE = 2
+    WORD = 3
+
+def ParseWordLine(line: str) -> Word:
+    """Returns the Word of a stripped wsData word line ("word dir", with dir between 0 and 5). Raises WrongWSDataFormat if it's wrong,
+    also if the word has chars that can't be stored in a Grid (one byte per cell, see ENCODING)."""
+
+    lineSplit = line.split(" ")
+    if len(lineSplit) != 2:
+        raise WrongWSDataFormat("Words contain a wrong formatted (word, dir) pair")
+
+    wordStr = lineSplit[0]
+    directionStr = lineSplit[1]
+
+    if (not wordStr.isalpha() or not directionStr.isnumeric()):
+        raise WrongWSDataFormat("Words contain a wrong formatted word or dir (non alpha word or non numeric dir)")
+
+    try:
+        wordStr.encode(ENCODING)
+    except UnicodeEncodeError:
+        raise WrongWSDataFormat(f"Words contain a word with chars outside {ENCODING} ({wordStr})")
+
+    dirInt = int(directionStr)
+    if dirInt < 0 or dirInt > 5:
+        raise WrongWSDataFormat("Words contain a wrong direction (must be dir [0..5])")
+
+    return Word(wordStr, Direction[dirInt]) #create a Word struct with str and Direction (Enum)
+
+def ParseWSData(wsDataFile: IO, errors: list[ParseError]=None, verbose: bool=False) -> Iterator[WsData]:
+    """Yields a WsData per DIMENSION/WORDS block of a wsData file, as soon as the block is read (a block ends at the next
+    DIMENSION line or at the end of the file). Printing each word added if verbose.
+
+    The format of each block is the same as RetWSData's. Instead of raising, the format errors are appended to errors (if given)
+    with their line number, and the block with the error isn't yielded: the parser skips to the next DIMENSION line."""
+
+    state = ParserState.DIMENSION_LINE
+    wsData = None
+    block = 0
+    lineNum = 0
+
+    def Error(message: str) -> None:
+        nonlocal state, wsData
+        if errors is not None:
+            errors.append(ParseError(lineNum, block, message))
+        state = ParserState.DIMENSION_LINE
+        wsData = None
+
+    def EndBlock() -> WsData | None:
+        """Returns the block read so far if it's complete, or records why it isn't."""
+        if state == ParserState.DIMENSION_NUMBER:
+            Error("DIMENSION line not followed by dimension number")
+        elif state == ParserState.WORDS_LINE:
+            Error("WORDS line wasn't found")
+        elif state == ParserState.WORD and not wsData.words:
+            Error("There wasn't any words in file")
+        elif state == ParserState.WORD:
+            return wsData
+        return None
+
+    for lineNum, line in enumerate(wsDataFile, 1):
+        cleanLine = line.strip(" \r\n")
+        if not cleanLine:
+            continue #skip empty lines
+
+        if cleanLine == "DIMENSION":
+            if block:
+                completed = EndBlock()
+                if completed is not None:
+                    yield completed
+            block += 1
+            wsData = WsData()
+            state = ParserState.DIMENSION_NUMBER
+
+        elif state == ParserState.DIMENSION_NUMBER:
+            try:
+                wsData.dimension = int(cleanLine)
+                state = ParserState.WORDS_LINE
+            except ValueError:
+                Error("Dimension isn't numerical")
+
+        elif state == ParserState.WORDS_LINE:
+            if cleanLine == "WORDS":
+                state = ParserState.WORD
+            #as in RetWSData, any other line before WORDS is ignored
+
+        elif state == ParserState.WORD:
+            try:
+                word = ParseWordLine(cleanLine)
+            except WrongWSDataFormat as e:
+                Error(str(e))
+                continue
+
+            wsData.words.append(word)
+            if verbose:
+                print(f"Added: {word.string}, {word.dir} ({word.dir.value})")
+
+        #lines in DIMENSION_LINE state (before the first block, or after an error) are skipped
+
+    if not block:
+        Error("DIMENSION line wasn't found")
+    else:
+        completed = EndBlock()
+        if completed is not None:
+            yield completed
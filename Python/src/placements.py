@@ -0,0 +1,115 @@
+from functools import lru_cache #each table is computed once per (dimension, length, direction) and shared by all words
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from itertools import product
+from Python.src.data import Direction
+from Python.src.grid import DirectionStrides
+
+PLACEMENT_CACHE_SIZE: int = 1024
+"""Maximum number of placement tables kept in the cache, so processes that get any dimension don't grow forever."""
+
+COVERAGE_CACHE_SIZE: int = 64
+"""Maximum number of coverages kept in the cache (each one takes dimension x dimension bytes)."""
+
+@dataclass(frozen=True)
+class PlacementStarts(Sequence):
+    """Sequence of the (x,y) starting positions of a placement table: every x of xRange, and for each one every y of yRange.
+
+    Each position is computed when it's accessed, so a table takes the same memory for any dimension."""
+
+    xRange: range = field(default=range(0))
+    """Valid start columns."""
+    yRange: range = field(default=range(0))
+    """Valid start rows."""
+
+    def __len__(self) -> int:
+        return len(self.xRange) * len(self.yRange)
+
+    def __getitem__(self, i: int) -> tuple[int, int]:
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("placement index out of range")
+        x, y = divmod(i, len(self.yRange))
+        return (self.xRange[x], self.yRange[y])
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        return product(self.xRange, self.yRange)
+
+@dataclass(frozen=True)
+class PlacementTable:
+    """Dataclass that contains all the legal placements of a word of a given length and direction in an empty word search.
+
+    It's immutable because the same table is shared by every word with the same (dimension, length, direction)."""
+
+    starts: Sequence[tuple[int, int]] = field(default=())
+    """(x,y) starting positions, in the same order WordsPositions used to generate them (x first, then y)."""
+    dimension: int = field(default=0)
+    """Dimension of the word search."""
+    length: int = field(default=0)
+    """Length of the word."""
+    stride: int = field(default=0)
+    """Flat index increment of the direction (see DirectionStrides)."""
+
+    @property
+    def offsets(self) -> Iterator[range]:
+        """Flat (row-major) indexes of the cells covered by each placement, in the same order as starts (computed when iterated)."""
+        return (CellsRange(y * self.dimension + x, self.stride, self.length) for x, y in self.starts)
+
+def CoordinateRange(dimension: int, length: int, increment: int) -> range:
+    """Returns the valid start coordinates in one axis, so the last char (start + increment * (length-1)) stays inside [0, dimension)."""
+
+    if increment > 0:
+        return range(0, dimension - length + 1)
+    elif increment < 0:
+        return range(length - 1, dimension)
+    else:
+        return range(0, dimension)
+
+def CellsRange(start: int, stride: int, length: int) -> range:
+    """Returns the range of flat indexes from start, moving stride each step, for length cells."""
+
+    if not stride:
+        return range(start, start + 1) #only possible for diagonals in a 1x1 word search, where length is always 1
+    return range(start, start + stride * length, stride)
+
+def PlacementCells(dimension: int, length: int, direction: Direction, position: tuple[int, int]) -> range:
+    """Returns the flat indexes of the cells covered by a word of the given length, direction and (x,y) start."""
+
+    x, y = position
+    return CellsRange(y * dimension + x, DirectionStrides(dimension)[direction], length)
+
+@lru_cache(maxsize=PLACEMENT_CACHE_SIZE)
+def GetPlacementTable(dimension: int, length: int, direction: Direction) -> PlacementTable:
+    """Returns the (cached) PlacementTable of a word of the given length and direction in a dimension x dimension word search.
+
+    The start positions are arithmetic ranges per axis, instead of checking the boundaries of every cell, and neither they nor the
+    cells of each placement are stored, so a table is small for any dimension. Only the last PLACEMENT_CACHE_SIZE are kept."""
+
+    if length < 1 or length > dimension:
+        return PlacementTable()
+
+    xRange = CoordinateRange(dimension, length, direction.value.x)
+    yRange = CoordinateRange(dimension, length, direction.value.y)
+    return PlacementTable(PlacementStarts(xRange, yRange), dimension, length, DirectionStrides(dimension)[direction])
+
+def MaxWordLength(dimension: int, direction: Direction) -> int:
+    """Returns the length of the longest word that has any start position in the given direction (0 if none)."""
+
+    return next((length for length in range(dimension, 0, -1) if GetPlacementTable(dimension, length, direction).starts), 0)
+
+def CoverCells(coverage: bytearray, cells: range) -> None:
+    """Sets to 1 the bytes of coverage at the given flat indexes, with a single slice assignment."""
+
+    first, last = min(cells[0], cells[-1]), max(cells[0], cells[-1])
+    coverage[first:last + 1:abs(cells.step)] = b"\x01" * len(cells)
+
+@lru_cache(maxsize=COVERAGE_CACHE_SIZE)
+def GetCoverage(dimension: int, length: int, direction: Direction) -> bytes:
+    """Returns the (cached) cells that any placement of a word of the given length and direction can cover: a byte per cell
+    (row-major), 1 if some placement covers it and 0 otherwise. Only the last COVERAGE_CACHE_SIZE are kept."""
+
+    coverage = bytearray(dimension * dimension)
+    for cells in GetPlacementTable(dimension, length, direction).offsets:
+        CoverCells(coverage, cells)
+    return bytes(coverage)
@@ -0,0 +1,104 @@
+import multiprocessing #one process per strategy, so the ones that don't win can be terminated
+from os import cpu_count
+from queue import Empty #raised by a queue get with timeout
+from random import seed as randomSeed
+from time import monotonic
+from Python.src.data import WsData, SolveStatus
+
+POLL_SECONDS: float = 0.05
+"""Maximum wait for a result before checking if the workers are still alive."""
+
+PORTFOLIO_ENGINES: tuple[str, ...] = ("undo", "mcv", "restarts", "dlx")
+"""Engines used by default in the portfolio, assigned to the workers in turns."""
+
+def PortfolioStrategies(workers: int, engines: tuple[str, ...]=PORTFOLIO_ENGINES, seed: int=0) -> list[tuple[str, int]]:
+    """Returns the (engine, seed) of each worker: engines are assigned in turns, and every worker gets a different seed."""
+
+    return [(engines[i % len(engines)], seed + i) for i in range(workers)]
+
+def PortfolioWorker(results: multiprocessing.Queue, workerIdx: int, wsData: WsData, engine: str, seed: int) -> None:
+    """Runs in a worker process: generates the positions with its own seed, runs its engine and puts the result in the queue.
+
+    The result is a tuple (worker index, status, solution, position of each word), or (worker index, None, error message)."""
+    #imported here because WsMaker imports this module to register the engine
+    from Python.src.WsMaker import WordsPositions, SolveWS
+    from Python.src.restarts import WsInsertWordsRestarts
+
+    try:
+        randomSeed(seed)
+        for word in wsData.words:
+            word.positions = []
+        WordsPositions(wsData)
+
+        if engine == "restarts":
+            WsInsertWordsRestarts(wsData, seed=seed)
+        else:
+            SolveWS(wsData, engine)
+
+        results.put((workerIdx, wsData.status, wsData.solution, [word.position for word in wsData.words]))
+    except Exception as e:
+        results.put((workerIdx, None, f"{type(e).__name__}: {e}"))
+
+def WsInsertWordsPortfolio(wsData: WsData, workers: int=None, engines: tuple[str, ...]=PORTFOLIO_ENGINES, seed: int=0,
+                           timeout: float=None) -> None:
+    """Tries to insert all words running many engines in parallel, one per process, each with a different seed (see PortfolioStrategies).
+
+    The first worker that finishes wins (with a solution, or with the proof that there's none) and the rest are terminated.
+    If timeout seconds pass before that, the status is BUDGET_EXCEEDED. By default there's one worker per CPU.
+
+    Modifies WsData.solution, WsData.status and Word.position of each word (the positions list isn't modified).
+    Doesn't return anything. Raises RuntimeError if every worker fails (or exits without a result)."""
+
+    workers = workers or cpu_count() or 1
+    results = multiprocessing.Queue()
+    processes = [multiprocessing.Process(target=PortfolioWorker, args=(results, i, wsData, engine, workerSeed), daemon=True)
+                 for i, (engine, workerSeed) in enumerate(PortfolioStrategies(workers, engines, seed))]
+    for process in processes:
+        process.start()
+
+    deadline = monotonic() + timeout if timeout is not None else None
+    winner = None
+    errors = {}
+    try:
+        #we wait for the first result that isn't an error, polling so a worker that dies without a result (e.g. killed) is noticed
+        while winner is None and len(errors) < workers:
+            remaining = deadline - monotonic() if deadline is not None else POLL_SECONDS
+            if remaining <= 0:
+                break
+            try:
+                result = results.get(timeout=min(remaining, POLL_SECONDS))
+            except Empty:
+                if any(process.is_alive() for process in processes):
+                    continue
+                #every worker has exited, so anything they put in the queue is already there
+                try:
+                    result = results.get(timeout=POLL_SECONDS)
+                except Empty:
+                    for i, process in enumerate(processes):
+                        errors.setdefault(i, f"the worker exited without a result (exit code {process.exitcode})")
+                    break
+            if result[1] is None:
+                errors[result[0]] = result[2]
+            else:
+                winner = result
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        for process in processes:
+            process.join()
+        results.close()
+
+    if winner is None and len(errors) == workers:
+        raise RuntimeError(f"Every worker of the portfolio failed: {next(iter(errors.values()))}")
+
+    wsData.partial = None
+    if winner is None:
+        wsData.solution = None
+        wsData.status = SolveStatus.BUDGET_EXCEEDED
+        for word in wsData.words:
+            word.position = None
+    else:
+        workerIdx, wsData.status, wsData.solution, positions = winner
+        for word, position in zip(wsData.words, positions):
+            word.position = position
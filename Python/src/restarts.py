@@ -0,0 +1,85 @@
+from random import Random #own generator, so the runs only depend on the seed given
+from time import monotonic
+from Python.src.data import WsData, SolveStatus
+from Python.src.budget import SearchBudget
+from Python.src.placements import GetPlacementTable
+
+def Luby(i: int) -> int:
+    """Returns the i-th (from 1) term of the Luby sequence: 1, 1, 2, 1, 1, 2, 4, 1, 1, 2, 1, 1, 2, 4, 8, ..."""
+
+    #if i = 2^k - 1 the term is 2^(k-1), otherwise the sequence repeats itself from the previous 2^(k-1) - 1 terms
+    k = 1
+    while (1 << k) - 1 < i:
+        k += 1
+    if i == (1 << k) - 1:
+        return 1 << (k - 1)
+    return Luby(i - (1 << (k - 1)) + 1)
+
+def ShufflePositions(wsData: WsData, rng: Random) -> None:
+    """Generates again the positions of every word (same as WordsPositions) shuffled with the given generator."""
+
+    dim = wsData.dimension
+    for word in wsData.words:
+        word.positions = list(GetPlacementTable(dim, len(word.string), word.dir).starts)
+        rng.shuffle(word.positions)
+        word.positionsIndex = (0, len(word.positions)-1)
+
+def WsInsertWordsRestarts(wsData: WsData, budget: SearchBudget=None, seed: int=0, baseNodes: int=128, shuffleWords: bool=True) -> None:
+    """Tries to insert all words running the undo algorithm many times, each one with a small node budget and a different shuffle.
+
+    The budget of the k-th run is baseNodes * Luby(k), so a run that falls in a huge failing subtree is cut early, while the growing
+    budgets keep the search complete (eventually a run is long enough to finish). Each run shuffles again the positions of every
+    word and, if shuffleWords, the order of the words (except the first run). Everything depends only on seed, so any run is reproducible.
+
+    Stops when a run finds a solution or proves there's none, or when the (optional) total budget is exhausted, leaving the deepest
+    partial insertion of all the runs in WsData.partial.
+
+    Modifies WsData.solution, WsData.status, WsData.partial and the positions of each word. Doesn't return anything."""
+    #imported here because WsMaker imports this module to register the engine
+    from Python.src.WsMaker import WsInsertWordsUndo
+
+    rng = Random(seed)
+    words = wsData.words
+    best: tuple[int, list, list] = (-1, None, None) #(words placed, partial ws, positions) of the deepest run
+
+    run = 0
+    while True:
+        run += 1
+        order = list(words)
+        if shuffleWords and run > 1:
+            rng.shuffle(order)
+        runData = WsData(wsData.dimension, order)
+        ShufflePositions(runData, rng)
+
+        limit = baseNodes * Luby(run)
+        if budget is not None and budget.maxNodes is not None:
+            limit = min(limit, budget.maxNodes - budget.nodes)
+        runBudget = SearchBudget(budget.deadline if budget is not None else None, limit)
+
+        WsInsertWordsUndo(runData, runBudget)
+        if budget is not None:
+            budget.nodes += runBudget.nodes
+
+        if runData.status != SolveStatus.BUDGET_EXCEEDED:
+            #solved or proven impossible, in both cases the words have their final position (or None)
+            wsData.solution = runData.solution
+            wsData.status = runData.status
+            wsData.partial = None
+            return
+
+        placed = sum(word.position is not None for word in words)
+        if placed > best[0]:
+            best = (placed, runData.partial, [word.position for word in words])
+
+        #the run was cut by its own limit, unless the deadline passed or there's no nodes left in the total budget
+        if budget is not None:
+            if ((budget.deadline is not None and monotonic() >= budget.deadline) or
+            (budget.maxNodes is not None and budget.nodes >= budget.maxNodes)):
+                budget.exhausted = True
+                break
+
+    wsData.solution = None
+    wsData.status = SolveStatus.BUDGET_EXCEEDED
+    wsData.partial = best[1]
+    for word, position in zip(words, best[2]):
+        word.position = position
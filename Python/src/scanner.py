@@ -0,0 +1,238 @@
+import argparse #command line arguments of the verification mode
+from bisect import bisect_right
+from collections import deque
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from functools import lru_cache #one scan order per dimension
+from operator import itemgetter
+from typing import IO, NamedTuple
+from Python.src.data import WsData, Direction, ws
+from Python.src.wire import WireReader, WIRE_EXTENSION
+
+SEPARATOR: str = "\n"
+"""Char between the lines of a scan (and in the empty cells), which no word contains, so no match crosses from one line to another."""
+
+class Hit(NamedTuple):
+    """An occurrence of a word in a word search."""
+    word: str
+    position: tuple[int, int]
+    """(x,y) of the first char, same as Word.position."""
+    dir: Direction
+
+class ScanOrder(NamedTuple):
+    """Order in which the cells of a word search are scanned: every line of each Direction, one after another."""
+    getter: itemgetter
+    """Returns the chars of a flat word search (see FlatCells) in the scan order."""
+    cells: tuple[int, ...]
+    """Flat (row-major) index of the cell at each position of the scan (dimension * dimension for the separators)."""
+    starts: tuple[int, ...]
+    """Position of the scan where each Direction starts (in the order of Direction)."""
+
+@lru_cache(maxsize=None)
+def GetScanOrder(dimension: int) -> ScanOrder:
+    """Returns the (cached) ScanOrder of a dimension x dimension word search: for each Direction, every line that starts at a
+    cell whose previous one in that direction is outside the word search, followed by a separator."""
+
+    cells = []
+    starts = []
+    for direction in Direction:
+        starts.append(len(cells))
+        dx, dy = direction.value
+        for y in range(dimension):
+            for x in range(dimension):
+                if 0 <= x - dx < dimension and 0 <= y - dy < dimension:
+                    continue #not the first cell of its line
+                cx, cy = x, y
+                while 0 <= cx < dimension and 0 <= cy < dimension:
+                    cells.append(cy * dimension + cx)
+                    cx, cy = cx + dx, cy + dy
+                cells.append(dimension * dimension)
+
+    return ScanOrder(itemgetter(*cells), tuple(cells), tuple(starts))
+
+def FlatCells(grid: ws | str) -> tuple[str, int]:
+    """Returns the chars of a word search (a ws, or its text with a line per row, see WsToText) in a single str, row by row,
+    with a SEPARATOR in each empty cell and another one at the end, and its dimension. Raises ValueError if it isn't square."""
+
+    if isinstance(grid, str):
+        grid = grid.rstrip("\n")
+        dimension = grid.find("\n") if "\n" in grid else len(grid)
+        flat = grid.replace("\n", "")
+    else:
+        dimension = len(grid)
+        flat = "".join([c or SEPARATOR for line in grid for c in line])
+    if len(flat) != dimension * dimension:
+        raise ValueError("The word search isn't square")
+    return flat + SEPARATOR, dimension
+
+class GridScanner:
+    """
+    Aho-Corasick automaton of a list of words (or a whole lexicon), to find all of them in a word search in a single pass.
+
+    States are integers (the root is 0): goto[state] maps each char to the next state, fail[state] is the state of the longest
+    proper suffix that's also a prefix of some word, and outputs[state] are the indexes of the words that end there (including the
+    ones ending in its suffixes). Missing transitions are completed lazily, the first time they're needed, so the scan never
+    follows the fail links twice for the same (state, char) and only the transitions actually used take memory.
+    """
+
+    def __init__(self, words: Iterable[str]):
+        self.words: list[str] = []
+        """Distinct words of the automaton, by index."""
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._outputs: list[tuple[int, ...]] = [()]
+
+        added: dict[str, int] = {}
+        for word in words:
+            if not word or word in added:
+                continue
+            if SEPARATOR in word:
+                raise ValueError(f"Words can't contain the separator: {word!r}")
+            added[word] = len(self.words)
+            self.words.append(word)
+
+            state = 0
+            for c in word:
+                child = self._goto[state].get(c)
+                if child is None:
+                    child = len(self._goto)
+                    self._goto[state][c] = child
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._outputs.append(())
+                state = child
+            self._outputs[state] = (added[word],)
+
+        #fail links in breadth first order, so the fail state (shallower) of each state is always computed before it
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for c, child in self._goto[state].items():
+                queue.append(child)
+                fail = self._fail[state]
+                while fail and c not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(c, 0) if state else 0
+                self._outputs[child] += self._outputs[self._fail[child]]
+
+    @classmethod
+    def FromFile(cls, lexiconFile: IO) -> "GridScanner":
+        """Returns the scanner of a lexicon file (one word per line, in any order)."""
+
+        return cls(cleanLine for line in lexiconFile if (cleanLine := line.strip()))
+
+    def _Next(self, state: int, c: str) -> int:
+        """Returns the state after state reading c, following the fail links, and saves it as a transition of state."""
+
+        fail = state
+        while (nextState := self._goto[fail].get(c)) is None and fail:
+            fail = self._fail[fail]
+        nextState = nextState or 0
+        self._goto[state][c] = nextState
+        return nextState
+
+    def ScanText(self, text: str) -> Iterator[tuple[int, int]]:
+        """Yields (end, word index) for every occurrence of a word in text, end being the index of its last char."""
+
+        goto, outputs, Next = self._goto, self._outputs, self._Next
+        state = 0
+        for end, c in enumerate(text):
+            nextState = goto[state].get(c)
+            state = nextState if nextState is not None else Next(state, c)
+            if outputs[state]:
+                for wordIdx in outputs[state]:
+                    yield end, wordIdx
+
+    def Scan(self, grid: ws | str) -> list[Hit]:
+        """Returns every occurrence (Hit) of the words in a word search (a ws, filled or not, or its text), in the 8 directions.
+
+        All the lines of every direction are scanned in a single pass (see GetScanOrder). A palindrome is found twice, once in each
+        direction, and a word inside another one (or inside itself) is found in every place it appears."""
+
+        flat, dimension = FlatCells(grid)
+        order = GetScanOrder(dimension)
+        text = "".join(order.getter(flat))
+
+        hits = []
+        for end, wordIdx in self.ScanText(text):
+            word = self.words[wordIdx]
+            cell = order.cells[end - len(word) + 1]
+            hits.append(Hit(word, (cell % dimension, cell // dimension), Direction[bisect_right(order.starts, end) - 1]))
+        return hits
+
+CANONICAL_DIRECTIONS: frozenset[Direction] = frozenset((Direction.RIGHT, Direction.DOWN, Direction.RIGHTDOWN, Direction.RIGHTUP))
+"""One direction of each axis: a palindrome is counted once, by its hit in one of these (see ScanReport.counts)."""
+
+@dataclass
+class ScanReport:
+    """Dataclass with the result of verifying a word search (see VerifyWs)."""
+
+    counts: dict[str, int] = field(default_factory=dict)
+    """Occurrences of each word. The two hits of a palindrome in the same cells count once."""
+    misplaced: list[str] = field(default_factory=list)
+    """Words with a Word.position that aren't found there in their direction."""
+    hits: list[Hit] = field(default_factory=list)
+    """Every occurrence found."""
+
+    @property
+    def missing(self) -> list[str]:
+        """Words that don't appear."""
+        return [word for word, count in self.counts.items() if not count]
+
+    @property
+    def repeated(self) -> list[str]:
+        """Words that appear more than once (e.g. the random letters wrote them again)."""
+        return [word for word, count in self.counts.items() if count > 1]
+
+    @property
+    def ok(self) -> bool:
+        """True if every word appears exactly once (and where it was placed)."""
+        return not self.misplaced and all(count == 1 for count in self.counts.values())
+
+def VerifyWs(grid: ws | str, words: Iterable[str], scanner: GridScanner=None, positions: dict[str, tuple]=None) -> ScanReport:
+    """Checks that every word appears exactly once in a word search (a ws or its text), e.g. after filling it (see FillChars).
+
+    The scanner must contain the words (it's built from them if None), so the same one can verify many word searches. If positions
+    maps words to their (Word.position, Word.dir), each one must also be found there. Returns a ScanReport."""
+
+    scanner = scanner if scanner is not None else GridScanner(words)
+    report = ScanReport({word: 0 for word in words}, hits=scanner.Scan(grid))
+    for hit in report.hits:
+        if hit.word not in report.counts:
+            continue
+        #a palindrome is found in both directions of an axis (and a single char in all of them), so only one hit counts
+        if hit.word == hit.word[::-1] and (hit.dir not in CANONICAL_DIRECTIONS or (len(hit.word) == 1 and hit.dir != Direction.RIGHT)):
+            continue
+        report.counts[hit.word] += 1
+
+    if positions:
+        found = {(hit.word, hit.position, hit.dir) for hit in report.hits}
+        report.misplaced = [word for word, (position, direction) in positions.items() if (word, position, direction) not in found]
+    return report
+
+def VerifyWsData(wsData: WsData, scanner: GridScanner=None) -> ScanReport:
+    """Same as VerifyWs with the words (and their Word.position, if set) and the solution of a WsData."""
+
+    positions = {word.string: (word.position, word.dir) for word in wsData.words if word.position is not None}
+    return VerifyWs(wsData.solution, [word.string for word in wsData.words], scanner, positions)
+
+def Main(argv: list[str]=None) -> int:
+    """Verifies the puzzles of wire files from the command line. Returns the exit code (0 if every puzzle is right)."""
+
+    parser = argparse.ArgumentParser(prog="python3 -m Python.scanner",
+                                     description="Checks that every word of each puzzle appears exactly once, where it was placed.")
+    parser.add_argument("inputs", nargs="+", help=f"wire files ({WIRE_EXTENSION}) with the puzzles, e.g. from the batch mode")
+    args = parser.parse_args(argv)
+
+    checked = wrong = 0
+    for path in args.inputs:
+        with WireReader(path) as reader:
+            for i, wsData in enumerate(reader):
+                report = VerifyWsData(wsData)
+                checked += 1
+                if not report.ok:
+                    wrong += 1
+                    print(f"{path}#{i}: missing {report.missing}, repeated {report.repeated}, misplaced {report.misplaced}")
+
+    print(f"Checked: {checked}. Wrong: {wrong}.")
+    return 0 if not wrong else 1
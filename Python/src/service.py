@@ -0,0 +1,383 @@
+import argparse #command line arguments of the service
+import asyncio #the front end serves every connection in a single thread, the puzzles are generated in the pool
+import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor #pool of worker processes, each one keeps the lexicon and tables warm
+from dataclasses import dataclass, field
+from os import cpu_count, getpid
+from Python.src.data import WsData, Direction, SolveStatus
+from Python.src.lexicon import OpenLexicon
+from Python.src.parser import ParseWordLine
+from Python.src.placements import GetPlacementTable
+from Python.src.wire import DIRECTION_INDEX
+from Python.src.batch import BatchJob, BatchResult, InitWorker, GeneratePuzzle
+from Python.src.WsMaker import BUDGET_ENGINES
+from Python.src.utils import WrongWSDataFormat
+
+SERVICE_ENGINES: tuple[str, ...] = BUDGET_ENGINES
+"""Engines a request can ask for: only the ones that stop at the deadline, an engine without a budget would keep its worker
+busy after the request is answered 504 (and portfolio would start its own processes inside a worker)."""
+
+MAX_DIMENSION: int = 500
+"""Biggest dimension accepted."""
+
+MAX_BODY: int = 1024 * 1024
+"""Biggest request body accepted (bytes)."""
+
+DEFAULT_TIMEOUT: float = 5.0
+"""Seconds a request can take, from when it's received, if it doesn't set a shorter timeout."""
+
+WARM_DIMENSION: int = 20
+"""Each worker computes the placement tables up to this dimension when it starts, so the first small requests don't pay for them."""
+
+LATENCY_SAMPLES: int = 1024
+"""Number of recent latencies kept for the percentiles of /stats."""
+
+HTTP_REASONS: dict[int, str] = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+                                413: "Payload Too Large", 422: "Unprocessable Entity", 500: "Internal Server Error", 503: "Service Unavailable",
+                                504: "Gateway Timeout"}
+"""Reason phrase of each HTTP status the service answers with."""
+
+class ServiceError(Exception):
+    """Exception with the HTTP status and message of a request that can't be served."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        """HTTP status of the response."""
+
+@dataclass
+class ServiceStats:
+    """Dataclass with the counters of the service, served by /stats."""
+
+    requests: int = field(default=0)
+    """Generation requests received."""
+    solved: int = field(default=0)
+    """Puzzles generated."""
+    failed: int = field(default=0)
+    """Requests without puzzle (no solution or rejected input)."""
+    badRequests: int = field(default=0)
+    """Requests wrongly formatted."""
+    busy: int = field(default=0)
+    """Requests rejected because every slot of the pool was taken (backpressure)."""
+    timeouts: int = field(default=0)
+    """Requests that reached their deadline."""
+    cacheHits: int = field(default=0)
+    """Requests answered by the result cache."""
+    errors: int = field(default=0)
+    """Requests that raised an unexpected exception (e.g. a worker died), answered 500."""
+    latencies: deque = field(default_factory=lambda: deque(maxlen=LATENCY_SAMPLES))
+    """Seconds of the most recent generation requests."""
+
+    def Percentile(self, p: float) -> float | None:
+        """Returns the p (0 to 1) percentile of the recent latencies in milliseconds, or None if there aren't any."""
+
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(p * len(ordered)))] * 1000
+
+    def ToDict(self, inFlight: int=0) -> dict:
+        """Returns the counters and latency percentiles as a dict of plain values."""
+
+        return {"requests": self.requests, "solved": self.solved, "failed": self.failed, "badRequests": self.badRequests,
+                "busy": self.busy, "timeouts": self.timeouts, "cacheHits": self.cacheHits, "errors": self.errors,
+                "inFlight": inFlight, "p50Ms": self.Percentile(0.5), "p90Ms": self.Percentile(0.9), "p99Ms": self.Percentile(0.99)}
+
+def WarmWorker(maxDimension: int=WARM_DIMENSION) -> int:
+    """Computes every placement table up to maxDimension in a worker process. Returns its number."""
+
+    count = 0
+    for dimension in range(1, maxDimension + 1):
+        for length in range(1, dimension + 1):
+            for dirIdx in range(6):
+                GetPlacementTable(dimension, length, Direction[dirIdx])
+                count += 1
+    return count
+
+def InitServiceWorker(indexPath: str, engine: str, cacheDir: str=None, warmDimension: int=WARM_DIMENSION) -> None:
+    """Initializer of each worker process of the service: the same as the batch workers (see InitWorker), and then computes the
+    placement tables (see WarmWorker), so every process is warm before it takes its first request."""
+
+    InitWorker(indexPath, engine, None, cacheDir)
+    WarmWorker(warmDimension)
+
+def RequestToWsData(request: dict) -> WsData:
+    """Returns the WsData of a generation request: {"dimension": n, "words": [{"word": str, "dir": 0..5}, ...]}.
+
+    The words are checked the same way as the lines of a wsData file (see ParseWordLine). Raises ServiceError (400) if it's wrong."""
+
+    if not isinstance(request, dict):
+        raise ServiceError(400, "The request must be a JSON object")
+
+    dimension = request.get("dimension")
+    if type(dimension) is not int or not 0 < dimension <= MAX_DIMENSION:
+        raise ServiceError(400, f"dimension must be an integer between 1 and {MAX_DIMENSION}")
+
+    words = request.get("words")
+    if not isinstance(words, list) or not words:
+        raise ServiceError(400, "words must be a non empty list")
+
+    wsData = WsData(dimension)
+    for word in words:
+        if not isinstance(word, dict) or not isinstance(word.get("word"), str) or type(word.get("dir")) is not int:
+            raise ServiceError(400, 'Each word must be {"word": str, "dir": int}')
+        try:
+            wsData.words.append(ParseWordLine(f"{word['word']} {word['dir']}"))
+        except WrongWSDataFormat as e:
+            raise ServiceError(400, str(e))
+
+    return wsData
+
+def ResultToResponse(result: BatchResult) -> tuple[int, dict]:
+    """Returns the HTTP status and body of a generated puzzle: 200 with the text and the position of each word, 504 if the deadline
+    was reached while searching and 422 if there's no puzzle (no solution or rejected input)."""
+
+    body = {"status": result.status.value if result.status is not None else None, "text": result.text,
+            "detail": result.detail, "cached": bool(result.cached), "words": None}
+    if result.text is not None:
+        body["words"] = [{"word": word.string, "dir": DIRECTION_INDEX[word.dir], "x": word.position[0], "y": word.position[1]}
+                         for word in result.wsData.words]
+        return 200, body
+    if result.status == SolveStatus.BUDGET_EXCEEDED:
+        return 504, body
+    return 422, body
+
+class GenerationService:
+    """
+    Resident generation service: an asyncio HTTP/1.1 front end (localhost TCP or a Unix socket) that dispatches each request to a
+    pool of worker processes, where the lexicon index is mapped once and the placement tables stay cached between requests.
+
+    Endpoints: POST /generate (see RequestToWsData, with optional "seed", "engine" and "timeout" seconds) and GET /stats.
+
+    - Backpressure: at most maxPending requests are dispatched at once (running or waiting for a worker). Any other one is
+      answered 503 at once, so a burst can't pile up work that would miss its deadline anyway.
+    - Deadlines: each request has until its timeout (capped by the service timeout), counted from when it's received. The rest is
+      given to the engine as a SearchBudget (only SERVICE_ENGINES), and the front end stops waiting at the deadline (504). A request
+      still waiting for a worker is cancelled then, and one already running keeps its slot until its worker finishes, so the
+      requests answered 504 still count for the backpressure.
+    """
+
+    def __init__(self, lexiconPath: str, indexPath: str=None, engine: str="undo", workers: int=None, maxPending: int=None,
+                 timeout: float=DEFAULT_TIMEOUT, cacheDir: str=None):
+        self.lexiconPath = lexiconPath
+        """Lexicon used to validate the words (compiled to indexPath, see OpenLexicon)."""
+        self.indexPath = indexPath
+        """Compiled lexicon mapped by every worker (None for the default next to the lexicon)."""
+        self.engine = engine
+        """Engine of the requests that don't set one."""
+        self.workers = workers or cpu_count() or 1
+        """Worker processes."""
+        self.maxPending = maxPending if maxPending is not None else 4 * self.workers
+        """Requests dispatched to the pool at once, the rest are answered 503."""
+        self.timeout = timeout
+        """Maximum (and default) seconds per request."""
+        self.cacheDir = cacheDir
+        """Directory of the results cache of the workers (see ResultCache), or None for no cache."""
+        self.stats = ServiceStats()
+        """Counters of the service."""
+        self.address = None
+        """Address the service listens on (host and port, or the Unix socket path)."""
+        self.inFlight = 0
+        self._executor: ProcessPoolExecutor = None
+        self._server: asyncio.AbstractServer = None
+        self._connections: dict[asyncio.StreamWriter, asyncio.Task] = {}
+        self._requests = 0
+
+    async def Start(self, host: str="127.0.0.1", port: int=8080, unixPath: str=None) -> None:
+        """Compiles the lexicon if needed, starts the workers (each one warms up in its initializer, see InitServiceWorker) and starts
+        listening (on unixPath if given, otherwise on host:port, 0 for any free port)."""
+
+        lexicon = OpenLexicon(self.lexiconPath, self.indexPath)
+        lexicon.Close() #the workers map it on their own
+        self._executor = ProcessPoolExecutor(self.workers, initializer=InitServiceWorker,
+                                             initargs=(lexicon.path, self.engine, self.cacheDir))
+        await asyncio.get_running_loop().run_in_executor(self._executor, getpid) #waits for a worker to be started and warm
+
+        if unixPath is not None:
+            self._server = await asyncio.start_unix_server(self.HandleConnection, unixPath)
+            self.address = unixPath
+        else:
+            self._server = await asyncio.start_server(self.HandleConnection, host, port)
+            self.address = self._server.sockets[0].getsockname()[:2]
+
+    async def Close(self) -> None:
+        """Stops listening, closes the open connections and shuts the pool down."""
+
+        if self._server is not None:
+            self._server.close()
+            handlers = list(self._connections.values())
+            for writer in list(self._connections):
+                writer.close() #their handlers read the end of the stream and finish
+            await asyncio.gather(*handlers, return_exceptions=True)
+            await self._server.wait_closed()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+
+    async def Generate(self, request: dict) -> tuple[int, dict]:
+        """Serves a generation request. Returns the HTTP status and body (see ResultToResponse), or raises ServiceError."""
+
+        start = asyncio.get_running_loop().time()
+        self.stats.requests += 1
+        try:
+            wsData = RequestToWsData(request)
+            seed = request.get("seed", 0)
+            engine = request.get("engine", self.engine)
+            timeout = request.get("timeout", self.timeout)
+            if type(seed) is not int:
+                raise ServiceError(400, "seed must be an integer")
+            if engine not in SERVICE_ENGINES:
+                raise ServiceError(400, f"engine must be one of: {', '.join(SERVICE_ENGINES)}")
+            if type(timeout) not in (int, float) or timeout <= 0:
+                raise ServiceError(400, "timeout must be a positive number of seconds")
+        except ServiceError:
+            self.stats.badRequests += 1
+            raise
+
+        if self.inFlight >= self.maxPending:
+            self.stats.busy += 1
+            raise ServiceError(503, "Too many requests in progress, try again later")
+
+        self._requests += 1
+        job = BatchJob("request", self._requests, seed, wsData)
+        deadline = start + min(timeout, self.timeout)
+        loop = asyncio.get_running_loop()
+        #the slot is released when the job finishes or is cancelled, not when the request is answered
+        self.inFlight += 1
+        task = self._executor.submit(GeneratePuzzle, job, None, engine, deadline - loop.time())
+        future = asyncio.wrap_future(task)
+        future.add_done_callback(self._Release)
+        try:
+            result = await asyncio.wait_for(asyncio.shield(future), max(0, deadline - loop.time()))
+        except asyncio.TimeoutError:
+            task.cancel() #only if it's still waiting for a worker
+            self.stats.timeouts += 1
+            raise ServiceError(504, "The deadline was reached before the puzzle was generated")
+
+        status, body = ResultToResponse(result)
+        if status == 200:
+            self.stats.solved += 1
+        elif status == 504:
+            self.stats.timeouts += 1
+        else:
+            self.stats.failed += 1
+        self.stats.cacheHits += bool(result.cached)
+        self.stats.latencies.append(loop.time() - start)
+        return status, body
+
+    def _Release(self, future: asyncio.Future) -> None:
+        """Frees the slot of a finished (or cancelled) job."""
+
+        self.inFlight -= 1
+        if not future.cancelled():
+            future.exception() #retrieved, so a job whose request was already answered doesn't log it
+
+    async def Route(self, method: str, path: str, body: bytes) -> tuple[int, dict]:
+        """Returns the HTTP status and body of a request, or raises ServiceError."""
+
+        if path == "/generate":
+            if method != "POST":
+                raise ServiceError(405, "Use POST /generate")
+            try:
+                request = json.loads(body)
+            except (ValueError, UnicodeDecodeError):
+                self.stats.badRequests += 1
+                raise ServiceError(400, "The body must be JSON")
+            return await self.Generate(request)
+        if path == "/stats":
+            if method != "GET":
+                raise ServiceError(405, "Use GET /stats")
+            return 200, self.stats.ToDict(self.inFlight)
+        raise ServiceError(404, f"Unknown path {path}")
+
+    async def HandleConnection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serves the requests of a connection, one after the other (keep-alive) until the client closes it or asks to."""
+
+        self._connections[writer] = asyncio.current_task()
+        try:
+            while True:
+                try:
+                    requestLine = await reader.readline()
+                    if not requestLine:
+                        break
+                    method, path, version = requestLine.decode("latin-1").split()
+                    headers = {}
+                    while (line := (await reader.readline()).decode("latin-1").strip()):
+                        name, _, value = line.partition(":")
+                        headers[name.strip().lower()] = value.strip()
+                except ValueError:
+                    writer.write(HttpResponse(400, {"error": "Malformed HTTP request"}, False))
+                    break
+
+                keepAlive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+                body = None
+                try:
+                    try:
+                        length = int(headers.get("content-length", 0))
+                    except ValueError:
+                        raise ServiceError(400, "Wrong Content-Length")
+                    if not 0 <= length <= MAX_BODY:
+                        raise ServiceError(413, f"The body can't be longer than {MAX_BODY} bytes")
+                    body = await reader.readexactly(length)
+                    status, response = await self.Route(method, path.split("?")[0], body)
+                except ServiceError as e:
+                    status, response = e.status, {"error": str(e)}
+                    keepAlive = keepAlive and body is not None #the body wasn't read
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    raise
+                except Exception as e:
+                    #e.g. the worker raised or the pool broke, the client still gets an answer
+                    self.stats.errors += 1
+                    status, response = 500, {"error": f"{type(e).__name__}: {e}"}
+
+                writer.write(HttpResponse(status, response, keepAlive))
+                await writer.drain()
+                if not keepAlive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass #the client went away
+        finally:
+            self._connections.pop(writer, None)
+            writer.close()
+
+def HttpResponse(status: int, body: dict, keepAlive: bool=True) -> bytes:
+    """Returns the bytes of an HTTP/1.1 response with a JSON body."""
+
+    payload = json.dumps(body).encode("utf-8")
+    headers = (f"HTTP/1.1 {status} {HTTP_REASONS[status]}\r\nContent-Type: application/json\r\n"
+               f"Content-Length: {len(payload)}\r\nConnection: {'keep-alive' if keepAlive else 'close'}\r\n\r\n")
+    return headers.encode("latin-1") + payload
+
+async def Serve(service: GenerationService, host: str, port: int, unixPath: str=None) -> None:
+    """Starts the service and serves until it's cancelled (e.g. Ctrl+C)."""
+
+    await service.Start(host, port, unixPath)
+    print(f"Serving on {service.address} with {service.workers} workers.", flush=True)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await service.Close()
+
+def Main(argv: list[str]=None) -> int:
+    """Runs the service from the command line. Returns the exit code."""
+
+    parser = argparse.ArgumentParser(prog="python3 -m Python.service",
+                                     description="Serves word search generation requests over HTTP (localhost or a Unix socket).")
+    parser.add_argument("-l", "--lexicon", required=True, help="lexicon file used to validate the words")
+    parser.add_argument("-i", "--index", default=None, help="compiled lexicon index (default: lexicon path + .idx)")
+    parser.add_argument("-H", "--host", default="127.0.0.1", help="address to listen on (default 127.0.0.1)")
+    parser.add_argument("-p", "--port", type=int, default=8080, help="port to listen on (default 8080)")
+    parser.add_argument("-u", "--unix", default=None, help="Unix socket path to listen on instead of host:port")
+    parser.add_argument("-e", "--engine", default="undo", choices=list(SERVICE_ENGINES), help="default engine (default undo)")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="worker processes (default one per CPU)")
+    parser.add_argument("-q", "--pending", type=int, default=None, help="requests dispatched at once, the rest get 503 (default 4 per worker)")
+    parser.add_argument("-t", "--timeout", type=float, default=DEFAULT_TIMEOUT, help=f"maximum seconds per request (default {DEFAULT_TIMEOUT})")
+    parser.add_argument("-c", "--cache", default=None, help="directory to cache the results")
+    args = parser.parse_args(argv)
+
+    service = GenerationService(args.lexicon, args.index, args.engine, args.workers, args.pending, args.timeout, args.cache)
+    try:
+        asyncio.run(Serve(service, args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+    return 0
@@ -0,0 +1,232 @@
+from Python.src.data import WsData, SolveStatus
+from Python.src.grid import Grid, EMPTY, ENCODING
+from Python.src.placements import PlacementCells
+from Python.src.stats import SolverStats
+
+def WordsOrderMCV(wsData: WsData) -> list[int]:
+    """Returns the indexes of WsData.words in most-constrained-first order.
+
+    Longest words go first (they have the fewest placements and block the most cells), breaking ties by the number of
+    legal positions (fewest first). Word.positions must be already generated (see WordsPositions)."""
+
+    words = wsData.words
+    return sorted(range(len(words)), key=lambda i: (-len(words[i].string), len(words[i].positions)))
+
+def WsInsertWordsMCV(wsData: WsData, stats: SolverStats=None) -> None:
+    """Tries to insert all words into an empty word search, placing the most constrained words first and using forward checking.
+
+    After each insertion, every candidate position of the remaining words that conflicts with the new chars is discarded.
+    If any remaining word runs out of candidates, the insertion is undone right away instead of finding out when we reach that word.
+    If stats is given, each candidate placed is an attempt (rejected if forward checking undoes it).
+
+    Modifies WsData.solution (None if there's no solution), WsData.status and Word.position of each word. Doesn't return anything."""
+    #each word keeps its list of candidates (Word.positions, already shuffled), and a flag per candidate that tells in which depth
+    #it was discarded (0 if it's alive). Every discarded candidate is saved in a trail per depth, so backtracking revives them.
+    #as every alive candidate is compatible with the ws, placing one of them always succeeds
+
+    dim = wsData.dimension
+    words = wsData.words
+    wordsNum = len(words)
+    grid = Grid(dim)
+    cells = grid.cells
+
+    wordBytes = [word.string.encode(ENCODING) for word in words]
+    candidates = [[PlacementCells(dim, len(word.string), word.dir, position) for position in word.positions] for word in words]
+
+    #cover[j] maps each cell to the (candidate, char) pairs of word j that write on it
+    cover: list[dict[int, list[tuple[int, int]]]] = []
+    for j in range(wordsNum):
+        coverJ = {}
+        for cid, placement in enumerate(candidates[j]):
+            for cell, c in zip(placement, wordBytes[j]):
+                coverJ.setdefault(cell, []).append((cid, c))
+        cover.append(coverJ)
+
+    killedAt = [[0] * len(candidates[j]) for j in range(wordsNum)]
+    aliveCount = [len(candidates[j]) for j in range(wordsNum)]
+
+    order = WordsOrderMCV(wsData)
+    cursor = [0] * (wordsNum + 1)
+    chosen = [None] * wordsNum #chosen candidate of each word (by word index)
+    written: list[list[int]] = [None] * wordsNum #cells written at each depth
+    trail: list[list[tuple[int, int]]] = [None] * wordsNum #candidates discarded at each depth
+
+    def Undo(depth: int) -> None:
+        grid.RemoveWord(written[depth])
+        for j, cid in trail[depth]:
+            killedAt[j][cid] = 0
+            aliveCount[j] += 1
+        written[depth] = trail[depth] = None
+
+    if stats is not None:
+        stats.Start(wordsNum)
+
+    d = 0
+    solution = False
+    final = not all(aliveCount) #a word that doesn't fit in an empty ws makes it impossible from the start
+    while (not final and not solution):
+        if d == wordsNum:
+            solution = True
+            continue
+
+        j = order[d]
+        cid = cursor[d]
+        killedJ = killedAt[j]
+        while cid < len(killedJ) and killedJ[cid]:
+            cid += 1
+
+        #no alive candidates left for this word, so we go back and undo the previous word
+        if cid >= len(killedJ):
+            if d > 0:
+                if stats is not None:
+                    stats.Backtrack(j, words[j])
+                d -= 1
+                Undo(d)
+                chosen[order[d]] = None
+            else:
+                final = True
+            continue
+
+        cursor[d] = cid + 1
+
+        placedCells = []
+        for cell, c in zip(candidates[j][cid], wordBytes[j]):
+            if cells[cell] == EMPTY:
+                cells[cell] = c
+                placedCells.append(cell)
+
+        #forward checking: discard the candidates of the remaining words that conflict with the new chars
+        discarded = []
+        wipeout = False
+        for k in order[d+1:]:
+            coverK = cover[k]
+            killedK = killedAt[k]
+            for cell in placedCells:
+                c = cells[cell]
+                for kid, kc in coverK.get(cell, ()):
+                    if kc != c and not killedK[kid]:
+                        killedK[kid] = d + 1
+                        aliveCount[k] -= 1
+                        discarded.append((k, kid))
+            if not aliveCount[k]:
+                wipeout = True
+                break
+
+        written[d] = placedCells
+        trail[d] = discarded
+        if stats is not None:
+            stats.Tried(j, words[j], not wipeout)
+        if wipeout:
+            Undo(d) #we try the next candidate of the same word
+        else:
+            chosen[j] = cid
+            d += 1
+            cursor[d] = 0
+
+    if solution:
+        wsData.solution = grid.ToWs()
+        wsData.status = SolveStatus.SOLVED
+        for j, word in enumerate(words):
+            word.position = word.positions[chosen[j]]
+    else:
+        wsData.solution = None
+        wsData.status = SolveStatus.NO_SOLUTION
+    if stats is not None:
+        stats.Finish(wsData)
+
+def PlacementMasks(placement: range, wordBytes: bytes) -> tuple[int, tuple[tuple[int, int], ...]]:
+    """Encodes a placement as bitsets of cells (bit i is the flat index i of the ws).
+
+    Returns (mask, needs), where mask contains all the covered cells and needs is a tuple of (char, mask) with the cells
+    where each distinct char of the word is written."""
+
+    mask = 0
+    needs: dict[int, int] = {}
+    for cell, c in zip(placement, wordBytes):
+        bit = 1 << cell
+        mask |= bit
+        needs[c] = needs.get(c, 0) | bit
+
+    return (mask, tuple(needs.items()))
+
+def WsInsertWordsBitset(wsData: WsData, stats: SolverStats=None) -> None:
+    """Tries to insert all words into an empty word search, same search order as WsInsertWordsUndo but checking each position with bitsets.
+
+    The ws is represented by an occupancy bitset plus one bitset per char. A position fits if, for each char of the word, none of its
+    cells is occupied by a different char, which is one AND per distinct char instead of a loop over every char.
+    If stats is given, it counts the same attempts and backtracks as WsInsertWordsUndo.
+
+    Modifies WsData.solution (None if there's no solution), WsData.status and Word.position of each word. Doesn't return anything."""
+    #as ints are immutable, saving the state before each insertion is just saving the references (no copies), so backtracking
+    #restores the previous occupancy and char bitsets directly
+
+    dim = wsData.dimension
+    words = wsData.words
+    wordsNum = len(words)
+
+    candidates = []
+    for word in words:
+        wordBytes = word.string.encode(ENCODING)
+        candidates.append([PlacementMasks(PlacementCells(dim, len(wordBytes), word.dir, position), wordBytes)
+                           for position in word.positions])
+
+    occupied = 0
+    letters: dict[int, int] = {}
+    saved: list[tuple[int, dict[int, int]]] = [None] * wordsNum #state before the insertion of each word
+    cursor = [0] * wordsNum
+
+    if stats is not None:
+        stats.Start(wordsNum)
+
+    i = 0
+    solution = wordsNum == 0
+    final = False
+    while (not final and not solution):
+        candidatesI = candidates[i]
+        cid = cursor[i]
+        #we look for the first position that fits, with the same order as the other engines
+        while cid < len(candidatesI):
+            mask, needs = candidatesI[cid]
+            if all(not (needMask & (occupied ^ letters.get(c, 0))) for c, needMask in needs):
+                break
+            if stats is not None:
+                stats.Tried(i, words[i], False)
+            cid += 1
+
+        if cid >= len(candidatesI):
+            if i > 0:
+                if stats is not None:
+                    stats.Backtrack(i, words[i])
+                cursor[i] = 0
+                i -= 1
+                occupied, letters = saved[i] #undo the previous word, which will try its next position
+            else:
+                final = True
+            continue
+
+        if stats is not None:
+            stats.Tried(i, words[i], True)
+        cursor[i] = cid + 1
+        saved[i] = (occupied, letters)
+        letters = letters.copy() #only copies the references of at most one int per char
+        occupied |= mask
+        for c, needMask in needs:
+            letters[c] = letters.get(c, 0) | needMask
+
+        if i >= wordsNum-1:
+            solution = True
+        else:
+            i += 1
+
+    if solution:
+        grid = Grid(dim)
+        for word, cid in zip(words, cursor):
+            word.position = word.positions[cid-1]
+            grid.PlaceWord(word.string, word.dir, word.position)
+        wsData.solution = grid.ToWs()
+        wsData.status = SolveStatus.SOLVED
+    else:
+        wsData.solution = None
+        wsData.status = SolveStatus.NO_SOLUTION
+    if stats is not None:
+        stats.Finish(wsData)
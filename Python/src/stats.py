@@ -0,0 +1,111 @@
+from enum import Enum
+from typing import Callable
+from Python.src.data import WsData, Word
+
+class SolverEvent(Enum):
+    """Enum with the events of the search reported to the SolverStats hook."""
+    PLACED = "placed"
+    REJECTED = "rejected"
+    BACKTRACK = "backtrack"
+    FINISHED = "finished"
+
+SolverHook = Callable[[SolverEvent, int, Word], None]
+"""Function called with each event, the depth (index of the word in WsData.words) and the word. FINISHED has depth -1 and no word."""
+
+class SolverStats:
+    """
+    Counters of a search, filled by the engines that support it (see STATS_ENGINES in WsMaker) when given one.
+
+    Without a SolverStats the engines only pay a None check per node (the same as a SearchBudget), and the clock is only read
+    if timing is True, so counting placements and backtracks doesn't pay for perf_counter calls.
+    """
+
+    def __init__(self, timing: bool=False, hook: SolverHook=None):
+        self.timing = timing
+        """True to measure copySeconds and checkSeconds (two clock reads per node)."""
+        self.hook = hook
+        """Function called with every event (see SolverHook), or None."""
+        self.placementsTried = 0
+        """Insertion attempts (nodes)."""
+        self.placementsAccepted = 0
+        """Attempts where the word fitted."""
+        self.backtracks: list[int] = []
+        """Backtracks from each depth: backtracks[i] is the number of times word i ran out of positions and the search went back."""
+        self.copySeconds = 0.0
+        """Time copying word searches (the copy per attempt of dp, the partial snapshots of undo with a budget)."""
+        self.checkSeconds = 0.0
+        """Time checking and writing (or erasing) the chars of the words."""
+        self.positionsIndex: list[tuple[int, int]] = []
+        """Word.positionsIndex of each word when the search ended."""
+        self.status: str = None
+        """SolveStatus value of the search."""
+        self.cacheHits = 0
+        """Requests answered by a ResultCache (see cache.py), without searching."""
+        self.cacheMisses = 0
+        """Requests looked up in a ResultCache and not found."""
+
+    def Start(self, wordsNum: int) -> None:
+        """Prepares the counters per depth for a search of wordsNum words (kept if they were already longer)."""
+
+        if len(self.backtracks) < wordsNum:
+            self.backtracks.extend([0] * (wordsNum - len(self.backtracks)))
+
+    def Tried(self, depth: int, word: Word, accepted: bool) -> None:
+        """Counts an insertion attempt of the word at depth."""
+
+        self.placementsTried += 1
+        if accepted:
+            self.placementsAccepted += 1
+        if self.hook is not None:
+            self.hook(SolverEvent.PLACED if accepted else SolverEvent.REJECTED, depth, word)
+
+    def Backtrack(self, depth: int, word: Word) -> None:
+        """Counts a backtrack from the word at depth (it ran out of positions)."""
+
+        self.backtracks[depth] += 1
+        if self.hook is not None:
+            self.hook(SolverEvent.BACKTRACK, depth, word)
+
+    def Finish(self, wsData: WsData) -> None:
+        """Saves the final positionsIndex of each word and the status of the search."""
+
+        self.positionsIndex = [word.positionsIndex for word in wsData.words]
+        self.status = wsData.status.value if wsData.status is not None else None
+        if self.hook is not None:
+            self.hook(SolverEvent.FINISHED, -1, None)
+
+    @property
+    def totalBacktracks(self) -> int:
+        """Backtracks from every depth."""
+
+        return sum(self.backtracks)
+
+    @property
+    def maxBacktrackDepth(self) -> int:
+        """Deepest word that ever backtracked, or -1 if there were no backtracks."""
+
+        return max((i for i, count in enumerate(self.backtracks) if count), default=-1)
+
+    def Merge(self, other: "SolverStats") -> None:
+        """Adds the counters and times of other (e.g. to aggregate many puzzles). positionsIndex and status are the other's."""
+
+        self.placementsTried += other.placementsTried
+        self.placementsAccepted += other.placementsAccepted
+        self.Start(len(other.backtracks))
+        for i, count in enumerate(other.backtracks):
+            self.backtracks[i] += count
+        self.copySeconds += other.copySeconds
+        self.checkSeconds += other.checkSeconds
+        self.cacheHits += other.cacheHits
+        self.cacheMisses += other.cacheMisses
+        self.positionsIndex = list(other.positionsIndex)
+        self.status = other.status
+
+    def ToDict(self) -> dict:
+        """Returns the stats as a dict of plain values, ready to export (e.g. json or a metrics system)."""
+
+        return {"placementsTried": self.placementsTried, "placementsAccepted": self.placementsAccepted,
+                "backtracks": list(self.backtracks), "totalBacktracks": self.totalBacktracks,
+                "maxBacktrackDepth": self.maxBacktrackDepth, "copySeconds": self.copySeconds, "checkSeconds": self.checkSeconds,
+                "positionsIndex": [list(index) for index in self.positionsIndex], "status": self.status,
+                "cacheHits": self.cacheHits, "cacheMisses": self.cacheMisses}
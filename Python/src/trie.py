@@ -0,0 +1,263 @@
+from collections.abc import Iterable, Iterator, Sequence
+from struct import Struct
+from typing import IO
+
+TRIE_MAGIC: bytes = b"WSTR"
+"""First bytes of every serialized trie."""
+
+TRIE_VERSION: int = 1
+"""Version of the serialized format."""
+
+TRIE_HEADER: Struct = Struct("<4sHHII")
+"""Header of a serialized trie: magic, version, reserved, number of words and number of nodes."""
+
+def WriteVarint(value: int, out: bytearray) -> None:
+    """Appends value (>= 0) to out as a LEB128 varint (7 bits per byte, the high bit means another byte follows)."""
+
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+def ReadVarint(data: bytes, pos: int) -> tuple[int, int]:
+    """Returns the varint at data[pos] and the position after it."""
+
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+class Trie(Sequence):
+    """
+    Lexicon stored as a prefix tree, so it doesn't need the words sorted (nor without duplicates) to search them.
+
+    Nodes are integers (the root is 0): children[node] maps each char to the child node, and terminal[node] is 1 if a word ends there.
+    It's also a sorted sequence of str (len, indexing, random.choice), counting the words under each node once it's built.
+    """
+
+    def __init__(self, words: Iterable[str]=()):
+        self._children: list[dict[str, int]] = [{}]
+        self._terminal = bytearray(1)
+        self._counts: list[int] = None #words under each node, with the children sorted by char (None if outdated)
+        self.words = 0
+        """Number of distinct words."""
+        for word in words:
+            self.Add(word)
+
+    @classmethod
+    def FromFile(cls, lexiconFile: IO) -> "Trie":
+        """Returns the trie of a lexicon file (one word per line, in any order)."""
+
+        return cls(cleanLine for line in lexiconFile if (cleanLine := line.strip()))
+
+    def Add(self, word: str) -> None:
+        """Adds a word (does nothing if it's already there)."""
+
+        node = 0
+        for c in word:
+            child = self._children[node].get(c)
+            if child is None:
+                child = len(self._children)
+                self._children[node][c] = child
+                self._children.append({})
+                self._terminal.append(0)
+            node = child
+
+        if not self._terminal[node]:
+            self._terminal[node] = 1
+            self.words += 1
+            self._counts = None
+
+    def _Find(self, prefix: str) -> int | None:
+        """Returns the node reached following prefix from the root, or None."""
+
+        node = 0
+        for c in prefix:
+            node = self._children[node].get(c)
+            if node is None:
+                return None
+        return node
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str):
+            return False
+        node = self._Find(word)
+        return node is not None and bool(self._terminal[node])
+
+    def HasPrefix(self, prefix: str) -> bool:
+        """Returns True if any word starts with prefix."""
+
+        return self._Find(prefix) is not None
+
+    def WithPrefix(self, prefix: str) -> Iterator[str]:
+        """Yields every word starting with prefix, sorted."""
+
+        node = self._Find(prefix)
+        if node is None:
+            return
+        self._Sort()
+
+        #depth first search with an explicit stack, children pushed in reverse so they're popped sorted
+        stack = [(node, prefix)]
+        while stack:
+            node, word = stack.pop()
+            if self._terminal[node]:
+                yield word
+            stack.extend((child, word + c) for c, child in reversed(self._children[node].items()))
+
+    def BulkContains(self, words: list[str]) -> list[bool]:
+        """Returns whether each word is in the trie (in the same order as words).
+
+        The words are searched in one sorted pass: each one starts from the deepest node it shares with the previous one,
+        so a common prefix is only followed once."""
+
+        found = [False] * len(words)
+        path = [0] #nodes of the previous word, path[i] is reached after its first i chars
+        previous = ""
+        for idx in sorted(range(len(words)), key=words.__getitem__):
+            word = words[idx]
+
+            #common prefix with the previous word (as long as that part of the path exists)
+            common = 0
+            limit = min(len(word), len(previous), len(path) - 1)
+            while common < limit and word[common] == previous[common]:
+                common += 1
+            del path[common + 1:]
+
+            node = path[-1]
+            for c in word[common:]:
+                node = self._children[node].get(c)
+                if node is None:
+                    break
+                path.append(node)
+            found[idx] = node is not None and bool(self._terminal[node])
+            previous = word
+
+        return found
+
+    def _Sort(self) -> None:
+        """Sorts the children of every node by char and counts the words under each node, if they changed since the last time."""
+
+        if self._counts is not None:
+            return
+
+        self._children = [dict(sorted(children.items())) for children in self._children]
+        counts = list(self._terminal)
+        #children are always created after their parent, so going backwards every child is counted before its parent
+        for node in reversed(range(len(self._children))):
+            for child in self._children[node].values():
+                counts[node] += counts[child]
+        self._counts = counts
+
+    def __len__(self) -> int:
+        return self.words
+
+    def __getitem__(self, i: int) -> str:
+        """Returns the i-th word in sorted order, following the counts from the root (no list of words is kept)."""
+
+        if i < 0:
+            i += self.words
+        if not 0 <= i < self.words:
+            raise IndexError("trie index out of range")
+        self._Sort()
+
+        node, chars = 0, []
+        while True:
+            if self._terminal[node]:
+                if i == 0:
+                    return "".join(chars)
+                i -= 1
+            for c, child in self._children[node].items():
+                if i < self._counts[child]:
+                    chars.append(c)
+                    node = child
+                    break
+                i -= self._counts[child]
+
+    def __iter__(self) -> Iterator[str]:
+        return self.WithPrefix("")
+
+    def Serialize(self) -> bytes:
+        """Returns the compact binary form of the trie: the header and then the nodes in preorder, each one as a varint
+        (children << 1 | terminal) followed by the code point (varint) of each child before its subtree."""
+
+        self._Sort()
+        out = bytearray(TRIE_HEADER.pack(TRIE_MAGIC, TRIE_VERSION, 0, self.words, len(self._children)))
+
+        stack = [0]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                WriteVarint(ord(item), out)
+                continue
+            children = self._children[item]
+            WriteVarint(len(children) << 1 | self._terminal[item], out)
+            for c, child in reversed(children.items()):
+                stack.append(child)
+                stack.append(c)
+
+        return bytes(out)
+
+    @classmethod
+    def Deserialize(cls, data: bytes) -> "Trie":
+        """Returns the trie of its binary form (see Serialize). Raises ValueError if data isn't a serialized trie."""
+
+        if len(data) < TRIE_HEADER.size:
+            raise ValueError("Not a serialized trie")
+        magic, version, reserved, words, nodes = TRIE_HEADER.unpack_from(data, 0)
+        if magic != TRIE_MAGIC or version != TRIE_VERSION:
+            raise ValueError(f"Not a serialized trie (version {TRIE_VERSION})")
+
+        trie = cls()
+        trie._children = []
+        trie._terminal = bytearray()
+        try:
+            trie._ReadNodes(data, TRIE_HEADER.size)
+        except IndexError:
+            raise ValueError("Corrupted serialized trie") from None
+
+        if len(trie._children) != nodes or sum(trie._terminal) != words:
+            raise ValueError("Corrupted serialized trie")
+        trie.words = words
+        trie._Sort()
+        return trie
+
+    def _ReadNodes(self, data: bytes, pos: int) -> None:
+        """Appends the nodes serialized in preorder from data[pos], linking each one to its parent."""
+
+        pending = [] #[node, children left to read] of the nodes whose subtree is being read
+        char = None #char from the node on top of pending to the next node read
+        while True:
+            header, pos = ReadVarint(data, pos)
+            node = len(self._children)
+            self._children.append({})
+            self._terminal.append(header & 1)
+            if pending:
+                self._children[pending[-1][0]][char] = node
+            pending.append([node, header >> 1])
+
+            #go up while the node on top has no children left, then read the char of its next child
+            while pending and pending[-1][1] == 0:
+                pending.pop()
+            if not pending:
+                return
+            pending[-1][1] -= 1
+            codePoint, pos = ReadVarint(data, pos)
+            char = chr(codePoint)
+
+    def Save(self, path: str) -> None:
+        """Writes the serialized trie to a file."""
+
+        with open(path, "wb") as f:
+            f.write(self.Serialize())
+
+    @classmethod
+    def Load(cls, path: str) -> "Trie":
+        """Reads a trie written by Save."""
+
+        with open(path, "rb") as f:
+            return cls.Deserialize(f.read())
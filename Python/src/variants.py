@@ -0,0 +1,121 @@
+from collections.abc import Iterator
+from functools import lru_cache #one mask per number of cells
+from Python.src.data import WsData, Word, SolveStatus, ws
+from Python.src.grid import Grid
+from Python.src.budget import SearchBudget
+from Python.src.WsMaker import PlaceWord, RemoveWord
+
+def GridKey(ws: ws) -> int:
+    """Returns the cells of a ws (without filling) as a single int, a byte per cell in the same order as Grid, so word searches can
+    be compared with a few operations over the whole int instead of cell by cell."""
+
+    return int.from_bytes(Grid.FromWs(ws).cells, "little")
+
+@lru_cache(maxsize=None)
+def LowBytesMask(cells: int) -> int:
+    """Returns the int with the lowest bit of each of its first cells bytes set (see HammingDistance)."""
+
+    return int.from_bytes(b"\x01" * cells, "little")
+
+def HammingDistance(key1: int, key2: int, cells: int) -> int:
+    """Returns the number of cells with a different char (whitespaces included) in two word searches of the same number of cells,
+    given their GridKey."""
+
+    #the different cells are the non-zero bytes of the XOR, so we fold each byte into its lowest bit and count them
+    diff = key1 ^ key2
+    diff |= diff >> 4
+    diff |= diff >> 2
+    diff |= diff >> 1
+    return (diff & LowBytesMask(cells)).bit_count()
+
+def WsSolutions(wsData: WsData, limit: int=None, minDistance: int=1, budget: SearchBudget=None) -> Iterator[WsData]:
+    """Yields the solutions of a WsData (with the positions already generated, see WordsPositions) one by one, as distinct word
+    searches: the same undo search as WsInsertWordsUndo (so the first one is the same solution), resumed from the last word each
+    time a solution is yielded, instead of solving again from an empty word search.
+
+    Only yields a solution if it differs in at least minDistance cells (HammingDistance, whitespaces included) from every solution
+    already yielded: with 1 they're just different word searches (two sets of positions can write the same chars), with more they're
+    more diverse, but each one is compared with all the previous ones. Stops after limit solutions (if given), when every position
+    has been tried, or when the budget (if given, each insertion attempt being a node) runs out.
+
+    Each solution is a new WsData with copies of the words (with their Word.position), the solution (without filling) and status.
+    Modifies the positionsIndex of each word of the original WsData while searching."""
+    #the backtracking is the same as WsInsertWordsUndo, but when the last word is inserted the solution is yielded and the
+    #last word goes on with its next position, so the positionsIndex of each word is the cursor that resumes the search
+
+    dim = wsData.dimension
+    words = wsData.words
+    wordsNum = len(words)
+    if not wordsNum or (limit is not None and limit <= 0):
+        return
+
+    grid = [[""] * dim for i in range(dim)]
+    undoLog: list[list[tuple[int, int]]] = [None] * wordsNum
+    seen: set[int] = set() #GridKey of the solutions yielded
+    yielded: list[int] = [] #the same, in a list to check the distance
+    count = 0
+
+    i = 0
+    while True:
+        wordI = words[i]
+        currentPosIdx, posAvailable = wordI.positionsIndex
+        if (currentPosIdx > posAvailable):
+            if (i == 0):
+                return #every position was tried
+            wordI.positionsIndex = (0, posAvailable)
+            i -= 1
+            RemoveWord(undoLog[i], grid)
+            undoLog[i] = None
+            continue
+
+        if budget is not None and budget.Spend():
+            return
+
+        written = PlaceWord(wordI.string, wordI.dir, wordI.positions[currentPosIdx], grid)
+        wordI.positionsIndex = (currentPosIdx+1, posAvailable)
+        if written is None:
+            continue
+        if (i < wordsNum-1):
+            undoLog[i] = written
+            i += 1
+            continue
+
+        #every word is inserted, it's yielded unless it's closer than minDistance to a solution already yielded
+        key = GridKey(grid)
+        if key in seen:
+            distance = 0
+        elif minDistance > 1:
+            #the most recent ones first, since the search finds the next solutions near the last ones
+            distance = next((d for other in reversed(yielded) if (d := HammingDistance(key, other, dim * dim)) < minDistance), None)
+        else:
+            distance = None
+        if distance is None:
+            seen.add(key)
+            if minDistance > 1:
+                yielded.append(key)
+            solution = WsData(dim, [Word(word.string, word.dir, position=word.positions[word.positionsIndex[0]-1]) for word in words],
+                              solution=[line[:] for line in grid], status=SolveStatus.SOLVED)
+            yield solution
+            count += 1
+            if limit is not None and count >= limit:
+                return
+            distance = 0
+
+        #any other solution with the same positions for the words before depth j differs from this one at most in the cells written
+        #here by the words from j on plus the cells those words write there (their length), so if that's less than minDistance minus
+        #the distance to the closest solution yielded, it's too close to it too and the word at depth j-1 must move
+        #(with minDistance 1 it's always the last word, which just tries its next position)
+        undoLog[i] = written
+        j = wordsNum
+        bound = distance
+        while j > 0 and bound + len(undoLog[j-1]) + len(words[j-1].string) < minDistance:
+            j -= 1
+            bound += len(undoLog[j]) + len(words[j].string)
+        if j == 0:
+            return #every other solution is too close
+        for k in range(wordsNum-1, j-2, -1):
+            RemoveWord(undoLog[k], grid)
+            undoLog[k] = None
+            if k >= j:
+                words[k].positionsIndex = (0, words[k].positionsIndex[1])
+        i = j-1
@@ -0,0 +1,170 @@
+import mmap #records are decoded straight from the mapped file, only the ones accessed
+from collections.abc import Sequence
+from struct import Struct
+from typing import IO
+from Python.src.data import WsData, Word, Direction
+from Python.src.grid import Grid, ENCODING
+
+WIRE_MAGIC: bytes = b"WSWF"
+"""First bytes of every wire file."""
+
+WIRE_END_MAGIC: bytes = b"WSWE"
+"""Last bytes of every (closed) wire file."""
+
+WIRE_VERSION: int = 1
+"""Version of the wire format."""
+
+WIRE_EXTENSION: str = ".wsw"
+"""Extension of the wire files (the C program writes this format if the file name ends with it)."""
+
+FILE_HEADER: Struct = Struct("<4sHH")
+"""Header of the file: magic, version and reserved."""
+
+RECORD_HEADER: Struct = Struct("<IHBBI")
+"""Header of each record: size of the record after this field, dimension, flags, reserved and number of words."""
+
+WORD_HEADER: Struct = Struct("<BBHHH")
+"""Header of each word: direction index, placed (0/1), length in bytes, x and y of its position (NO_POSITION if not placed)."""
+
+TABLE_ENTRY: Struct = Struct("<Q")
+"""Each entry of the records table: offset of the record from the start of the file."""
+
+FOOTER: Struct = Struct("<QI4s")
+"""Last bytes of the file: offset of the records table, number of records and end magic."""
+
+FLAG_GRID: int = 1
+"""Record flag: the record ends with the grid (dimension x dimension bytes, 0 for an empty cell)."""
+
+NO_POSITION: int = 0xFFFF
+"""x and y of a word without position."""
+
+DIRECTION_INDEX: dict[Direction, int] = {direction: i for i, direction in enumerate(Direction)}
+"""Index of each Direction (Direction[i] is the inverse)."""
+
+def EncodeWsData(wsData: WsData) -> bytes:
+    """Returns the record of a WsData: dimension, words (with their direction and Word.position) and WsData.solution if any.
+
+    Words are encoded in latin-1, the same as Grid, so each char is one byte (and one cell)."""
+
+    flags = FLAG_GRID if wsData.solution else 0
+    parts = []
+    for word in wsData.words:
+        wordBytes = word.string.encode(ENCODING)
+        x, y = word.position if word.position is not None else (NO_POSITION, NO_POSITION)
+        parts.append(WORD_HEADER.pack(DIRECTION_INDEX[word.dir], word.position is not None, len(wordBytes), x, y))
+        parts.append(wordBytes)
+    if flags & FLAG_GRID:
+        parts.append(bytes(Grid.FromWs(wsData.solution).cells))
+
+    body = b"".join(parts)
+    header = RECORD_HEADER.pack(RECORD_HEADER.size - 4 + len(body), wsData.dimension, flags, 0, len(wsData.words))
+    return header + body
+
+def DecodeWsData(buffer: bytes, offset: int=0) -> tuple[WsData, int]:
+    """Returns the WsData of the record at buffer[offset] (see EncodeWsData) and the offset of the next record.
+
+    The words have Word.position set (None if not placed) but no positions list, as WordsPositions would generate it."""
+
+    size, dimension, flags, reserved, wordCount = RECORD_HEADER.unpack_from(buffer, offset)
+    end = offset + 4 + size
+    pos = offset + RECORD_HEADER.size
+
+    wsData = WsData(dimension)
+    for _ in range(wordCount):
+        dirIdx, placed, length, x, y = WORD_HEADER.unpack_from(buffer, pos)
+        pos += WORD_HEADER.size
+        word = Word(bytes(buffer[pos:pos + length]).decode(ENCODING), Direction[dirIdx])
+        word.position = (x, y) if placed else None
+        wsData.words.append(word)
+        pos += length
+
+    if flags & FLAG_GRID:
+        wsData.solution = Grid(dimension, bytearray(buffer[pos:pos + dimension * dimension])).ToWs()
+        pos += dimension * dimension
+
+    if pos != end:
+        raise ValueError(f"Wrong record size at offset {offset}")
+    return wsData, end
+
+class WireWriter:
+    """
+    Writes WsData records to a wire file: the header, the records, the table with the offset (uint64) of each record and the footer.
+
+    Use as a context manager (or call Close), since the table and footer are only written when it's closed.
+    """
+
+    def __init__(self, wireFile: IO):
+        self.file = wireFile
+        """Binary file opened for writing."""
+        self.offsets: list[int] = []
+        """Offset of each record written."""
+        self.file.write(FILE_HEADER.pack(WIRE_MAGIC, WIRE_VERSION, 0))
+        self._offset = FILE_HEADER.size
+
+    def Write(self, wsData: WsData) -> None:
+        """Appends the record of a WsData."""
+
+        record = EncodeWsData(wsData)
+        self.offsets.append(self._offset)
+        self.file.write(record)
+        self._offset += len(record)
+
+    def Close(self) -> None:
+        """Writes the records table and the footer (doesn't close the file)."""
+
+        self.file.write(b"".join(TABLE_ENTRY.pack(offset) for offset in self.offsets))
+        self.file.write(FOOTER.pack(self._offset, len(self.offsets), WIRE_END_MAGIC))
+
+    def __enter__(self) -> "WireWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.Close()
+
+class WireReader(Sequence):
+    """
+    Read-only wire file, memory mapped: opening it only reads the header and footer, and each record is decoded when accessed,
+    so any record of a file with millions of them is read in O(1). It's a sequence of WsData (len, indexing, iteration).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        """Path of the wire file."""
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            if len(self._map) < FILE_HEADER.size + FOOTER.size:
+                raise ValueError(f"{path} isn't a wire file")
+            magic, version, reserved = FILE_HEADER.unpack_from(self._map, 0)
+            tableOffset, self.count, endMagic = FOOTER.unpack_from(self._map, len(self._map) - FOOTER.size)
+            if magic != WIRE_MAGIC or endMagic != WIRE_END_MAGIC or version != WIRE_VERSION:
+                raise ValueError(f"{path} isn't a wire file (version {WIRE_VERSION}), or it wasn't closed")
+            if tableOffset + self.count * TABLE_ENTRY.size + FOOTER.size != len(self._map):
+                raise ValueError(f"{path} has a wrong records table")
+        except ValueError:
+            self._map.close()
+            raise
+        self._tableOffset = tableOffset
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, i: int) -> WsData:
+        if i < 0:
+            i += self.count
+        if not 0 <= i < self.count:
+            raise IndexError("wire record index out of range")
+        offset, = TABLE_ENTRY.unpack_from(self._map, self._tableOffset + i * TABLE_ENTRY.size)
+        return DecodeWsData(self._map, offset)[0]
+
+    def Close(self) -> None:
+        """Releases the memory map."""
+
+        self._map.close()
+
+    def __enter__(self) -> "WireReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.Close()
@@ -6,12 +6,14 @@ from copy import deepcopy
 
 from Python.src.WsMaker import (
     InitializeWSList, WordsPositions, InsertWord, WsInsertWords,
+    PlaceWord, RemoveWord, WsInsertWordsUndo, SolveWS, ENGINES,
     FillChars, RetWSData, WordsValidation, LoadFilesData,
     WsToText, ShowWSText, SaveWS, WsMaker) #all tested functions in this file
 
 #functions needed to run the tests
 from Python.src.utils import (OpenFile, CloseFile, WrongWSDataFormat)
-from Python.src.data import Direction, Word, WsData
+from Python.src.data import Direction, Word, WsData, SolveStatus
+from Python.src.budget import SearchBudget
 from Python.src.constants import ALPHABET
 
 currentDir = Path(__file__).resolve().parent.as_posix()
@@ -157,6 +159,94 @@ def test_WsInsertWords(fixtureWsInsertWords):
     assert final1 == desiredOutput1
     assert final2 == desiredOutput2
 
+def test_PlaceWord(fixtureInsertWord):
+    #same inserts as InsertWord, but the ws is modified in place and the undo log is returned
+    ws, inserts, desiredOutcomes = fixtureInsertWord
+    logs = []
+    for idx, insert in enumerate(inserts):
+        previousWS = deepcopy(ws)
+        written = PlaceWord(*insert, ws)
+        logs.append(written)
+
+        assert (written is not None) == desiredOutcomes[idx][0]
+        if written is None:
+            assert ws == previousWS #a failed insertion doesn't leave any char written
+        else:
+            assert ws == desiredOutcomes[idx][1]
+
+    #"year" shares its "y" with "enemy", so only 3 cells are logged
+    assert logs[3] == [(4, 2), (4, 1), (4, 0)]
+
+    #undoing in reverse order gives back the empty ws
+    for written in reversed(logs):
+        if written is not None:
+            RemoveWord(written, ws)
+    assert ws == [[""] * 5 for i in range(5)]
+
+def test_WsInsertWordsUndo(fixtureWsInsertWords):
+    data1, data2, desiredOutput1, desiredOutput2 = fixtureWsInsertWords
+
+    WsInsertWordsUndo(data1)
+    WsInsertWordsUndo(data2)
+
+    assert data1.solution == desiredOutput1
+    assert data2.solution == desiredOutput2
+    assert [word.position for word in data1.words] == [(0, 1), (1, 0), (0, 1)]
+
+def test_WsInsertWordsUndoInitial(fixtureWsInsertWords):
+    data1, data2, desiredOutput1, desiredOutput2 = fixtureWsInsertWords
+
+    #the first solution doesn't use the cell (0,0), so it's the same one with the initial char kept
+    initial = [[""] * 5 for i in range(5)]
+    initial[0][0] = "z"
+    WsInsertWordsUndo(data1, initial=initial)
+
+    desiredOutput1[0][0] = "z"
+    assert data1.solution == desiredOutput1
+    assert initial[0] == ["z", "", "", "", ""] #the initial ws is copied, not modified
+
+def test_WsInsertWordsUndoBudget(fixtureWsInsertWords):
+    data1, data2, desiredOutput1, desiredOutput2 = fixtureWsInsertWords
+
+    #"hello" is inserted at (0,0) in the 1st node, "ready" can't be inserted at (0,0) in the 2nd, and the 3rd node is over budget
+    budget = SearchBudget(maxNodes=2)
+    WsInsertWordsUndo(data1, budget)
+
+    assert data1.status == SolveStatus.BUDGET_EXCEEDED and data1.solution is None
+    assert data1.partial[0] == ["h","e","l","l","o"] and all(line == [""] * 5 for line in data1.partial[1:])
+    assert [word.position for word in data1.words] == [(0, 0), None, None]
+
+    #with enough budget we get the same result as without it, and the nodes used are counted
+    budget = SearchBudget(maxNodes=1000)
+    WsInsertWordsUndo(data2, budget)
+
+    assert data2.status == SolveStatus.NO_SOLUTION and data2.partial is None
+    assert budget.nodes == 5 and not budget.exhausted #"have" only has 1 position, and "care" fails in its 4 positions
+
+def test_SolveWS():
+    #every engine must agree on which inputs have a solution, and dp/undo on the exact solution
+    solutions = {}
+    for engine in ENGINES:
+        seed(0)
+        data1 = WsData(5, [Word("hello", Direction.RIGHT), Word("ready", Direction.DOWN), Word("have", Direction.RIGHTDOWN)])
+        data2 = WsData(4, [Word("have", Direction.RIGHTDOWN), Word("care", Direction.LEFT)])
+        WordsPositions(data1)
+        WordsPositions(data2)
+
+        SolveWS(data1, engine)
+        SolveWS(data2, engine)
+        solutions[engine] = data1.solution
+
+        assert data1.solution and all(word.position for word in data1.words)
+        assert data2.solution is None
+
+    assert solutions["dp"] == solutions["undo"] == solutions["bitset"]
+
+    with pytest.raises(ValueError):
+        SolveWS(WsData(5, []), "unknown")
+    with pytest.raises(ValueError):
+        SolveWS(WsData(5, []), "dlx", SearchBudget(maxNodes=10))
+
 @pytest.fixture
 def fixtureFillChars():
     seed(0) #we use seed so we are able to know which chars to expect
@@ -342,4 +432,4 @@ def test_WsMaker(fixtureWsMaker):
         desiredOutput = f.read()
 
     assert flag1 and desiredOutput == testOutput
-    assert not flag2
\ No newline at end of file
+    assert not flag2
\ No newline at end of file
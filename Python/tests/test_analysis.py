@@ -0,0 +1,51 @@
+import pytest
+
+from Python.src.analysis import (AnalyzeWsData, Infeasibility, MinCells, Axis, PAIRWISE_MAX_WORDS) #tested in this file
+
+#classes needed to run the tests
+from Python.src.data import Direction, Word, WsData
+
+def test_Axis():
+    assert Axis(Direction.RIGHT) == Axis(Direction.LEFT)
+    assert Axis(Direction.RIGHTUP) == Axis(Direction.LEFTDOWN)
+    assert Axis(Direction.RIGHTDOWN) != Axis(Direction.RIGHTUP)
+
+def test_MinCells():
+    #no chars in common, so they can't overlap at all
+    assert MinCells(WsData(5, [Word("abc", Direction.RIGHT), Word("def", Direction.DOWN)])) == 6
+    #different axes and a char in common: 1 cell at most
+    assert MinCells(WsData(5, [Word("abc", Direction.RIGHT), Word("cde", Direction.DOWN)])) == 5
+    #same axis: "abc" could be completely inside "xabc", but the bound is never lower than the longest word
+    assert MinCells(WsData(5, [Word("abc", Direction.RIGHT), Word("xabc", Direction.LEFT)])) == 4
+    #the pairs could overlap completely, but there are 4 different chars (and "b" twice in the same word)
+    assert MinCells(WsData(5, [Word("abc", Direction.RIGHT), Word("bcd", Direction.RIGHT), Word("cda", Direction.RIGHT)])) == 4
+    assert MinCells(WsData(5, [Word("abcb", Direction.RIGHT), Word("bcd", Direction.RIGHT), Word("cda", Direction.RIGHT)])) == 5
+    #with many words only the letters bound is used: 26 different chars, no pair is checked
+    words = [Word(chr(ord("a") + i % 26) * 2, Direction[i % 8]) for i in range(PAIRWISE_MAX_WORDS + 1)]
+    assert MinCells(WsData(30, words)) == 52
+
+@pytest.fixture
+def fixtureAnalyzeWsData():
+    data1 = WsData(5, [Word("casa", Direction[2]), Word("arbol", Direction[1]), Word("jorge", Direction[4]), Word("hola", Direction[5])])
+    data2 = WsData(6, [Word("maria", Direction[1]), Word("monitor", Direction[0])])
+    data3 = WsData(2, [Word("ab", Direction.RIGHT), Word("cd", Direction.RIGHT), Word("ef", Direction.DOWN)])
+    data4 = WsData(0, [Word("a", Direction.RIGHT)])
+    data5 = WsData(3, [])
+    return (data1, data2, data3, data4, data5)
+
+def test_AnalyzeWsData(fixtureAnalyzeWsData):
+    data1, data2, data3, data4, data5 = fixtureAnalyzeWsData
+    analysis1 = AnalyzeWsData(data1)
+    analysis2 = AnalyzeWsData(data2)
+    analysis3 = AnalyzeWsData(data3)
+
+    assert analysis1.feasible and analysis1.reason is None
+    assert analysis1.cells == 25 and analysis1.totalLetters == 18 and analysis1.minCells == 13 #5 pairs with a char in common
+
+    assert not analysis2.feasible and analysis2.reason == Infeasibility.WORD_TOO_LONG and "monitor" in analysis2.detail
+
+    assert not analysis3.feasible and analysis3.reason == Infeasibility.NOT_ENOUGH_CELLS
+    assert analysis3.minCells == 6 and analysis3.cells == 4
+
+    assert AnalyzeWsData(data4).reason == Infeasibility.INVALID_DIMENSION
+    assert AnalyzeWsData(data5).reason == Infeasibility.NO_WORDS
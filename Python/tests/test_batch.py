@@ -0,0 +1,132 @@
+import pytest
+from pathlib import Path
+
+from Python.src.batch import (ReadManifest, CollectInputs, BatchJobs, GeneratePuzzle,
+                              RunBatch, BatchJob, BatchSummary, Main) #tested in this file
+
+#functions needed to run the tests
+from Python.src.WsMaker import ReadLexicon, RetWSData
+from Python.src.wire import WireWriter, WireReader
+from Python.src.data import SolveStatus
+from Python.src.constants import ALPHABET
+
+currentDir = Path(__file__).resolve().parent.as_posix()
+"""Absolute path of the parent directory of this file."""
+
+@pytest.fixture
+def fixtureManifest(tmp_path):
+    manifest = tmp_path / "manifest"
+    manifest.write_text(f"# puzzles to generate\n{currentDir}/files/wsTest1.txt 3\n\nwsTest2.txt\n")
+    return manifest.as_posix()
+
+def test_ReadManifest(fixtureManifest, tmp_path):
+    entries = ReadManifest(fixtureManifest)
+    assert entries == [(f"{currentDir}/files/wsTest1.txt", 3), ((tmp_path / "wsTest2.txt").as_posix(), None)]
+
+    (tmp_path / "wrong").write_text("file.txt three\n")
+    with pytest.raises(ValueError):
+        ReadManifest((tmp_path / "wrong").as_posix())
+
+def test_CollectInputs(fixtureManifest, tmp_path):
+    inputs = CollectInputs([f"{currentDir}/files/wsTest2.txt"], 2, fixtureManifest)
+    assert [count for path, count in inputs] == [2, 3, 2]
+
+    #directories are expanded to all their files
+    inputs = CollectInputs([f"{currentDir}/files"])
+    assert (f"{currentDir}/files/wsTest5.txt", 1) in inputs
+
+    #but not the index of a lexicon compiled there
+    inputsDir = tmp_path / "inputs"
+    inputsDir.mkdir()
+    (inputsDir / "wsTest.txt").write_text("")
+    (inputsDir / "lexicon.txt.idx").write_bytes(b"")
+    assert CollectInputs([inputsDir.as_posix()]) == [((inputsDir / "wsTest.txt").as_posix(), 1)]
+
+def test_BatchJobs():
+    summary = BatchSummary()
+    jobs = list(BatchJobs([(f"{currentDir}/files/wsTest1.txt", 2), (f"{currentDir}/files/wsTest3.txt", 1),
+                           (f"{currentDir}/files/wsTest2.txt", 1)], 10, summary))
+
+    assert [(job.index, job.seed) for job in jobs] == [(0, 10), (1, 11), (0, 12)]
+    assert jobs[0].wsData == jobs[1].wsData and jobs[0].wsData is not jobs[1].wsData
+    assert len(summary.errors) == 1 and "wsTest3.txt" in summary.errors[0]
+
+def test_GeneratePuzzle():
+    with open(f"{currentDir}/files/lexicon.txt", "r") as f:
+        lexiconWords = ReadLexicon(f)
+    job1, job2 = BatchJobs([(f"{currentDir}/files/wsTest1.txt", 1), (f"{currentDir}/files/wsTest2.txt", 1)])
+
+    #same steps (and seed) as test_WsMaker, so the words are in the same cells (the filler chars are generated in another way)
+    result1 = GeneratePuzzle(BatchJob(job1.source, 0, 0, job1.wsData), lexiconWords, "undo")
+    with open(f"{currentDir}/files/output1.txt", "r") as f:
+        expected = f.read().split("\n")
+    lines = result1.text.split("\n")
+    assert result1.status == SolveStatus.SOLVED and len(lines) == len(expected)
+
+    wordCells = set()
+    for word in result1.wsData.words:
+        x, y = word.position
+        wordCells.update((x + i*word.dir.value.x, y + i*word.dir.value.y) for i in range(len(word.string)))
+    for y, line in enumerate(lines):
+        for x, c in enumerate(line):
+            assert c == expected[y][x] if (x, y) in wordCells else c in ALPHABET
+
+    result2 = GeneratePuzzle(job2, lexiconWords, "undo")
+    assert result2.text is None and "longer than the dimension" in result2.detail
+
+    #an exception is returned as a failed puzzle, instead of stopping the batch
+    result3 = GeneratePuzzle(BatchJob(job1.source, 1, 0, job1.wsData), lexiconWords, "unknown")
+    assert result3.text is None and result3.index == 1 and result3.detail.startswith("ValueError")
+
+def test_RunBatch(fixtureManifest, tmp_path):
+    summary = RunBatch(CollectInputs([], 1, fixtureManifest), f"{currentDir}/files/lexicon.txt", (tmp_path / "out").as_posix(),
+                       workers=2, indexPath=(tmp_path / "lexicon.idx").as_posix())
+
+    assert summary.generated == 3 and not summary.failed
+    assert len(summary.errors) == 1 #wsTest2.txt isn't in tmp_path
+    assert sorted(file.name for file in (tmp_path / "out").iterdir()) == ["wsTest1_0.txt", "wsTest1_1.txt", "wsTest1_2.txt"]
+    assert (tmp_path / "out" / "wsTest1_0.txt").read_text().count("\n") == 4
+
+    #the workers of the pool can't start the processes of portfolio
+    with pytest.raises(ValueError):
+        RunBatch([], f"{currentDir}/files/lexicon.txt", (tmp_path / "out").as_posix(), "portfolio")
+
+def test_RunBatchWire(tmp_path):
+    #wire input, wire output with the position of each word
+    with open(tmp_path / "input.wsw", "wb") as f, WireWriter(f) as writer:
+        with open(f"{currentDir}/files/wsTest1.txt", "r") as wsDataFile:
+            writer.Write(RetWSData(wsDataFile, verbose=False))
+
+    summary = RunBatch([((tmp_path / "input.wsw").as_posix(), 2)], f"{currentDir}/files/lexicon.txt", (tmp_path / "out").as_posix(),
+                       workers=1, indexPath=(tmp_path / "lexicon.idx").as_posix(), wire=True)
+    assert summary.generated == 2 and not summary.failed and not summary.errors
+
+    with WireReader((tmp_path / "out" / "puzzles.wsw").as_posix()) as reader:
+        assert len(reader) == 2
+        for puzzle in reader:
+            grid = puzzle.solution
+            for word in puzzle.words:
+                x, y = word.position
+                dx, dy = word.dir.value
+                assert "".join(grid[y + i*dy][x + i*dx] for i in range(len(word.string))) == word.string
+
+def test_RunBatchCache(fixtureManifest, tmp_path):
+    #the second run finds every puzzle (and the rejected one) in the cache, with the same output
+    inputs = [(f"{currentDir}/files/wsTest1.txt", 2), (f"{currentDir}/files/wsTest2.txt", 1)]
+    outputs = []
+    for run in range(2):
+        summary = RunBatch(inputs, f"{currentDir}/files/lexicon.txt", (tmp_path / f"out{run}").as_posix(), workers=1,
+                           indexPath=(tmp_path / "lexicon.idx").as_posix(), cacheDir=(tmp_path / "cache").as_posix())
+        assert summary.generated == 2 and len(summary.failed) == 1
+        outputs.append(sorted((file.name, file.read_text()) for file in (tmp_path / f"out{run}").iterdir()))
+        assert (summary.cacheHits, summary.cacheMisses) == ((0, 3) if run == 0 else (3, 0))
+
+    assert outputs[0] == outputs[1]
+
+def test_Main(tmp_path, capsys):
+    code = Main(["-l", f"{currentDir}/files/lexicon.txt", "-i", (tmp_path / "lexicon.idx").as_posix(),
+                 "-o", (tmp_path / "out").as_posix(), "-n", "2", "-w", "1",
+                 f"{currentDir}/files/wsTest1.txt", f"{currentDir}/files/wsTest2.txt"])
+
+    assert code == 1 #wsTest2.txt has a word too long for its dimension
+    assert "Generated: 2. Failed: 2. Unreadable files: 0." in capsys.readouterr().out
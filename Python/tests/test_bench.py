@@ -0,0 +1,76 @@
+import json
+import pytest
+from copy import deepcopy
+
+from Python.src.bench import (Workload, BuildWsData, Workloads, BenchWorkload, RunBenchmarks, CompareBaseline,
+                              Main) #tested in this file
+
+#functions needed to run the tests
+from Python.src.WsMaker import WordsPositions, SolveWS
+from Python.src.data import SolveStatus
+
+@pytest.fixture
+def fixtureReport():
+    workloads = [Workload("planted-6", 6, 4, "all", True, 1), Workload("infeasible-4", 4, 5, "horizontal", False, 4)]
+    return RunBenchmarks(engines=("dp", "undo"), repeat=1, workloads=workloads)
+
+def test_BuildWsData():
+    workload = Workload("planted-10", 10, 8, "straight", True, 3)
+    wsData = BuildWsData(workload)
+    assert len(wsData.words) == 8 and wsData == BuildWsData(workload)
+
+    WordsPositions(wsData)
+    SolveWS(wsData, "undo")
+    assert wsData.status == SolveStatus.SOLVED
+
+    infeasible = BuildWsData(Workload("infeasible-5", 5, 6, "horizontal", False, 5))
+    WordsPositions(infeasible)
+    SolveWS(infeasible, "undo")
+    assert infeasible.status == SolveStatus.NO_SOLUTION
+
+def test_Workloads():
+    names = [workload.name for workload in Workloads("quick")]
+    assert len(names) == len(set(names))
+    assert all(workload.dimension <= 20 for workload in Workloads("quick"))
+
+def test_BenchWorkload():
+    results = BenchWorkload(Workload("infeasible-4", 4, 5, "horizontal", False, 4), ("undo", "dlx"), repeat=1)
+    solves = {result.benchmark: result for result in results if result.benchmark.startswith("solve:")}
+    assert solves["solve:undo"].status == solves["solve:dlx"].status == SolveStatus.NO_SOLUTION.value
+    assert solves["solve:undo"].nodes > 0 and solves["solve:dlx"].nodes > 0 #counted with SolverStats
+    assert "FillChars" not in {result.benchmark for result in results} #there's no solution to fill
+
+def test_RunBenchmarks(fixtureReport):
+    report = json.loads(json.dumps(fixtureReport))
+    benchmarks = {(result["benchmark"], result["workload"]) for result in report["results"]}
+    assert ("solve:dp", "planted-6") in benchmarks and ("FillCharsText", "planted-6") in benchmarks
+    assert all(result["seconds"] >= 0 and result["peakBytes"] >= 0 for result in report["results"])
+
+def test_CompareBaseline(fixtureReport):
+    assert CompareBaseline(fixtureReport, fixtureReport) == []
+
+    slower = deepcopy(fixtureReport)
+    result = next(result for result in slower["results"] if result["nodes"] is not None)
+    result["medianSeconds"] = result["medianSeconds"] * 2 + 1
+    result["nodes"] += 1
+    assert len(CompareBaseline(slower, fixtureReport)) == 2
+    assert CompareBaseline(fixtureReport, slower) == []
+
+    #twice as slow, but only by a millisecond: noise
+    fast, noisy = deepcopy(fixtureReport), deepcopy(fixtureReport)
+    for fastResult, noisyResult in zip(fast["results"], noisy["results"]):
+        fastResult["medianSeconds"], noisyResult["medianSeconds"] = 0.001, 0.002
+    assert CompareBaseline(noisy, fast) == []
+    assert len(CompareBaseline(noisy, fast, minSlowdown=0)) == len(noisy["results"])
+
+    assert len(CompareBaseline(fixtureReport, dict(fixtureReport, version=0))) == 1
+
+def test_Main(fixtureReport, tmp_path, capsys):
+    baseline = tmp_path / "baseline.json"
+    first = fixtureReport["results"][0]
+    first.update(workload="planted-5-few-all", medianSeconds=1000, peakBytes=2**40) #compared with the first quick benchmark
+    baseline.write_text(json.dumps(fixtureReport))
+
+    assert Main(["-e", "undo", "-r", "1", "-o", (tmp_path / "results.json").as_posix(), "-b", baseline.as_posix()]) == 0
+    assert "Regressions: 0." in capsys.readouterr().out
+    assert json.loads((tmp_path / "results.json").read_text())["suite"] == "quick"
@@ -0,0 +1,18 @@
+import pytest
+from time import monotonic
+
+from Python.src.budget import SearchBudget #tested in this file
+
+def test_SearchBudgetNodes():
+    budget = SearchBudget(maxNodes=3)
+
+    assert [budget.Spend() for i in range(5)] == [False, False, False, True, True]
+    assert budget.exhausted and budget.nodes == 5
+
+def test_SearchBudgetDeadline():
+    #the clock is only read every checkEvery nodes
+    budget = SearchBudget(deadline=monotonic() - 1, checkEvery=4)
+    assert [budget.Spend() for i in range(4)] == [False, False, False, True]
+
+    unlimited = SearchBudget.FromTimeout()
+    assert not any(unlimited.Spend() for i in range(1000)) and unlimited.deadline is None
@@ -0,0 +1,70 @@
+import pytest
+from copy import deepcopy
+
+from Python.src.cache import (RequestKey, EncodeResult, DecodeResult, ResultCache, CachedResult,
+                              CACHE_EXTENSION) #tested in this file
+
+#functions needed to run the tests
+from Python.src.data import Direction, Word, WsData, SolveStatus
+from Python.src.stats import SolverStats
+
+@pytest.fixture
+def fixtureResults():
+    wsData = WsData(3, [Word("ab", Direction.RIGHT), Word("ca", Direction.DOWN)])
+    solved = WsData(3, [Word("ab", Direction.RIGHT, position=(0, 0)), Word("ca", Direction.DOWN, position=(0, 0))],
+                    solution=[["a", "b", "x"], ["c", "y", "z"], ["d", "e", "f"]], status=SolveStatus.SOLVED)
+    return (wsData, CachedResult(SolveStatus.SOLVED, solved), CachedResult(SolveStatus.NO_SOLUTION, None, "no solution"),
+            CachedResult(None, None, "word longer than the dimension: abcd"))
+
+def test_RequestKey(fixtureResults):
+    wsData = fixtureResults[0]
+    key = RequestKey(wsData, 7, "undo", "lexicon")
+
+    #positions (or any other auxiliary data) don't change the request
+    positioned = deepcopy(wsData)
+    positioned.words[0].positions = [(0, 0)]
+    assert RequestKey(positioned, 7, "undo", "lexicon") == key and len(key) == 64
+
+    other = deepcopy(wsData)
+    other.words[1].dir = Direction.UP
+    assert len({key, RequestKey(other, 7, "undo", "lexicon"), RequestKey(wsData, 8, "undo", "lexicon"),
+                RequestKey(wsData, 7, "dp", "lexicon"), RequestKey(wsData, 7, "undo", "lexicon2")}) == 5
+
+def test_EncodeResult(fixtureResults):
+    wsData, solved, noSolution, rejected = fixtureResults
+    for result in (solved, noSolution, rejected):
+        decoded = DecodeResult(EncodeResult(result))
+        assert decoded.status == result.status and decoded.detail == result.detail
+        assert (decoded.wsData is None) == (result.wsData is None)
+
+    decoded = DecodeResult(EncodeResult(solved)).wsData
+    assert decoded.solution == solved.wsData.solution and decoded.status == SolveStatus.SOLVED
+    assert [word.position for word in decoded.words] == [(0, 0), (0, 0)]
+
+    with pytest.raises(ValueError):
+        DecodeResult(b"WSRC" + EncodeResult(solved)[4:6][::-1] + EncodeResult(solved)[6:]) #another version
+
+def test_ResultCache(fixtureResults, tmp_path):
+    wsData, solved, noSolution, rejected = fixtureResults
+    cache = ResultCache(maxEntries=2, directory=(tmp_path / "cache").as_posix())
+    stats = SolverStats()
+
+    assert cache.Get("a", stats) is None
+    assert cache.Put("a", solved) and cache.Put("b", noSolution) and cache.Put("c", rejected)
+    assert not cache.Put("d", CachedResult(SolveStatus.BUDGET_EXCEEDED)) #not a result, a longer budget could solve it
+    assert list(cache.entries) == ["b", "c"] #"a" evicted from memory, but still in disk
+
+    assert cache.Get("a", stats).wsData.solution == solved.wsData.solution
+    assert cache.Get("c", stats).detail == rejected.detail #in memory, "b" was evicted by "a"
+    assert cache.ToDict() == {"hits": 2, "diskHits": 1, "misses": 1, "stores": 3, "entries": 2}
+    assert stats.cacheHits == 2 and stats.cacheMisses == 1
+
+    #another process (or run) shares the disk tier, and damaged entries are generated again
+    other = ResultCache(directory=(tmp_path / "cache").as_posix())
+    assert other.Get("c").detail == rejected.detail
+    (tmp_path / "cache" / f"b{CACHE_EXTENSION}").write_bytes(b"WSRC")
+    assert other.Get("b") is None and other.Get("d") is None
+
+    memory = ResultCache()
+    memory.Put("a", solved)
+    assert memory.Get("a") is solved and memory.Get("b") is None
@@ -0,0 +1,52 @@
+import pytest
+from random import seed, randrange, choice
+
+from Python.src.dlx import DancingLinks, WsInsertWordsDLX #tested in this file
+
+#functions needed to run the tests
+from Python.src.WsMaker import WordsPositions, WsInsertWordsUndo
+from Python.src.data import Direction, Word, WsData
+
+def test_DancingLinks():
+    #exact cover example from Knuth (TAOCP 7.2.2.1 (5)): items a..g are 1..7, the only solution is options 0, 3 and 4
+    dlx = DancingLinks(7, 0)
+    for option in ("ce", "adg", "bcf", "adf", "bg", "deg"):
+        dlx.AddOption([(ord(item) - ord("a") + 1, 0) for item in option])
+
+    assert [sorted(solution) for solution in dlx.Solutions()] == [[0, 3, 4]]
+
+def test_DancingLinksColors():
+    #items 1, 2 are primary and 3 is secondary. Options 0 and 1 give item 3 different colors, so they can't go together
+    dlx = DancingLinks(2, 1)
+    dlx.AddOption([(1, 0), (3, 1)])
+    dlx.AddOption([(2, 0), (3, 2)])
+    dlx.AddOption([(2, 0), (3, 1)])
+
+    assert [sorted(solution) for solution in dlx.Solutions()] == [[0, 2]]
+
+@pytest.fixture
+def fixtureWsInsertWordsDLX():
+    #random small instances, some of them have no solution
+    seed(2)
+    instances = []
+    for i in range(40):
+        dim = randrange(3, 6)
+        words = [Word("".join(choice("abc") for k in range(randrange(2, dim + 1))), Direction[randrange(8)])
+                 for j in range(randrange(1, 7))]
+        instances.append(WsData(dim, words))
+    return instances
+
+def test_WsInsertWordsDLX(fixtureWsInsertWordsDLX):
+    for data in fixtureWsInsertWordsDLX:
+        WordsPositions(data)
+        expected = WsData(data.dimension, [Word(word.string, word.dir, list(word.positions), word.positionsIndex) for word in data.words])
+
+        WsInsertWordsDLX(data)
+        WsInsertWordsUndo(expected)
+
+        #both must agree if there's a solution, and the one found must contain every word
+        assert (data.solution is None) == (expected.solution is None)
+        if data.solution:
+            for word in data.words:
+                x, y = word.position
+                assert all(data.solution[y + i * word.dir.value.y][x + i * word.dir.value.x] == c for i, c in enumerate(word.string))
@@ -0,0 +1,98 @@
+import pytest
+
+from Python.src.edit import (EditAddWord, EditRemoveWord, EditReplaceWord, EditOutcome, LayoutWs,
+                             CellOwners) #tested in this file
+
+#classes needed to run the tests
+from Python.src.data import Direction, Word, WsData, SolveStatus
+from Python.src.budget import SearchBudget
+
+@pytest.fixture
+def fixtureEdit():
+    def Data() -> WsData:
+        #"abc" in the first row and "def" in the second one, the third row is empty
+        words = [Word("abc", Direction.RIGHT, position=(0, 0)), Word("def", Direction.RIGHT, position=(0, 1))]
+        return WsData(3, words, solution=LayoutWs(3, words), status=SolveStatus.SOLVED)
+
+    return Data
+
+def test_LayoutWs(fixtureEdit):
+    data = fixtureEdit()
+    assert data.solution == [["a","b","c"], ["d","e","f"], ["","",""]]
+    assert CellOwners(3, data.words + [Word("ae", Direction.DOWN, position=(0, 0))])[:4] == [[0, 2], [0], [0], [1, 2]]
+
+    with pytest.raises(ValueError):
+        LayoutWs(3, data.words + [Word("xy", Direction.DOWN, position=(0, 0))])
+    with pytest.raises(ValueError):
+        LayoutWs(3, [Word("abc", Direction.RIGHT)])
+
+def test_EditAddWord(fixtureEdit):
+    #"gh" only fits in the third row, so no word moves
+    data = fixtureEdit()
+    result = EditAddWord(data, Word("gh", Direction.RIGHT))
+    assert result.outcome == EditOutcome.LOCAL and result.moved == [2]
+    assert data.words[2].position in ((0, 2), (1, 2)) and data.solution == LayoutWs(3, data.words)
+
+    #every position of "ae" conflicts with one word, which is moved to the third row
+    data = fixtureEdit()
+    result = EditAddWord(data, Word("ae", Direction.DOWN), 0)
+    assert result.outcome == EditOutcome.REPAIRED and len(result.moved) == 2 and result.moved[0] == 0
+    assert data.words[0].string == "ae" and data.solution == LayoutWs(3, data.words)
+    assert sum(word.position[1] == 2 for word in data.words[1:]) == 1
+
+    #without nodes for the repair, all the words are inserted again
+    data = fixtureEdit()
+    result = EditAddWord(data, Word("ae", Direction.DOWN), repairNodes=0)
+    assert result.outcome == EditOutcome.RESOLVED and data.status == SolveStatus.SOLVED
+    assert len(data.words) == 3 and data.solution == LayoutWs(3, data.words)
+
+    #the same Word again, after removing it: its positions are generated again, not appended
+    data = fixtureEdit()
+    word = Word("gh", Direction.RIGHT)
+    EditAddWord(data, word)
+    EditRemoveWord(data, 2)
+    result = EditAddWord(data, word)
+    assert result.outcome == EditOutcome.LOCAL and len(word.positions) == 6 and len(set(word.positions)) == 6
+
+    #too long, or there's no word search with all the words: nothing changes
+    for word, budget in ((Word("abcd", Direction.RIGHT), None), (Word("xyz", Direction.DOWN), SearchBudget(maxNodes=1000))):
+        data = fixtureEdit()
+        result = EditAddWord(data, word, budget=budget)
+        assert result.outcome == EditOutcome.FAILED and len(data.words) == 2
+        assert data.solution == [["a","b","c"], ["d","e","f"], ["","",""]]
+        assert [word.position for word in data.words] == [(0, 0), (0, 1)]
+
+def test_EditRemoveReplaceWord(fixtureEdit):
+    data = fixtureEdit()
+    data.words.append(Word("ae", Direction.RIGHTDOWN, position=(0, 0)))
+    data.solution = LayoutWs(3, data.words)
+
+    #the "e" is kept, "def" still covers it
+    assert EditRemoveWord(data, 2).outcome == EditOutcome.LOCAL
+    assert data.solution == [["a","b","c"], ["d","e","f"], ["","",""]] and len(data.words) == 2
+
+    #"xyz" fits where "abc" was
+    result = EditReplaceWord(data, 0, Word("xyz", Direction.RIGHT))
+    assert result.outcome == EditOutcome.LOCAL and [word.string for word in data.words] == ["xyz", "def"]
+    assert data.solution == LayoutWs(3, data.words) and data.words[0].position in ((0, 0), (0, 2))
+
+    #a failed replacement keeps the old word
+    result = EditReplaceWord(data, 1, Word("defg", Direction.RIGHT))
+    assert result.outcome == EditOutcome.FAILED and [word.string for word in data.words] == ["xyz", "def"]
+
+def test_EditNegativeIndex(fixtureEdit):
+    #-1 is the last word, the same as with a list
+    data = fixtureEdit()
+    result = EditReplaceWord(data, -1, Word("xyz", Direction.RIGHT))
+    assert result.outcome == EditOutcome.LOCAL and result.moved == [1] and [word.string for word in data.words] == ["abc", "xyz"]
+    assert data.solution == LayoutWs(3, data.words)
+
+    EditRemoveWord(data, -1)
+    assert [word.string for word in data.words] == ["abc"] and data.solution == [["a","b","c"], ["","",""], ["","",""]]
+
+    word = Word("x", Direction.RIGHT)
+    for Edit in (lambda: EditRemoveWord(data, 1), lambda: EditRemoveWord(data, -2), lambda: EditReplaceWord(data, 1, word),
+                 lambda: EditAddWord(data, word, -1), lambda: EditAddWord(data, word, 2)):
+        with pytest.raises(IndexError):
+            Edit()
+    assert [word.string for word in data.words] == ["abc"]
@@ -0,0 +1,82 @@
+import pytest
+from copy import deepcopy
+
+from Python.src.grid import Grid, DirectionStrides, RandomChars, EMPTY #tested in this file
+from Python.src.data import Direction
+from Python.src.WsMaker import FillChars, FillCharsText, WsToText
+from Python.src.constants import ALPHABET
+from random import seed
+from collections import Counter
+
+@pytest.fixture
+def fixtureGrid():
+    ws = [["","b","y","e",""],
+          ["","","","n",""],
+          ["","","","e",""],
+          ["","","","m",""],
+          ["r","a","e","y",""]]
+    return ws
+
+def test_DirectionStrides():
+    strides = DirectionStrides(5)
+
+    assert strides[Direction.RIGHT] == 1 and strides[Direction.LEFT] == -1
+    assert strides[Direction.DOWN] == 5 and strides[Direction.UP] == -5
+    assert strides[Direction.RIGHTDOWN] == 6 and strides[Direction.LEFTUP] == -6
+    assert strides[Direction.RIGHTUP] == -4 and strides[Direction.LEFTDOWN] == 4
+
+def test_GridAdapters(fixtureGrid):
+    ws = fixtureGrid
+    grid = Grid.FromWs(ws)
+
+    assert len(grid.cells) == 25
+    assert grid.ToWs() == ws
+    assert grid[(1, 0)] == "b" and grid[(0, 0)] == "" #(x,y), so x is the column
+    assert grid.cells[4 * 5 + 0] == ord("r") and grid.cells[0] == EMPTY
+    assert grid.ToText(".") == ".bye.\n...n.\n...e.\n...m.\nraey."
+
+    copy = grid.Copy()
+    copy[(0, 0)] = "z"
+    assert copy != grid and grid[(0, 0)] == ""
+
+def test_GridPlaceWord(fixtureGrid):
+    ws = fixtureGrid
+    grid = Grid.FromWs(ws)
+    initialWS = deepcopy(ws)
+
+    #"bare" going right-down from (1,0) collides with the "e" of "enemy" at (3,2)
+    assert grid.PlaceWord("bare", Direction.RIGHTDOWN, (1, 0)) is None
+    assert grid.ToWs() == initialWS
+
+    written = grid.PlaceWord("tey", Direction.UP, (2, 2))
+    assert written == [12, 7] #the "y" at (2,0) was already written by "bye"
+    assert grid[(2, 2)] == "t" and grid[(2, 1)] == "e"
+
+    grid.RemoveWord(written)
+    assert grid.ToWs() == initialWS
+
+def test_RandomChars():
+    seed(0)
+    chars = RandomChars("abc", 30000)
+    counts = Counter(chars)
+    assert len(chars) == 30000 and set(counts) == set(b"abc")
+    assert all(9500 < count < 10500 for count in counts.values()) #uniform, even if 256 isn't a multiple of 3
+
+    assert RandomChars("ñ", 3) == "ñññ".encode("latin-1") and RandomChars("ab", 0) == b""
+
+def test_GridFill():
+    ws = [["h", "", ""], ["", "o", ""], ["l", "", "a"]]
+    grid = Grid.FromWs(ws)
+    grid.Fill(ALPHABET)
+    assert all(grid[position] == c for position, c in (((0, 0), "h"), ((1, 1), "o"), ((0, 2), "l"), ((2, 2), "a")))
+    assert all(chr(grid.cells[idx]) in ALPHABET for idx in (1, 2, 3, 5, 7)) #only the empty cells
+
+    #same result as FillChars followed by WsToText (except the random chars)
+    seed(1)
+    big = [["l" if (x + y) % 3 else "" for x in range(60)] for y in range(60)] #l isn't in ALPHABET
+    expected = deepcopy(big)
+    FillChars(expected, ALPHABET)
+    text = FillCharsText(big, ALPHABET)
+    assert text == WsToText(big) and len(text) == 60 * 61 - 1
+    assert all((c == "l") == (e == "l") and c in ALPHABET + "l" for line, lineExp in zip(big, expected) for c, e in zip(line, lineExp))
+
@@ -0,0 +1,91 @@
+import pytest
+from os import utime, stat
+from pathlib import Path
+from random import seed
+
+from Python.src.lexicon import (CompileLexicon, LexiconIndex, IndexIsCurrent, OpenLexicon,
+                                LettersMask32) #tested in this file
+
+#functions needed to run the tests
+from Python.src.WsMaker import ReadLexicon, ValidateWords
+from Python.src.utils import BinarySearch
+from Python.src.data import Direction, Word, WsData
+
+currentDir = Path(__file__).resolve().parent.as_posix()
+"""Absolute path of the parent directory of this file."""
+
+@pytest.fixture
+def fixtureLexicon(tmp_path):
+    source = tmp_path / "lexicon.txt"
+    source.write_text("sol\ncasa\r\nárbol\n\ncasa\nZeta\n", encoding="utf-8")
+    return source.as_posix(), (tmp_path / "lexicon.idx").as_posix()
+
+def test_LexiconIndex(fixtureLexicon):
+    source, indexPath = fixtureLexicon
+    CompileLexicon(source, indexPath)
+    index = LexiconIndex(indexPath)
+
+    #sorted, without duplicates nor empty lines
+    assert len(index) == 4 and list(index) == ["Zeta", "casa", "sol", "árbol"]
+    assert index[-1] == "árbol" and index[1:3] == ["casa", "sol"]
+    assert "árbol" in index and "casa" in index and "cas" not in index and "zeta" not in index and 3 not in index
+    assert BinarySearch(index, "sol") and not BinarySearch(index, "luna")
+    with pytest.raises(IndexError):
+        index[4]
+
+    #words bucketed by length
+    assert [index.Fitting(length) for length in (-1, 2, 3, 4, 5, 20)] == [0, 0, 1, 3, 4, 4]
+    assert index.RandomWord(2) is None and index.RandomWord(3) == "sol"
+    seed(0)
+    assert index.RandomWord(5, LettersMask32("b"), samples=100) == "árbol" #the only one with a b
+    index.Close()
+
+    with pytest.raises(ValueError):
+        LexiconIndex(source) #not an index
+
+def test_OpenLexicon(fixtureLexicon):
+    source, indexPath = fixtureLexicon
+    index = OpenLexicon(source, indexPath)
+    assert "sol" in index and IndexIsCurrent(source, index)
+    index.Close()
+
+    #touched but not changed: the hash decides and the index is reused
+    sourceStat = stat(source)
+    utime(source, ns=(sourceStat.st_atime_ns, sourceStat.st_mtime_ns + 10**9))
+    index = OpenLexicon(source, indexPath)
+    assert IndexIsCurrent(source, index) and len(index) == 4
+    index.Close()
+
+    #changed: compiled again
+    with open(source, "a", encoding="utf-8") as f:
+        f.write("luna\n")
+    utime(source, ns=(sourceStat.st_atime_ns, sourceStat.st_mtime_ns + 2 * 10**9))
+    index = OpenLexicon(source, indexPath)
+    assert "luna" in index and len(index) == 5
+    index.Close()
+
+def test_ValidateWordsIndex(tmp_path, monkeypatch):
+    index = OpenLexicon(f"{currentDir}/files/lexicon.txt", (tmp_path / "lexicon.idx").as_posix())
+    with open(f"{currentDir}/files/lexicon.txt", "r") as f:
+        lexiconWords = ReadLexicon(f)
+    assert all(word.strip() in index for word in lexiconWords[::997])
+
+    #the list can replace a word with one too long for the dimension, the index can't
+    seed(0)
+    data = WsData(3, [Word("hola", Direction.RIGHT), Word("abc", Direction.LEFTDOWN), Word("abcd", Direction.UP)])
+    ValidateWords(index, data, verbose=False)
+
+    assert data.words[0].string == "hola"
+    assert all(word.string in index and len(word.string) <= 3 for word in data.words[1:])
+
+    #the words found are looked up in the encoded index, without decoding any word of the lexicon
+    data = WsData(5, [Word(word.strip(), Direction.RIGHT) for word in lexiconWords[:3]])
+    with monkeypatch.context() as patch:
+        patch.setattr(LexiconIndex, "__getitem__", lambda self, i: pytest.fail("decoded a word"))
+        ValidateWords(index, data, verbose=False)
+    assert [word.string for word in data.words] == [word.strip() for word in lexiconWords[:3]]
+    index.Close()
+
+def test_LettersMask32():
+    assert LettersMask32("abc") == 0b111 and LettersMask32("zz") == 1 << 25
+    assert LettersMask32("ñ") == 1 << (26 + ord("ñ") % 6) and LettersMask32("") == 0
@@ -0,0 +1,69 @@
+import pytest
+from random import seed, Random
+
+from Python.src.nogood import NogoodCache, WsInsertWordsNogood #tested in this file
+
+#functions needed to run the tests
+from Python.src.WsMaker import WordsPositions, WsInsertWordsUndo, PlaceWord, SolveWS
+from Python.src.data import Direction, Word, WsData, SolveStatus
+from Python.src.budget import SearchBudget
+from Python.src.bench import PlantedWsData, DIRECTION_MIXES
+
+@pytest.fixture
+def fixtureDiagonals():
+    #the 2 diagonals need the same cells, and the first 3 words can be anywhere: the same failure is reached from many paths
+    def Data() -> WsData:
+        seed(1)
+        wsData = WsData(6, [Word("ab", Direction.RIGHT), Word("cd", Direction.DOWN), Word("efg", Direction.LEFT),
+                            Word("abcdef", Direction.RIGHTDOWN), Word("ghijkl", Direction.RIGHTDOWN)])
+        WordsPositions(wsData)
+        return wsData
+
+    return Data
+
+def test_NogoodCacheHash():
+    wsData = WsData(4, [Word("abc", Direction.RIGHT), Word("abcd", Direction.DOWN)])
+    WordsPositions(wsData)
+    cache = NogoodCache()
+    cache.Start(wsData)
+    ws = [[""] * 4 for i in range(4)]
+    empty = cache.StateKey(1)
+
+    written = PlaceWord("abc", Direction.RIGHT, (0, 0), ws)
+    cache.Write(written, ws)
+    assert cache.StateKey(1) != empty and cache.StateKey(0) != cache.StateKey(1)
+
+    cache.Erase(written, ws)
+    assert cache.StateKey(1) == empty #XOR is its own inverse
+
+def test_WsInsertWordsNogood(fixtureDiagonals):
+    undoBudget, nogoodBudget = SearchBudget(), SearchBudget()
+    undoData, nogoodData = fixtureDiagonals(), fixtureDiagonals()
+    WsInsertWordsUndo(undoData, undoBudget)
+    WsInsertWordsNogood(nogoodData, nogoodBudget)
+
+    assert undoData.status == nogoodData.status == SolveStatus.NO_SOLUTION
+    assert nogoodBudget.nodes < undoBudget.nodes
+
+    #only failed subtrees are skipped, so the solution is the same as undo
+    rng = Random(0)
+    for dimension in (5, 8):
+        for directions in DIRECTION_MIXES.values():
+            planted = PlantedWsData(dimension, dimension, directions, rng)
+            solutions = []
+            for engine in ("undo", "nogood"):
+                wsData = WsData(dimension, [Word(word.string, word.dir) for word in planted.words])
+                seed(dimension)
+                WordsPositions(wsData)
+                SolveWS(wsData, engine)
+                solutions.append((wsData.solution, [word.position for word in wsData.words]))
+            assert solutions[0] == solutions[1] and solutions[0][0]
+
+def test_NogoodCacheEviction(fixtureDiagonals):
+    #with room for only 4 states the least recently used ones are evicted, and the search is still complete
+    cache = NogoodCache(maxBytes=4 * 128)
+    wsData = fixtureDiagonals()
+    WsInsertWordsUndo(wsData, None, None, cache)
+
+    assert wsData.status == SolveStatus.NO_SOLUTION
+    assert len(cache.entries) == cache.maxEntries == 4 and cache.evictions > 0 and cache.hits > 0
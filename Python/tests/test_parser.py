@@ -0,0 +1,66 @@
+import pytest
+from io import StringIO
+from pathlib import Path
+
+from Python.src.parser import ParseWSData, ParseWordLine, ParseError #tested in this file
+
+#functions needed to run the tests
+from Python.src.WsMaker import RetWSData
+from Python.src.utils import WrongWSDataFormat
+from Python.src.data import Direction, Word, WsData
+
+currentDir = Path(__file__).resolve().parent.as_posix()
+"""Absolute path of the parent directory of this file."""
+
+def test_ParseWordLine():
+    assert ParseWordLine("casa 2") == Word("casa", Direction.DOWN)
+    for line, message in (("casa", "pair"), ("casa 2 1", "pair"), ("ca5a 2", "non alpha"), ("casa 6", "[0..5]"),
+                          ("日本 0", "latin-1")):
+        with pytest.raises(WrongWSDataFormat, match=message):
+            ParseWordLine(line)
+
+def test_ParseWSDataFiles():
+    #the same result as RetWSData for every valid test file, and an error for the wrong ones
+    for file in ("wsTest1.txt", "wsTest2.txt", "wsTest3.txt", "wsTest4.txt", "wsTest5.txt"):
+        errors = []
+        with open(f"{currentDir}/files/{file}", "r") as f:
+            blocks = list(ParseWSData(f, errors))
+        with open(f"{currentDir}/files/{file}", "r") as f:
+            try:
+                expected = [RetWSData(f, verbose=False)]
+            except WrongWSDataFormat as e:
+                expected = []
+                assert len(errors) == 1 and errors[0].message == str(e)
+
+        assert blocks == expected
+
+@pytest.fixture
+def fixtureStream():
+    return StringIO("DIMENSION\n5\nWORDS\ncasa 2\nsol 1\n\n"
+                    "DIMENSION\n4\nWORDS\nluna 0\nmal 9\nsal 1\n"
+                    "DIMENSION\nx\nWORDS\ncasa 0\n"
+                    "  DIMENSION \n3\nWORDS\r\nsol 3\r\n"
+                    "DIMENSION\n6\nWORDS\n")
+
+def test_ParseWSData(fixtureStream, capsys):
+    errors = []
+    stream = ParseWSData(fixtureStream, errors, verbose=True)
+
+    #the first block is yielded before the next ones are read
+    assert next(stream) == WsData(5, [Word("casa", Direction.DOWN), Word("sol", Direction.LEFT)])
+    assert not errors and "Added: sol" in capsys.readouterr().out
+
+    assert list(stream) == [WsData(3, [Word("sol", Direction.UP)])]
+    assert errors == [ParseError(11, 2, "Words contain a wrong direction (must be dir [0..5])"),
+                      ParseError(14, 3, "Dimension isn't numerical"),
+                      ParseError(23, 5, "There wasn't any words in file")]
+    assert str(errors[0]) == "line 11 (block 2): Words contain a wrong direction (must be dir [0..5])"
+
+def test_ParseWSDataEmpty():
+    errors = []
+    assert list(ParseWSData(StringIO("\nWORDS\ncasa 1\n"), errors)) == []
+    assert errors == [ParseError(3, 0, "DIMENSION line wasn't found")]
+
+    errors = []
+    assert list(ParseWSData(StringIO("DIMENSION\n"), errors)) == []
+    assert errors[0].message == "DIMENSION line not followed by dimension number"
@@ -0,0 +1,53 @@
+import pytest
+
+from Python.src.placements import (GetPlacementTable, PlacementCells, PlacementTable, GetCoverage,
+                                   PLACEMENT_CACHE_SIZE, COVERAGE_CACHE_SIZE) #tested in this file
+from Python.src.data import Direction
+
+def _bruteForceStarts(dim, length, direction):
+    #same bounds checks per cell that WordsPositions used to do
+    wDir = direction.value
+    wLen = length - 1
+    return [(x, y) for x in range(dim) for y in range(dim)
+            if 0 <= x + wDir.x * wLen < dim and 0 <= y + wDir.y * wLen < dim]
+
+@pytest.mark.parametrize("dim", [1, 2, 5, 7])
+def test_GetPlacementTable(dim):
+    for direction in Direction:
+        for length in range(1, dim + 2):
+            table = GetPlacementTable(dim, length, direction)
+
+            assert list(table.starts) == _bruteForceStarts(dim, length, direction)
+            for (x, y), cells in zip(table.starts, table.offsets):
+                #each offset is the flat index of the cell (x + i * dir.x, y + i * dir.y)
+                assert list(cells) == [(y + i * direction.value.y) * dim + x + i * direction.value.x for i in range(length)]
+
+def test_GetPlacementTableCache():
+    table = GetPlacementTable(5, 3, Direction.RIGHTUP)
+
+    assert GetPlacementTable(5, 3, Direction.RIGHTUP) is table #same instance shared by every word
+    assert GetPlacementTable(5, 6, Direction.RIGHT) == PlacementTable()
+    assert table.starts[0] == (0, 2) and len(table.starts) == 9
+    assert table.starts[-1] == (2, 4) and list(table.starts) == [table.starts[i] for i in range(9)]
+    with pytest.raises(IndexError):
+        table.starts[9]
+
+    #the caches are bounded, whatever the dimensions requested
+    assert GetPlacementTable.cache_info().maxsize == PLACEMENT_CACHE_SIZE and GetCoverage.cache_info().maxsize == COVERAGE_CACHE_SIZE
+    for dim in range(1, 60):
+        GetCoverage(dim, 1, Direction.RIGHT)
+    assert GetCoverage.cache_info().currsize <= COVERAGE_CACHE_SIZE
+
+def test_PlacementCells():
+    assert list(PlacementCells(5, 4, Direction.LEFTDOWN, (3, 0))) == [3, 7, 11, 15]
+    assert list(PlacementCells(5, 2, Direction.UP, (0, 4))) == [20, 15]
+
+@pytest.mark.parametrize("dim", [1, 2, 5])
+def test_GetCoverage(dim):
+    for direction in Direction:
+        for length in range(1, dim + 2):
+            covered = {cell for cells in GetPlacementTable(dim, length, direction).offsets for cell in cells}
+            assert GetCoverage(dim, length, direction) == bytes(cell in covered for cell in range(dim * dim))
+
+    #a diagonal as long as the dimension only covers one diagonal
+    assert GetCoverage(3, 3, Direction.RIGHTDOWN) == bytes([1, 0, 0, 0, 1, 0, 0, 0, 1])
@@ -0,0 +1,40 @@
+import pytest
+
+from Python.src.portfolio import PortfolioStrategies, WsInsertWordsPortfolio #tested in this file
+
+#classes needed to run the tests
+from Python.src.data import Direction, Word, WsData, SolveStatus
+
+def test_PortfolioStrategies():
+    assert PortfolioStrategies(5, ("undo", "mcv"), 10) == [("undo", 10), ("mcv", 11), ("undo", 12), ("mcv", 13), ("undo", 14)]
+
+def test_WsInsertWordsPortfolio():
+    data1 = WsData(5, [Word("casa", Direction[2]), Word("arbol", Direction[1]), Word("jorge", Direction[4]), Word("hola", Direction[5])])
+    data2 = WsData(4, [Word("have", Direction.RIGHTDOWN), Word("care", Direction.LEFT)])
+    WsInsertWordsPortfolio(data1, workers=3)
+    WsInsertWordsPortfolio(data2, workers=2)
+
+    assert data1.status == SolveStatus.SOLVED
+    for word in data1.words:
+        x, y = word.position
+        assert all(data1.solution[y + i * word.dir.value.y][x + i * word.dir.value.x] == c for i, c in enumerate(word.string))
+    assert data2.status == SolveStatus.NO_SOLUTION and data2.solution is None
+
+def test_WsInsertWordsPortfolioTimeout():
+    #10 different words that fill a whole row each in a 9x9 ws: there's no solution, but every engine needs a long time to prove it
+    data = WsData(9, [Word("abcdefghi"[i:] + "abcdefghi"[:i], Direction.RIGHT) for i in range(9)] + [Word("jjjjjjjjj", Direction.RIGHT)])
+    WsInsertWordsPortfolio(data, workers=2, engines=("undo",), timeout=0.2)
+
+    assert data.status == SolveStatus.BUDGET_EXCEEDED and data.solution is None
+
+def test_WsInsertWordsPortfolioErrors():
+    with pytest.raises(RuntimeError):
+        WsInsertWordsPortfolio(WsData(5, [Word("hola", Direction[0])]), workers=2, engines=("unknown",))
+
+def test_WsInsertWordsPortfolioDeadWorkers(monkeypatch):
+    #workers that die without putting a result (the engine is patched before the fork), instead of waiting forever
+    import os
+    import Python.src.WsMaker
+    monkeypatch.setattr(Python.src.WsMaker, "SolveWS", lambda wsData, engine: os._exit(1))
+    with pytest.raises(RuntimeError, match="exit code 1"):
+        WsInsertWordsPortfolio(WsData(5, [Word("hola", Direction[0])]), workers=2, engines=("undo",))
@@ -0,0 +1,41 @@
+import pytest
+
+from Python.src.restarts import Luby, WsInsertWordsRestarts #tested in this file
+
+#classes needed to run the tests
+from Python.src.data import Direction, Word, WsData, SolveStatus
+from Python.src.budget import SearchBudget
+
+def test_Luby():
+    assert [Luby(i) for i in range(1, 16)] == [1, 1, 2, 1, 1, 2, 4, 1, 1, 2, 1, 1, 2, 4, 8]
+
+def _data():
+    return WsData(5, [Word("casa", Direction[2]), Word("arbol", Direction[1]), Word("jorge", Direction[4]),
+                      Word("hola", Direction[5]), Word("sol", Direction[3])])
+
+def test_WsInsertWordsRestarts():
+    #same seed, same result (the positions generated before are ignored, each run shuffles them again)
+    data1, data2, data3 = _data(), _data(), _data()
+    WsInsertWordsRestarts(data1, seed=7, baseNodes=4)
+    WsInsertWordsRestarts(data2, seed=7, baseNodes=4)
+    WsInsertWordsRestarts(data3, seed=8, baseNodes=4)
+
+    assert data1.status == data2.status == data3.status == SolveStatus.SOLVED
+    assert data1.solution == data2.solution
+    assert [word.position for word in data1.words] == [word.position for word in data2.words]
+    assert all(word.position for word in data3.words)
+
+    #a run long enough eventually proves there's no solution
+    data4 = WsData(4, [Word("have", Direction.RIGHTDOWN), Word("care", Direction.LEFT)])
+    WsInsertWordsRestarts(data4, baseNodes=1)
+    assert data4.status == SolveStatus.NO_SOLUTION and data4.solution is None
+
+def test_WsInsertWordsRestartsBudget():
+    #with a total budget too small, we get the deepest partial insertion of all the runs
+    data = _data()
+    budget = SearchBudget(maxNodes=3)
+    WsInsertWordsRestarts(data, budget, seed=1, baseNodes=1)
+
+    assert data.status == SolveStatus.BUDGET_EXCEEDED and budget.exhausted and budget.nodes >= 3
+    placed = [word for word in data.words if word.position]
+    assert placed and sum(c != "" for line in data.partial for c in line) >= max(len(word.string) for word in placed)
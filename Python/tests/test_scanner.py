@@ -0,0 +1,93 @@
+import pytest
+from random import Random
+
+from Python.src.scanner import (GridScanner, GetScanOrder, FlatCells, Hit, VerifyWs, VerifyWsData,
+                                Main) #tested in this file
+
+#functions needed to run the tests
+from Python.src.data import Direction, Word, WsData
+from Python.src.edit import LayoutWs
+from Python.src.wire import WireWriter
+
+def NaiveScan(ws: list[list[str]], words: list[str]) -> set[Hit]:
+    """Every occurrence of the words, checking each word from each cell in each direction."""
+
+    dim = len(ws)
+    hits = set()
+    for word in words:
+        for y in range(dim):
+            for x in range(dim):
+                for direction in Direction:
+                    dx, dy = direction.value
+                    if all(0 <= x + i*dx < dim and 0 <= y + i*dy < dim and ws[y + i*dy][x + i*dx] == c for i, c in enumerate(word)):
+                        hits.add(Hit(word, (x, y), direction))
+    return hits
+
+@pytest.fixture
+def fixtureVerify():
+    #"sol" in the first row and "oso" (a palindrome) down the second column, the rest filled with "x"
+    words = [Word("sol", Direction.RIGHT, position=(0, 0)), Word("oso", Direction.DOWN, position=(1, 0))]
+    ws = LayoutWs(4, words)
+    for line in ws:
+        line[:] = [c or "x" for c in line]
+    return WsData(4, words, solution=ws)
+
+def test_GetScanOrder():
+    #every direction scans every cell once, with a separator after each line
+    order = GetScanOrder(3)
+    assert len(order.starts) == 8 and order.starts[0] == 0
+    for start, end in zip(order.starts, order.starts[1:] + (len(order.cells),)):
+        assert sorted(cell for cell in order.cells[start:end] if cell < 9) == list(range(9))
+    assert order.cells[:4] == (0, 1, 2, 9) and order.cells[order.starts[2]:order.starts[2] + 4] == (0, 3, 6, 9)
+    assert FlatCells([["a", ""], ["b", "c"]]) == ("a\nbc\n", 2) and FlatCells("ab\ncd\n") == ("abcd\n", 2)
+    with pytest.raises(ValueError):
+        FlatCells("abc\nd")
+
+def test_GridScanner():
+    #the classic example: overlapping words and words inside others
+    scanner = GridScanner(["he", "she", "his", "hers", "he"])
+    assert scanner.words == ["he", "she", "his", "hers"]
+    assert sorted((end, scanner.words[idx]) for end, idx in scanner.ScanText("ushers")) == [(3, "he"), (3, "she"), (5, "hers")]
+
+    #the same hits as checking every word from every cell, in random word searches (also the second time, with the lazy transitions)
+    rng = Random(0)
+    for dim in (1, 4, 7):
+        ws = [[rng.choice("abc") for x in range(dim)] for y in range(dim)]
+        words = ["".join(rng.choice("abc") for i in range(rng.randint(1, 4))) for k in range(10)]
+        scanner = GridScanner(words)
+        assert set(scanner.Scan(ws)) == NaiveScan(ws, words) and len(scanner.Scan(ws)) == len(NaiveScan(ws, words))
+        assert set(scanner.Scan("\n".join("".join(line) for line in ws))) == NaiveScan(ws, words)
+
+    with pytest.raises(ValueError):
+        GridScanner(["a\nb"])
+
+def test_VerifyWs(fixtureVerify):
+    wsData = fixtureVerify
+    report = VerifyWsData(wsData)
+    assert report.ok and report.counts == {"sol": 1, "oso": 1} #the palindrome is found twice but counted once
+    assert len(report.hits) == 3
+
+    #the filler wrote "sol" again (backwards, so "los" is there twice too), and "lol" isn't there
+    wsData.solution[3][0:3] = ["l", "o", "s"]
+    report = VerifyWs(wsData.solution, ["sol", "oso", "los"])
+    assert not report.ok and report.repeated == ["sol", "los"] and report.missing == []
+    report = VerifyWs(wsData.solution, ["sol", "lol"], GridScanner(["sol", "lol", "oso"]))
+    assert report.missing == ["lol"] and report.counts["sol"] == 2
+
+    #found once, but not where it was placed
+    wsData.solution[0][0] = wsData.solution[0][2] = "x"
+    report = VerifyWsData(wsData)
+    assert report.counts["sol"] == 1 and report.misplaced == ["sol"] and not report.ok
+
+def test_Main(fixtureVerify, tmp_path, capsys):
+    wsData = fixtureVerify
+    path = (tmp_path / "puzzles.wsw").as_posix()
+    with open(path, "wb") as f, WireWriter(f) as writer:
+        writer.Write(wsData)
+    assert Main([path]) == 0
+
+    wsData.solution[3][0:3] = ["o", "s", "o"]
+    with open(path, "wb") as f, WireWriter(f) as writer:
+        writer.Write(wsData)
+    assert Main([path]) == 1
+    assert "repeated ['oso']" in capsys.readouterr().out
@@ -0,0 +1,157 @@
+import asyncio
+import json
+import pytest
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from Python.src.service import (GenerationService, RequestToWsData, HttpResponse, ServiceError,
+                                WarmWorker) #tested in this file
+
+#functions needed to run the tests
+from Python.src.data import Direction
+
+currentDir = Path(__file__).resolve().parent.as_posix()
+"""Absolute path of the parent directory of this file."""
+
+REQUEST = {"dimension": 5, "words": [{"word": "casa", "dir": 2}, {"word": "arbol", "dir": 1}, {"word": "jorge", "dir": 4},
+                                     {"word": "hola", "dir": 5}]}
+"""Same words as wsTest1.txt."""
+
+async def Request(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, method: str, path: str, body: dict=None) -> tuple[int, dict]:
+    """Sends a request through an open connection and returns the status and JSON body of the response."""
+
+    payload = json.dumps(body).encode("utf-8") if body is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(payload)}\r\n\r\n".encode("latin-1") + payload)
+    await writer.drain()
+
+    status = int((await reader.readline()).split()[1])
+    headers = {}
+    while (line := (await reader.readline()).decode("latin-1").strip()):
+        name, _, value = line.partition(":")
+        headers[name.lower()] = value.strip()
+    return status, json.loads(await reader.readexactly(int(headers["content-length"])))
+
+@pytest.fixture
+def fixtureService(tmp_path):
+    def Service(**kwargs) -> GenerationService:
+        return GenerationService(f"{currentDir}/files/lexicon.txt", (tmp_path / "lexicon.idx").as_posix(), workers=1, **kwargs)
+    return Service
+
+def test_RequestToWsData():
+    wsData = RequestToWsData(REQUEST)
+    assert wsData.dimension == 5 and [(word.string, word.dir) for word in wsData.words] == [
+        ("casa", Direction.DOWN), ("arbol", Direction.LEFT), ("jorge", Direction.RIGHTDOWN), ("hola", Direction.RIGHTUP)]
+
+    for request in ([], {"words": REQUEST["words"]}, {"dimension": True, "words": REQUEST["words"]}, {"dimension": 5, "words": []},
+                    {"dimension": 5, "words": [{"word": "hello"}]}, {"dimension": 5, "words": [{"word": "h3llo", "dir": 0}]},
+                    {"dimension": 5, "words": [{"word": "hello", "dir": 7}]}, {"dimension": 5, "words": [{"word": "日本", "dir": 0}]}):
+        with pytest.raises(ServiceError) as e:
+            RequestToWsData(request)
+        assert e.value.status == 400
+
+    assert HttpResponse(404, {}, False).startswith(b"HTTP/1.1 404 Not Found\r\n")
+    assert WarmWorker(3) == 6 * (1 + 2 + 3)
+
+def test_GenerationService(fixtureService):
+    async def Run():
+        service = fixtureService()
+        await service.Start(port=0)
+        try:
+            reader, writer = await asyncio.open_connection(*service.address)
+            #the same connection serves every request (keep-alive)
+            status, body = await Request(reader, writer, "POST", "/generate", REQUEST)
+            assert status == 200 and body["status"] == "solved" and len(body["text"].split("\n")) == 5
+            grid = body["text"].split("\n")
+            for word in body["words"]:
+                dx, dy = Direction[word["dir"]].value
+                assert "".join(grid[word["y"] + i*dy][word["x"] + i*dx] for i in range(len(word["word"]))) == word["word"]
+
+            assert (await Request(reader, writer, "POST", "/generate", dict(REQUEST, seed=3)))[0] == 200
+            assert (await Request(reader, writer, "POST", "/generate", {"dimension": 3, "words": [{"word": "casa", "dir": 0}]}))[0] == 422
+            assert (await Request(reader, writer, "POST", "/generate", dict(REQUEST, engine="portfolio")))[0] == 400
+            assert (await Request(reader, writer, "POST", "/generate", dict(REQUEST, engine="dp")))[0] == 400 #no budget
+            assert (await Request(reader, writer, "GET", "/generate"))[0] == 405
+            assert (await Request(reader, writer, "GET", "/unknown"))[0] == 404
+
+            #the deadline is reached before any worker can answer
+            status, body = await Request(reader, writer, "POST", "/generate", dict(REQUEST, timeout=1e-9))
+            assert status == 504
+
+            status, stats = await Request(reader, writer, "GET", "/stats")
+            assert status == 200 and stats["requests"] == 6 and stats["solved"] == 2 and stats["failed"] == 1
+            assert stats["badRequests"] == 2 and stats["timeouts"] == 1 and stats["errors"] == 0
+            assert 0 < stats["p50Ms"] <= stats["p90Ms"] <= stats["p99Ms"]
+            writer.close()
+
+            #the slot of the request answered 504 is only released when its worker finishes
+            for _ in range(100):
+                if not service.inFlight:
+                    break
+                await asyncio.sleep(0.05)
+            assert service.inFlight == 0
+        finally:
+            await service.Close()
+
+    asyncio.run(Run())
+
+def test_GenerationServiceBackpressure(fixtureService, tmp_path):
+    async def Run():
+        #no request can be dispatched, so every one is answered 503 at once (served through a Unix socket)
+        service = fixtureService(maxPending=0)
+        await service.Start(unixPath=(tmp_path / "service.sock").as_posix())
+        try:
+            reader, writer = await asyncio.open_unix_connection(service.address)
+            assert (await Request(reader, writer, "POST", "/generate", REQUEST))[0] == 503
+            assert service.stats.busy == 1
+            writer.close()
+        finally:
+            await service.Close()
+
+    asyncio.run(Run())
+
+def test_GenerationServiceSlots(fixtureService, monkeypatch):
+    async def Run():
+        #a job that keeps running after its request is answered 504 keeps its slot, so the next request gets 503
+        release = threading.Event()
+        monkeypatch.setattr("Python.src.service.GeneratePuzzle", lambda *args: release.wait())
+        service = fixtureService(maxPending=1)
+        service._executor = ThreadPoolExecutor(1)
+        try:
+            for expected in (504, 503):
+                with pytest.raises(ServiceError) as e:
+                    await service.Generate(dict(REQUEST, timeout=0.01))
+                assert e.value.status == expected and service.inFlight == 1
+            release.set()
+            for _ in range(100):
+                if not service.inFlight:
+                    break
+                await asyncio.sleep(0.01)
+            assert service.inFlight == 0
+        finally:
+            release.set()
+            service._executor.shutdown()
+
+    asyncio.run(Run())
+
+def test_GenerationServiceErrors(fixtureService, monkeypatch):
+    async def Run():
+        #an exception of the worker is answered 500 (not mistaken for a wrong Content-Length) and the connection goes on
+        def Fail(*args):
+            raise ValueError("broken worker")
+        monkeypatch.setattr("Python.src.service.GeneratePuzzle", Fail)
+        service = fixtureService()
+        service._executor = ThreadPoolExecutor(1)
+        server = await asyncio.start_server(service.HandleConnection, "127.0.0.1", 0)
+        try:
+            reader, writer = await asyncio.open_connection(*server.sockets[0].getsockname()[:2])
+            status, body = await Request(reader, writer, "POST", "/generate", REQUEST)
+            assert status == 500 and "broken worker" in body["error"]
+            status, stats = await Request(reader, writer, "GET", "/stats")
+            assert status == 200 and stats["errors"] == 1 and stats["inFlight"] == 0
+            writer.close()
+        finally:
+            server.close()
+            service._executor.shutdown()
+
+    asyncio.run(Run())
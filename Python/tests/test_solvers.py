@@ -0,0 +1,74 @@
+import pytest
+from random import seed
+
+from Python.src.solvers import (WordsOrderMCV, WsInsertWordsMCV, PlacementMasks,
+                                WsInsertWordsBitset) #tested in this file
+
+#functions needed to run the tests
+from Python.src.WsMaker import WordsPositions, WsInsertWordsUndo
+from Python.src.data import Direction, Word, WsData
+
+def _wordsInSolution(data: WsData) -> bool:
+    #reads each word from the solution, starting at Word.position and following its direction
+    for word in data.words:
+        x, y = word.position
+        for i, c in enumerate(word.string):
+            if data.solution[y + i * word.dir.value.y][x + i * word.dir.value.x] != c:
+                return False
+    return True
+
+@pytest.fixture
+def fixtureWsInsertWordsMCV():
+    seed(0)
+
+    data1 = WsData(5, [Word("hello", Direction.RIGHT), Word("ready", Direction.DOWN), Word("have", Direction.RIGHTDOWN)])
+    #dense case: every cell is used, and the only solution is each of the first 4 words in a whole row (in this order)
+    data2 = WsData(4, [Word("abcd", Direction.RIGHT), Word("efgh", Direction.LEFT),
+                       Word("ijkl", Direction.RIGHT), Word("mnop", Direction.LEFT),
+                       Word("ahip", Direction.DOWN)])
+    data3 = WsData(4, [Word("have", Direction.RIGHTDOWN), Word("care", Direction.LEFT)])
+    for data in (data1, data2, data3):
+        WordsPositions(data)
+
+    return (data1, data2, data3)
+
+def test_WordsOrderMCV(fixtureWsInsertWordsMCV):
+    data1, data2, data3 = fixtureWsInsertWordsMCV
+
+    assert WordsOrderMCV(data1) == [0, 1, 2] #"hello" and "ready" have 5 positions, "have" is shorter
+    assert WordsOrderMCV(data3) == [0, 1] #same length, "have" (diagonal) has 1 position and "care" 4
+
+def test_WsInsertWordsMCV(fixtureWsInsertWordsMCV):
+    data1, data2, data3 = fixtureWsInsertWordsMCV
+    WsInsertWordsMCV(data1)
+    WsInsertWordsMCV(data2)
+    WsInsertWordsMCV(data3)
+
+    assert data1.solution and _wordsInSolution(data1)
+    assert data2.solution == [["a","b","c","d"], ["h","g","f","e"], ["i","j","k","l"], ["p","o","n","m"]]
+    assert _wordsInSolution(data2) and data2.words[4].position == (0, 0)
+    assert data3.solution is None
+
+def test_PlacementMasks():
+    #"abca" going down from (1,0) in a 4x4 ws covers the cells 1, 5, 9 and 13
+    mask, needs = PlacementMasks(range(1, 17, 4), b"abca")
+
+    assert mask == (1 << 1) | (1 << 5) | (1 << 9) | (1 << 13)
+    assert needs == ((ord("a"), (1 << 1) | (1 << 13)), (ord("b"), 1 << 5), (ord("c"), 1 << 9))
+
+def test_WsInsertWordsBitset():
+    #the bitset engine must find the exact same solution as the undo engine, as they follow the same order
+    for dim, words in ((6, [("maria", 1), ("cohete", 2), ("tela", 0), ("fibron", 3), ("monitor", 0)]),
+                       (5, [("casa", 2), ("arbol", 1), ("jorge", 4), ("hola", 0)]),
+                       (4, [("abcd", 0), ("efgh", 1), ("ijkl", 0), ("mnop", 1), ("ahip", 2)])):
+        seed(1)
+        data = WsData(dim, [Word(string, Direction[d]) for string, d in words])
+        WordsPositions(data)
+        expected = WsData(dim, [Word(string, Direction[d], list(word.positions), word.positionsIndex)
+                                for (string, d), word in zip(words, data.words)])
+
+        WsInsertWordsBitset(data)
+        WsInsertWordsUndo(expected)
+
+        assert data.solution == expected.solution
+        assert [word.position for word in data.words] == [word.position for word in expected.words]
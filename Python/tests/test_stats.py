@@ -0,0 +1,86 @@
+import json
+import pytest
+
+from Python.src.stats import SolverStats, SolverEvent #tested in this file
+
+#functions needed to run the tests
+from Python.src.WsMaker import WordsPositions, WsInsertWordsUndo, SolveWS
+from Python.src.data import Direction, Word, WsData, SolveStatus
+from Python.src.budget import SearchBudget
+
+@pytest.fixture
+def fixtureSolverStats(monkeypatch):
+    monkeypatch.setattr("Python.src.WsMaker.shuffle", lambda x: x)
+
+    def Data() -> tuple[WsData, WsData]:
+        data1 = WsData(5, [Word("hello", Direction.RIGHT), Word("ready", Direction.DOWN), Word("have", Direction.RIGHTDOWN)])
+        data2 = WsData(4, [Word("have", Direction.RIGHTDOWN), Word("care", Direction.LEFT)])
+        WordsPositions(data1)
+        WordsPositions(data2)
+        return data1, data2
+
+    return Data
+
+def test_SolverStats(fixtureSolverStats):
+    #"have" only has 1 position, and "care" fails in its 4 positions, so it backtracks once from depth 1
+    data1, data2 = fixtureSolverStats()
+    events = []
+    stats = SolverStats(hook=lambda event, depth, word: events.append((event, depth, word.string if word else None)))
+    SolveWS(data2, "undo", stats=stats)
+
+    assert stats.placementsTried == 5 and stats.placementsAccepted == 1
+    assert stats.backtracks == [0, 1] and stats.totalBacktracks == 1 and stats.maxBacktrackDepth == 1
+    assert stats.positionsIndex == [(1, 0), (0, 3)] and stats.status == SolveStatus.NO_SOLUTION.value
+    assert events[0] == (SolverEvent.PLACED, 0, "have") and events[1] == (SolverEvent.REJECTED, 1, "care")
+    assert events[-2:] == [(SolverEvent.BACKTRACK, 1, "care"), (SolverEvent.FINISHED, -1, None)]
+    assert stats.copySeconds == stats.checkSeconds == 0 #not timing
+
+def test_SolverStatsEngines(fixtureSolverStats):
+    #dp and undo follow the same search order, so they must count the same
+    results = {}
+    for engine in ("dp", "undo"):
+        data1, data2 = fixtureSolverStats()
+        stats = SolverStats(timing=True)
+        SolveWS(data1, engine, stats=stats)
+        results[engine] = stats.ToDict()
+
+        assert stats.status == SolveStatus.SOLVED.value and stats.placementsAccepted >= len(data1.words)
+        assert stats.positionsIndex == [word.positionsIndex for word in data1.words]
+        assert stats.checkSeconds > 0 and (stats.copySeconds > 0) == (engine == "dp")
+
+    for key in ("placementsTried", "placementsAccepted", "backtracks", "positionsIndex", "status"):
+        assert results["dp"][key] == results["undo"][key]
+    json.dumps(results)
+
+    #bitset too, mcv and dlx with another order
+    for engine in ("bitset", "mcv", "dlx"):
+        data1, data2 = fixtureSolverStats()
+        stats = SolverStats()
+        SolveWS(data2, engine, stats=stats)
+        assert stats.status == SolveStatus.NO_SOLUTION.value and stats.placementsTried > 0
+        if engine == "bitset":
+            assert stats.placementsTried == 5 and stats.backtracks == [0, 1]
+
+    with pytest.raises(ValueError):
+        SolveWS(WsData(5, []), "restarts", stats=SolverStats())
+
+def test_SolverStatsBudget(fixtureSolverStats):
+    #with a budget the nodes are the attempts, and undo copies the deepest partial insertion
+    data1, data2 = fixtureSolverStats()
+    stats = SolverStats(timing=True)
+    budget = SearchBudget(maxNodes=2)
+    WsInsertWordsUndo(data1, budget, stats)
+
+    assert stats.placementsTried == 2 and stats.status == SolveStatus.BUDGET_EXCEEDED.value
+    assert stats.copySeconds > 0
+
+def test_SolverStatsMerge():
+    total = SolverStats()
+    for tried, backtracks in ((3, [1, 0]), (4, [0, 2, 1])):
+        stats = SolverStats()
+        stats.placementsTried = tried
+        stats.backtracks = backtracks
+        total.Merge(stats)
+
+    assert total.placementsTried == 7 and total.backtracks == [1, 2, 1] and total.maxBacktrackDepth == 2
+    assert SolverStats().maxBacktrackDepth == -1
@@ -0,0 +1,68 @@
+import pytest
+from pathlib import Path
+from random import seed
+
+from Python.src.trie import Trie, WriteVarint, ReadVarint #tested in this file
+
+#functions needed to run the tests
+from Python.src.WsMaker import ReadLexicon, WordsValidation
+from Python.src.data import Direction, Word, WsData
+
+currentDir = Path(__file__).resolve().parent.as_posix()
+"""Absolute path of the parent directory of this file."""
+
+@pytest.fixture
+def fixtureTrie():
+    return Trie(["sol", "casa", "cas", "árbol", "casa", "Zeta", "casas"])
+
+def test_Trie(fixtureTrie):
+    trie = fixtureTrie
+
+    #duplicates are counted once, indexing and iteration are sorted
+    assert len(trie) == 6 and list(trie) == ["Zeta", "cas", "casa", "casas", "sol", "árbol"]
+    assert trie[0] == "Zeta" and trie[-1] == "árbol" and trie[3] == "casas"
+    with pytest.raises(IndexError):
+        trie[6]
+
+    assert "casa" in trie and "ca" not in trie and "casass" not in trie and 1 not in trie
+    assert trie.HasPrefix("ca") and trie.HasPrefix("") and not trie.HasPrefix("x")
+    assert list(trie.WithPrefix("cas")) == ["cas", "casa", "casas"] and list(trie.WithPrefix("x")) == []
+
+    trie.Add("abeto")
+    assert trie[1] == "abeto" and len(trie) == 7
+
+def test_BulkContains(fixtureTrie):
+    words = ["casas", "ca", "sol", "casa", "", "luna", "cas", "casa", "árbol", "casax"]
+    assert fixtureTrie.BulkContains(words) == [word in fixtureTrie for word in words]
+
+def test_Serialize(fixtureTrie, tmp_path):
+    for value in (0, 127, 128, 300, 0x10FFFF):
+        out = bytearray()
+        WriteVarint(value, out)
+        assert ReadVarint(bytes(out) + b"\x00", 0) == (value, len(out))
+
+    fixtureTrie.Save((tmp_path / "lexicon.trie").as_posix())
+    trie = Trie.Load((tmp_path / "lexicon.trie").as_posix())
+    assert list(trie) == list(fixtureTrie) and "casas" in trie and "casa" in trie
+
+    data = fixtureTrie.Serialize()
+    with pytest.raises(ValueError):
+        Trie.Deserialize(data[:-3])
+    with pytest.raises(ValueError):
+        Trie.Deserialize(b"WSLX" + data[4:])
+
+def test_WordsValidationTrie():
+    with open(f"{currentDir}/files/lexicon.txt", "r") as f:
+        lexiconWords = ReadLexicon(f)
+    with open(f"{currentDir}/files/lexicon.txt", "r") as f:
+        trie = Trie.FromFile(f)
+    assert len(trie) == len(set(lexiconWords))
+
+    #the lexicon isn't sorted, so the binary search misses words that are in it
+    data = WsData(10, [Word("Abraham", Direction[0]), Word("hola", Direction[0]), Word("abc", Direction[0])])
+    seed(0)
+    with open(f"{currentDir}/files/lexicon.txt", "r") as f:
+        WordsValidation(f, data, verbose=False, trie=True)
+
+    assert data.words[0].string == "Abraham" and data.words[1].string == "hola"
+    assert data.words[2].string != "abc" and data.words[2].string in trie
@@ -0,0 +1,68 @@
+import pytest
+from itertools import product
+
+from Python.src.variants import WsSolutions, GridKey, HammingDistance #tested in this file
+
+#functions needed to run the tests
+from Python.src.WsMaker import WordsPositions, WsInsertWordsUndo
+from Python.src.edit import LayoutWs
+from Python.src.data import Direction, Word, WsData, SolveStatus
+from Python.src.budget import SearchBudget
+
+@pytest.fixture
+def fixtureWsSolutions(monkeypatch):
+    monkeypatch.setattr("Python.src.WsMaker.shuffle", lambda x: x)
+
+    def Data() -> WsData:
+        data = WsData(4, [Word("have", Direction.RIGHTDOWN), Word("hey", Direction.DOWN), Word("ya", Direction.RIGHT)])
+        WordsPositions(data)
+        return data
+
+    def AllSolutions(data: WsData) -> set[int]:
+        #brute force: the GridKey of the layout of every combination of positions
+        keys = set()
+        for positions in product(*[word.positions for word in data.words]):
+            words = [Word(word.string, word.dir, position=position) for word, position in zip(data.words, positions)]
+            try:
+                keys.add(GridKey(LayoutWs(data.dimension, words)))
+            except ValueError:
+                pass
+        return keys
+
+    return Data, AllSolutions
+
+def test_GridKey():
+    ws1 = [["a", ""], ["", "b"]]
+    ws2 = [["a", "c"], ["", "d"]]
+    assert GridKey(ws1) != GridKey(ws2) and GridKey(ws1) == GridKey([line[:] for line in ws1])
+    assert HammingDistance(GridKey(ws1), GridKey(ws2), 4) == 2 and HammingDistance(GridKey(ws1), GridKey(ws1), 4) == 0
+
+def test_WsSolutions(fixtureWsSolutions):
+    Data, AllSolutions = fixtureWsSolutions
+    first = Data()
+    WsInsertWordsUndo(first)
+
+    #every different word search, the first one the same as undo's
+    solutions = list(WsSolutions(Data()))
+    keys = [GridKey(solution.solution) for solution in solutions]
+    assert solutions[0].solution == first.solution and len(set(keys)) == len(keys)
+    assert set(keys) == AllSolutions(Data()) and len(keys) > 10
+    for solution in solutions:
+        assert solution.status == SolveStatus.SOLVED and LayoutWs(4, solution.words) == solution.solution
+
+    #resumed after each one, so the first k are the same
+    assert [solution.solution for solution in WsSolutions(Data(), limit=5)] == [solution.solution for solution in solutions[:5]]
+    assert list(WsSolutions(Data(), limit=0)) == []
+
+def test_WsSolutionsDistance(fixtureWsSolutions):
+    #with a minimum distance, every solution not yielded is too close to one that was (nothing is skipped wrongly)
+    Data, AllSolutions = fixtureWsSolutions
+    allKeys = AllSolutions(Data())
+    for minDistance in (3, 6, 9):
+        keys = [GridKey(solution.solution) for solution in WsSolutions(Data(), minDistance=minDistance)]
+        assert all(HammingDistance(key1, key2, 16) >= minDistance for n, key1 in enumerate(keys) for key2 in keys[:n])
+        assert all(any(HammingDistance(key, other, 16) < minDistance for other in keys) for key in allKeys)
+
+    #the budget stops the search
+    budget = SearchBudget(maxNodes=3)
+    assert len(list(WsSolutions(Data(), budget=budget))) <= 1 and budget.exhausted
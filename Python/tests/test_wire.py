@@ -0,0 +1,53 @@
+import pytest
+from pathlib import Path
+
+from Python.src.wire import (EncodeWsData, DecodeWsData, WireWriter, WireReader,
+                             FILE_HEADER, RECORD_HEADER, WORD_HEADER, FOOTER) #tested in this file
+
+#functions needed to run the tests
+from Python.src.data import Direction, Word, WsData
+
+@pytest.fixture
+def fixtureWsData():
+    solved = WsData(4, [Word("sol", Direction.RIGHT), Word("año", Direction.LEFTUP)])
+    solved.words[0].position = (0, 0)
+    solved.words[1].position = None
+    solved.solution = [["s", "o", "l", ""], ["", "", "", ""], ["", "", "", ""], ["", "", "", "ñ"]]
+    return [WsData(5, [Word("casa", Direction.DOWN), Word("hola", Direction.RIGHTUP)]), solved]
+
+def test_EncodeWsData(fixtureWsData):
+    data, solved = fixtureWsData
+    record = EncodeWsData(data)
+    assert len(record) == RECORD_HEADER.size + 2 * WORD_HEADER.size + 8
+
+    decoded, end = DecodeWsData(b"xx" + record + b"yy", 2)
+    assert decoded == data and end == 2 + len(record)
+
+    #latin-1 chars, positions and the grid
+    decoded, end = DecodeWsData(EncodeWsData(solved))
+    assert decoded == solved and decoded.words[0].position == (0, 0) and decoded.words[1].position is None
+
+    with pytest.raises(ValueError):
+        DecodeWsData(bytes([record[0] + 1]) + record[1:] + b"\0") #the record size doesn't match its content
+
+def test_WireReader(fixtureWsData, tmp_path):
+    path = (tmp_path / "puzzles.wsw").as_posix()
+    with open(path, "wb") as f, WireWriter(f) as writer:
+        for i in range(100):
+            writer.Write(fixtureWsData[i % 2])
+
+    with WireReader(path) as reader:
+        assert len(reader) == 100
+        assert reader[0] == fixtureWsData[0] and reader[99] == fixtureWsData[1] and reader[-2] == fixtureWsData[0]
+        assert list(reader)[:2] == fixtureWsData
+        with pytest.raises(IndexError):
+            reader[100]
+
+    size = Path(path).stat().st_size
+    assert size == FILE_HEADER.size + 50 * (len(EncodeWsData(fixtureWsData[0])) + len(EncodeWsData(fixtureWsData[1]))) + 100 * 8 + FOOTER.size
+
+    #a file that wasn't closed has no footer
+    with open(path, "wb") as f:
+        WireWriter(f).Write(fixtureWsData[0])
+    with pytest.raises(ValueError):
+        WireReader(path)